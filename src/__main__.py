@@ -176,10 +176,19 @@ def setup_global_error_handling():
     
     sys.excepthook = exception_hook
 
+def setup_logging():
+    """Configure logging - debug output only when run with --debug / -v"""
+    verbose = '--debug' in sys.argv or '-v' in sys.argv
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s"
+    )
+
 def main():
     """Main application entry point"""
     try:
-        # Setup error handling
+        # Setup logging and error handling
+        setup_logging()
         setup_global_error_handling()
         
         # IMPORTANT: Set Windows properties BEFORE creating QApplication
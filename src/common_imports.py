@@ -17,11 +17,13 @@ import io
 import time
 import threading
 import queue
+import tempfile
 import zipfile
+import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Callable, Union
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, is_dataclass
 import fnmatch
 from datetime import datetime, timedelta
 
@@ -55,6 +57,12 @@ except ImportError:
     Image = None
     print("Warning: PIL/Pillow not installed")
 
+# Optional: faster JSON (falls back to the standard json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ========== 4. UTILITY FUNCTIONS ==========
 def get_timestamp():
     return datetime.now().isoformat()
@@ -66,6 +74,54 @@ def safe_json_load(file_path: str) -> Optional[Dict]:
     except (FileNotFoundError, json.JSONDecodeError):
         return None
 
+def load_json_file(file_path) -> Any:
+    """Read a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _json_default(obj: Any) -> Any:
+    """Fallback for values the JSON encoder can't handle natively (dataclasses, paths)"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return obj.to_dict() if hasattr(obj, 'to_dict') else asdict(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dump_json_bytes(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed.
+    
+    Dataclasses can be passed directly - orjson walks them natively in C."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, default=_json_default, indent=2, ensure_ascii=False).encode('utf-8')
+    # Match orjson's compact output (no spaces after separators)
+    return json.dumps(data, default=_json_default, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def write_file_atomic(payload: bytes, file_path) -> None:
+    """Write bytes in one write to a temp file, then atomically swap it into place.
+    
+    Each call gets its own temp file, so concurrent writes never truncate each other's."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)),
+                                    prefix=f"{os.path.basename(file_path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def dump_json_file(data: Any, file_path, indent: bool = False) -> None:
+    """Write data as JSON in one write to a temp file, then atomically swap it into place"""
+    write_file_atomic(dump_json_bytes(data, indent), file_path)
+
 def safe_json_save(data: Dict, file_path: str) -> bool:
     try:
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
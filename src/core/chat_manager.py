@@ -8,9 +8,33 @@ class ChatTree:
     def __init__(self):
         self.messages: Dict[str, ChatMessage] = {}  # id -> message
         self.roots: List[str] = []  # Root message IDs (user messages)
+        self._latest_user: Optional[Tuple[int, Optional[ChatMessage]]] = None  # (message count, newest user message)
+    
+    def latest_user_message(self) -> Optional[ChatMessage]:
+        """Newest user message by timestamp - rescanned only after deletes or direct loads"""
+        if self._latest_user is None or self._latest_user[0] != len(self.messages):
+            latest = max(
+                (msg for msg in self.messages.values() if msg.role == "user"),
+                key=lambda msg: msg.timestamp,
+                default=None
+            )
+            self._latest_user = (len(self.messages), latest)
+        return self._latest_user[1]
+    
+    def clear(self):
+        """Remove every message and root, dropping the latest-user memo with them"""
+        self.messages.clear()
+        self.roots.clear()
+        self._latest_user = None
     
     def add_message(self, message: ChatMessage) -> str:
         """Add a message to the tree - UPDATED to handle retry scenarios"""
+        # Keep the latest-user memo current instead of forcing a rescan
+        if self._latest_user is not None and self._latest_user[0] == len(self.messages):
+            latest = self._latest_user[1]
+            if message.role == "user" and (latest is None or message.timestamp >= latest.timestamp):
+                latest = message
+            self._latest_user = (len(self.messages) + 1, latest)
         self.messages[message.id] = message
         
         if message.role == "user":
@@ -118,6 +142,7 @@ class ChatTree:
         
         # Delete the message itself
         del self.messages[message_id]
+        self._latest_user = None
         print(f"🗑️ Removed message: {message.content[:30]}...")
 
 
@@ -287,6 +312,7 @@ class ChatTree:
         
         # Then delete this message
         del self.messages[message_id]
+        self._latest_user = None
         print(f"Deleted message: {message_id}")
 
 
@@ -306,6 +332,7 @@ class ChatTree:
                 self._delete_branch(child_id)
             # Delete this message
             del self.messages[message_id]
+            self._latest_user = None
     
     def get_siblings(self, message_id: str) -> List[str]:
         """Get all sibling message IDs"""
@@ -41,6 +41,9 @@ class APIConfig:
     conversation_style: str = "natural"
 
 
+DEFAULT_MAX_RESPONSE_BYTES = 64 * 1024  # Default ExternalAPI.max_response_bytes
+
+
 @dataclass
 class ExternalAPI:
     """Configuration for external APIs"""
@@ -51,4 +54,6 @@ class ExternalAPI:
     params: Dict[str, str] = field(default_factory=dict)
     enabled: bool = True
     description: str = ""
-    timeout: int = 10
\ No newline at end of file
+    timeout: int = 10
+    max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES  # Larger bodies are truncated before summarization
+    use_llm_summary: bool = True  # False: small JSON responses are shown via a template, no LLM call
\ No newline at end of file
@@ -1,6 +1,20 @@
 """Character Configuration Models"""
+import operator
+from dataclasses import fields, is_dataclass
 from ..common_imports import *
 from .api_config import ExternalAPI
+from .ui_models import app_colors
+
+# Fields that feed CharacterConfig.resolved_colors
+_CHARACTER_COLOR_FIELDS = frozenset((
+    'use_character_colors',
+    'character_primary_color',
+    'character_secondary_color',
+))
+
+# ExternalAPI fields, fetched in one C-level call when serializing
+_API_FIELDS = tuple(f.name for f in fields(ExternalAPI))
+_API_GET = operator.attrgetter(*_API_FIELDS)
 
 
 @dataclass
@@ -61,7 +75,40 @@ class CharacterConfig:
     code_text_color: str = "#D32F2F"
     link_color: str = "#1976D2"
 
+    def __setattr__(self, name, value):
+        # Editing any color field invalidates the cached resolution
+        if name in _CHARACTER_COLOR_FIELDS:
+            self.__dict__.pop('_resolved_colors', None)
+        super().__setattr__(name, value)
+
+    @property
+    def resolved_colors(self) -> Tuple[str, str]:
+        """(primary, secondary) colors to use, falling back to the global colors"""
+        try:
+            character_colors = self._resolved_colors
+        except AttributeError:
+            character_colors = None
+            if (self.use_character_colors and
+                self.character_primary_color and
+                self.character_secondary_color):
+                character_colors = (self.character_primary_color, self.character_secondary_color)
+            self._resolved_colors = character_colors
+        return character_colors or (app_colors.PRIMARY, app_colors.SECONDARY)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field dict for saving to config.json (asdict deep-copies everything)"""
+        data = {name: getattr(self, name) for name in _CONFIG_FIELDS}
+        data['external_apis'] = [
+            dict(zip(_API_FIELDS, _API_GET(api))) if is_dataclass(api) else dict(api)
+            for api in self.external_apis
+        ]
+        return data
+
     # Legacy support - keep 'name' property for backward compatibility
     @property
     def name(self):
-        return self.folder_name
\ No newline at end of file
+        return self.folder_name
+
+
+# CharacterConfig field names, in declaration order, for to_dict()
+_CONFIG_FIELDS = tuple(f.name for f in fields(CharacterConfig))
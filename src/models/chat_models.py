@@ -1,4 +1,5 @@
 """Chat-related Models"""
+from dataclasses import fields
 from ..common_imports import *
 
 
@@ -22,6 +23,24 @@ class ChatMessage:
         if self.children_ids is None:
             self.children_ids = []
 
+    @property
+    def parsed_time(self) -> Optional[datetime]:
+        """timestamp as a datetime, parsed once per timestamp value (None if malformed)"""
+        cached = self.__dict__.get('_parsed_time')
+        if cached is None or cached[0] != self.timestamp:
+            try:
+                parsed = datetime.strptime(self.timestamp, "%Y-%m-%d %H:%M:%S")
+            except (TypeError, ValueError):
+                parsed = None
+            cached = self._parsed_time = (self.timestamp, parsed)
+        return cached[1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Field dict for chat_history.json (asdict deep-copies every message recursively)"""
+        data = {name: getattr(self, name) for name in _MESSAGE_FIELDS}
+        data['children_ids'] = list(self.children_ids)
+        return data
+
 @dataclass
 class ChatSettings:
     """Settings for chat appearance"""
@@ -57,3 +76,7 @@ class ScheduledDialog:
     enabled: bool = True
     date: Optional[str] = None  # e.g., "2025-07-15"
     advance_days: int = 0  # 0 = same day
+
+
+# ChatMessage field names, in declaration order, for to_dict()
+_MESSAGE_FIELDS = tuple(f.name for f in fields(ChatMessage))
@@ -15,3 +15,4 @@ class UserSettings:
     profiles: List[UserProfile] = field(default_factory=list)
     active_profile_name: Optional[str] = None
     show_about_on_startup: bool = True
+    show_success_dialogs: bool = True
@@ -1,6 +1,6 @@
 """UI Dialogs"""
 from ..common_imports import *
-from ..models.api_config import APIConfig, ExternalAPI
+from ..models.api_config import APIConfig, ExternalAPI, DEFAULT_MAX_RESPONSE_BYTES
 from ..models.character import CharacterConfig, IconSettings, BackgroundImageSettings, Interaction
 from ..models.user_profile import UserProfile, UserSettings
 from ..models.chat_models import ChatMessage, ChatSettings, ScheduledDialog
@@ -4145,12 +4145,8 @@ class BubbleSettingsDialog(QDialog):
             
             config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Convert character to dict
-            char_data = asdict(self.character)
-            
-            # Save to file
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(char_data, f, indent=2)
+            # Save to file (dataclass serialized directly, no asdict pass)
+            dump_json_file(self.character, config_file, indent=True)
                     
         except Exception:
             pass  # Silent fail
@@ -5022,12 +5018,24 @@ class ExternalAPIDialog(QDialog):
         self.enabled_check.setChecked(True)
         form_layout.addRow("Enabled:", self.enabled_check)
         
+        self.llm_summary_check = QCheckBox("Always summarize responses with AI")
+        self.llm_summary_check.setChecked(True)
+        self.llm_summary_check.setToolTip("When off, small JSON responses are formatted directly without an extra AI call")
+        form_layout.addRow("Summary:", self.llm_summary_check)
+        
         self.timeout_spin = QSpinBox()
         self.timeout_spin.setRange(1, 60)
         self.timeout_spin.setValue(10)
         self.timeout_spin.setSuffix(" seconds")
         form_layout.addRow("Timeout:", self.timeout_spin)
         
+        self.max_response_spin = QSpinBox()
+        self.max_response_spin.setRange(1, 4096)
+        self.max_response_spin.setValue(DEFAULT_MAX_RESPONSE_BYTES // 1024)
+        self.max_response_spin.setSuffix(" KB")
+        self.max_response_spin.setToolTip("Larger responses are truncated before they are summarized")
+        form_layout.addRow("Max response:", self.max_response_spin)
+        
         layout.addLayout(form_layout)
         
         # Headers section
@@ -5121,7 +5129,9 @@ class ExternalAPIDialog(QDialog):
         self.method_combo.setCurrentText(self.api.method)
         self.description_edit.setPlainText(self.api.description)
         self.enabled_check.setChecked(self.api.enabled)
+        self.llm_summary_check.setChecked(getattr(self.api, 'use_llm_summary', True))
         self.timeout_spin.setValue(self.api.timeout)
+        self.max_response_spin.setValue(max(1, getattr(self.api, 'max_response_bytes', DEFAULT_MAX_RESPONSE_BYTES) // 1024))
         
         # Load headers
         for key, value in self.api.headers.items():
@@ -5154,6 +5164,13 @@ class ExternalAPIDialog(QDialog):
             if key_item and value_item and key_item.text().strip():
                 params[key_item.text().strip()] = value_item.text().strip()
         
+        # Keep a hand-set byte cap exactly unless the KB value was changed
+        max_response_bytes = self.max_response_spin.value() * 1024
+        if self.api:
+            original_bytes = getattr(self.api, 'max_response_bytes', DEFAULT_MAX_RESPONSE_BYTES)
+            if max(1, original_bytes // 1024) == self.max_response_spin.value():
+                max_response_bytes = original_bytes
+        
         return ExternalAPI(
             name=self.name_edit.text().strip(),
             url=self.url_edit.text().strip(),
@@ -5162,7 +5179,9 @@ class ExternalAPIDialog(QDialog):
             params=params,
             enabled=self.enabled_check.isChecked(),
             description=self.description_edit.toPlainText().strip(),
-            timeout=self.timeout_spin.value()
+            timeout=self.timeout_spin.value(),
+            max_response_bytes=max_response_bytes,
+            use_llm_summary=self.llm_summary_check.isChecked()
         )
 
 class ExternalAPIManager(QDialog):
@@ -5385,8 +5404,7 @@ class ExternalAPIManager(QDialog):
         
         try:
             config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self.character), f, indent=2)
+            dump_json_file(self.character, config_file, indent=True)
             print(f"✅ Saved external APIs for character '{self.character.folder_name}'")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save configuration: {str(e)}")
@@ -6426,8 +6444,7 @@ class CharacterColorDialog(QDialog):
         app_data_dir = get_app_data_dir()
         config_file = app_data_dir / "characters" / self.character.folder_name / "config.json"
         
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(asdict(self.character), f, indent=2)
+        dump_json_file(self.character, config_file, indent=True)
     
     def _load_current_colors(self):
         """Load current character colors"""
@@ -6565,6 +6582,30 @@ class UserProfileEditDialog(QDialog):
         )
         self.accept()
 
+# CheckInSettings field -> memoized values derived from it
+_CHECKIN_DERIVED = {
+    'quiet_hours_start': ('_quiet_hours', '_quiet_pred'),
+    'quiet_hours_end': ('_quiet_hours', '_quiet_pred'),
+    'interval_minutes': ('_interval_td',),
+    'max_idle_hours': ('_max_idle_td',),
+}
+
+
+def _build_quiet_predicate(quiet_hours) -> Callable[[Any], bool]:
+    """Quiet-hours test for a datetime.time, specialized for a parsed (start, end) pair"""
+    if quiet_hours is None:
+        return lambda now: False
+    start, end = quiet_hours
+    
+    # 🆕 SPECIAL CASE: 00:00 to 00:00 means "always quiet" (block all messages)
+    if start == end and start.hour == 0 and start.minute == 0:
+        return lambda now: True
+    if start <= end:
+        return lambda now: start <= now <= end
+    # Quiet hours span midnight
+    return lambda now: now >= start or now <= end
+
+
 @dataclass
 class CheckInSettings:
     """Settings for proactive character check-ins"""
@@ -6575,6 +6616,56 @@ class CheckInSettings:
     quiet_hours_start: Optional[str] = "22:00"  # Don't check during quiet hours
     quiet_hours_end: Optional[str] = "08:00"
     
+    def __setattr__(self, name, value):
+        # Editing a source field invalidates the values derived from it
+        for derived in _CHECKIN_DERIVED.get(name, ()):
+            self.__dict__.pop(derived, None)
+        super().__setattr__(name, value)
+    
+    @property
+    def interval_td(self) -> timedelta:
+        """interval_minutes as a timedelta, built once per value"""
+        try:
+            return self._interval_td
+        except AttributeError:
+            self._interval_td = timedelta(minutes=self.interval_minutes)
+            return self._interval_td
+    
+    @property
+    def max_idle_td(self) -> timedelta:
+        """max_idle_hours as a timedelta, built once per value"""
+        try:
+            return self._max_idle_td
+        except AttributeError:
+            self._max_idle_td = timedelta(hours=self.max_idle_hours)
+            return self._max_idle_td
+    
+    @property
+    def quiet_hours(self) -> Optional[Tuple[Any, Any]]:
+        """Parsed (start, end) datetime.time pair, or None if unset or invalid"""
+        try:
+            return self._quiet_hours
+        except AttributeError:
+            pass
+        parsed = None
+        if self.quiet_hours_start and self.quiet_hours_end:
+            try:
+                parsed = (datetime.strptime(self.quiet_hours_start, "%H:%M").time(),
+                          datetime.strptime(self.quiet_hours_end, "%H:%M").time())
+            except (TypeError, ValueError):
+                parsed = None
+        self._quiet_hours = parsed
+        return parsed
+    
+    @property
+    def quiet_predicate(self) -> Callable[[Any], bool]:
+        """Quiet-hours test for a datetime.time, chosen once per quiet_hours value"""
+        try:
+            return self._quiet_pred
+        except AttributeError:
+            self._quiet_pred = _build_quiet_predicate(self.quiet_hours)
+            return self._quiet_pred
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             'enabled': self.enabled,
@@ -1,11 +1,11 @@
 """Main Application Window"""
 from ..common_imports import *
 from ..models.character import CharacterConfig, IconSettings, BackgroundImageSettings, Interaction
-from ..models.api_config import APIConfig, ExternalAPI
+from ..models.api_config import APIConfig, ExternalAPI, DEFAULT_MAX_RESPONSE_BYTES
 from ..models.user_profile import UserProfile, UserSettings
 from ..models.chat_models import ChatMessage, ChatSettings, ScheduledDialog
 from ..models.ui_models import AppColors, app_colors
-from ..utils.file_manager import get_app_data_dir, CharacterManager, UserProfileManager
+from ..utils.file_manager import get_app_data_dir, remove_temp_backgrounds, CharacterManager, UserProfileManager
 from ..utils.helpers import hex_to_rgba, safe_copy_file, force_reload_image, replace_name_placeholders, get_darker_secondary_with_transparency
 from ..core.ai_interface import EnhancedAIInterface
 from .widgets import ChatBubble, InteractionIcon, ModernScrollbar, MessageEditDialog
@@ -13,8 +13,384 @@ from .dialogs import CheckInSettingsDialog, CheckInSettings,APIConfigManager, Di
 from ..core.ai_interface import estimate_tokens
 from ..core.chat_manager import ChatTree
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+import bisect
+import functools
+import heapq
+import itertools
+import weakref
+from types import MappingProxyType
+from typing import Mapping
 from PySide6.QtCore import QPropertyAnimation, QEasingCurve, QSequentialAnimationGroup
 
+logger = logging.getLogger(__name__)
+
+# Existing opacity declaration inside a bubble stylesheet
+_OPACITY_RE = re.compile(r'opacity:\s*[\d.]+;?')
+
+# ChatWindow chrome stylesheets, formatted per color pair by _themed_style (_scrollbar_style for the scrollbar)
+_TITLE_CLOSE_BTN_STYLE = """
+    QPushButton {{
+        background-color: transparent;
+        color: {secondary};
+        border: none;
+        font-size: 14pt;
+        font-weight: bold;
+        border-radius: 3px;
+        padding: -3px 0px 0px 0px;
+    }}
+    QPushButton:hover {{
+        background-color: rgba(255, 0, 0, 0.3);
+    }}
+    QPushButton:pressed {{
+        background-color: rgba(255, 0, 0, 0.5);
+    }}
+"""
+
+_TITLE_MINIMIZE_BTN_STYLE = """
+    QPushButton {{
+        background-color: transparent;
+        color: {secondary};
+        border: none;
+        font-size: 12pt;
+        font-weight: bold;
+        border-radius: 3px;
+    }}
+    QPushButton:hover {{
+        background-color: rgba(255, 255, 255, 0.2);
+    }}
+    QPushButton:pressed {{
+        background-color: rgba(255, 255, 255, 0.3);
+    }}
+"""
+
+_TITLE_ICON_BTN_STYLE = """
+    QPushButton {{
+        background-color: transparent;
+        color: {secondary};
+        border: none;
+        font-size: 11pt;
+        border-radius: 3px;
+    }}
+    QPushButton:hover {{
+        background-color: rgba(255, 255, 255, 0.2);
+    }}
+    QPushButton:pressed {{
+        background-color: rgba(255, 255, 255, 0.3);
+    }}
+"""
+
+# Title bar button text -> stylesheet template (close, minimize, settings, pin)
+_TITLE_BUTTON_STYLES: Mapping[str, str] = MappingProxyType({
+    "×": _TITLE_CLOSE_BTN_STYLE,
+    "−": _TITLE_MINIMIZE_BTN_STYLE,
+    "❖": _TITLE_ICON_BTN_STYLE,
+    "📌": _TITLE_ICON_BTN_STYLE,
+})
+
+_SEND_BTN_STYLE = """
+    QPushButton {{
+        background-color: {secondary};
+        color: {primary};
+        border: none;
+        border-radius: 22px;
+        font-size: 16pt;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: {primary};
+        color: {secondary};
+    }}
+    QPushButton:pressed {{
+        background-color: {secondary};
+        color: {primary};
+    }}
+    QPushButton:disabled {{
+        background-color: {secondary};
+        color: {primary};
+        border: none;
+    }}
+    QToolTip {{
+        color: {secondary};
+        background-color: {primary};
+        border: 1px solid {secondary};
+        padding: 5px;
+        border-radius: 3px;
+    }}
+"""
+
+_SCROLLBAR_STYLE = """
+    QScrollBar:vertical {{
+        background: {scrollbar_bg};
+        width: 8px;
+        border-radius: 4px;
+        margin: 0px;
+    }}
+    QScrollBar::handle:vertical {{
+        background: {scrollbar_handle};
+        border-radius: 4px;
+        min-height: 30px;
+    }}
+    QScrollBar::handle:vertical:hover {{
+        background: {scrollbar_handle_hover};
+    }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
+        background: transparent;
+    }}
+"""
+
+_INPUT_CONTAINER_STYLE = """
+    QWidget {{
+        background-color: {secondary};
+        border-top: none;
+    }}
+"""
+
+_INPUT_TEXT_STYLE = """
+    QTextEdit {{
+        background-color: {secondary};
+        border: none;
+        border-radius: 6px;
+        padding: 8px;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 10pt;
+        color: {primary}
+    }}
+    QTextEdit:focus {{
+        border: none;
+        background-color: none;
+    }}
+    QTextEdit:hover {{
+        border: none;
+    }}
+"""
+
+# Chat bubble action buttons (Edit, Retry, Del) and navigation arrows (← →)
+_BUBBLE_ACTION_BTN_STYLE = """
+    QPushButton {{
+        background-color: {secondary};
+        color: {primary};
+        border: none;
+        border-radius: 5px;
+        font-size: 8pt;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: {primary};
+        color: {secondary};
+    }}
+    QPushButton:pressed {{
+        background-color: {primary};
+    }}
+"""
+
+_BUBBLE_ACTION_BTN_DISABLED_STYLE = """
+    QPushButton {
+        background-color: #FFF3E0;
+        color: #F57C00;
+        border: 1px solid #FFCC02;
+        border-radius: 5px;
+        font-size: 8pt;
+        font-weight: bold;
+        opacity: 0.5;
+    }
+"""
+
+_BUBBLE_NAV_BTN_STYLE = """
+    QPushButton {{
+        background-color: {primary};
+        border: none;
+        border-radius: 3px;
+        font-size: 8pt;
+        font-weight: bold;
+        color: {secondary};
+    }}
+    QPushButton:hover:enabled {{
+        background-color: {secondary};
+        color: {primary};
+    }}
+    QPushButton:pressed {{
+        background-color: {primary};
+    }}
+"""
+
+_BUBBLE_NAV_BTN_DISABLED_STYLE = """
+    QPushButton {{
+        color: #CCCCCC;
+        background-color: {primary};
+        border: none;
+        border-radius: 3px;
+        font-size: 8pt;
+        font-weight: bold;
+    }}
+"""
+
+# Characters not allowed in suggested export filenames
+_FILENAME_SANITIZE_RE = re.compile(r'[<>:"/\\|?*\s]')
+
+# File types that are already compressed and are stored uncompressed in exports
+_PRECOMPRESSED_EXTENSIONS = frozenset({'.png', '.gif', '.jpg', '.jpeg', '.webp', '.mp4'})
+
+# {param} placeholders in external API URLs, headers and params
+_PLACEHOLDER_RE = re.compile(r'\{([^{}]+)\}')
+
+# API responses up to this size that parse as JSON can skip LLM summarization
+_API_JSON_FAST_PATH_BYTES = 2048
+
+# Result heading icon by substring of the API name (first match wins)
+_API_RESULT_ICONS = (
+    ("steam", "📰"), ("news", "📰"),
+    ("weather", "🌤️"),
+    ("stock", "📈"), ("finance", "📈"),
+)
+
+# Summarization prompts by substring of the API name (first match wins)
+_NEWS_PROMPT = """Please summarize this gaming news API response from {api_name}:
+
+    {raw_data}
+
+    Extract and present:
+    - The most interesting news items (top 3-5)
+    - Headlines and brief summaries
+    - Authors and dates where available
+    - Make it engaging for a gamer to read
+
+    Format as a friendly news update."""
+
+_FINANCE_PROMPT = """Please summarize this financial API response from {api_name}:
+
+    {raw_data}
+
+    Extract and present:
+    - Key financial metrics
+    - Stock prices, changes, or trends
+    - Important financial data
+    - Make it understandable for someone checking investments
+
+    Format as a clear financial summary."""
+
+_API_PROMPT_TEMPLATES: Mapping[str, str] = MappingProxyType({
+    "steam": _NEWS_PROMPT,
+    "news": _NEWS_PROMPT,
+    "weather": """Please summarize this weather API response from {api_name}:
+
+    {raw_data}
+
+    Extract and present:
+    - Current temperature and conditions
+    - Location information
+    - Any forecasts or additional details
+    - Make it conversational and easy to understand
+
+    Format as a friendly weather update.""",
+    "stock": _FINANCE_PROMPT,
+    "finance": _FINANCE_PROMPT,
+})
+
+_API_PROMPT_GENERIC = """Please analyze and summarize this API response from {api_name}:
+
+    {raw_data}
+
+    Extract and present:
+    - The most important information
+    - Key data points in an organized way
+    - Any notable details or insights
+    - Make it easy to understand and useful
+
+    Format as a clear, friendly summary."""
+
+# Character fields not copied into exported config.json
+_EXPORT_EXCLUDED_FIELDS = frozenset({'api_config_name'})
+
+# Defaults filled into imported configs from older exports
+# (external_apis is set separately so each import gets its own list)
+_IMPORT_DEFAULT_FIELDS: Mapping[str, Any] = MappingProxyType({
+    'bubble_transparency': 0,
+    'user_bubble_transparency': 0,
+    'text_font': 'Arial',
+    'text_size': 11,
+    'text_color': '#1976D2',
+    'user_text_color': '#333333',
+    'quote_color': '#666666',
+    'emphasis_color': '#0D47A1',
+    'strikethrough_color': '#757575',
+    'code_bg_color': 'rgba(0,0,0,0.1)',
+    'code_text_color': '#D32F2F',
+    'link_color': '#1976D2',
+    'bubble_color': '#E3F2FD',
+    'user_bubble_color': '#F0F0F0',
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _style_with_opacity(style: str, opacity: float) -> str:
+    """Stylesheet with its opacity set - bubbles share a handful of styles, so results are cached"""
+    if 'opacity:' in style:
+        return _OPACITY_RE.sub(f'opacity: {opacity};', style)
+    # Add opacity to existing style
+    if style.strip().endswith('}'):
+        return style.rstrip().rstrip('}').rstrip() + f' opacity: {opacity}; }}'
+    return style + f' opacity: {opacity};'
+
+
+@functools.lru_cache(maxsize=32)
+def _themed_style(template: str, primary: str, secondary: str) -> str:
+    """Stylesheet template formatted for a color pair - cached, so unchanged colors skip formatting"""
+    return template.format_map({'primary': primary, 'secondary': secondary})
+
+
+@functools.lru_cache(maxsize=32)
+def _scrollbar_style(primary: str, secondary: str) -> str:
+    """Scrollbar stylesheet for a color pair - the only template that needs hex colors converted to rgba"""
+    return _SCROLLBAR_STYLE.format_map({
+        'scrollbar_bg': hex_to_rgba(secondary, 100),
+        'scrollbar_handle': hex_to_rgba(primary, 50),
+        'scrollbar_handle_hover': hex_to_rgba(primary, 70),
+    })
+
+
+def _read_interaction_name(config_path: Path) -> str:
+    """Name from an interaction's config.json, or its folder name if unreadable"""
+    try:
+        return load_json_file(config_path).get('name', config_path.parent.name)
+    except Exception:
+        return config_path.parent.name
+
+
+def _append_json_lines(value, lines: List[str], depth: int = 0):
+    """Render parsed JSON as nested markdown bullets"""
+    indent = "  " * depth
+    if isinstance(value, dict):
+        for key, item in value.items():
+            label = str(key).replace('_', ' ').capitalize()
+            if isinstance(item, (dict, list)) and item:
+                lines.append(f"{indent}- **{label}:**")
+                _append_json_lines(item, lines, depth + 1)
+            else:
+                lines.append(f"{indent}- **{label}:** {item}")
+    elif isinstance(value, list):
+        for i, item in enumerate(value, 1):
+            if isinstance(item, (dict, list)) and item:
+                lines.append(f"{indent}- **#{i}**")
+                _append_json_lines(item, lines, depth + 1)
+            else:
+                lines.append(f"{indent}- {item}")
+    else:
+        lines.append(f"{indent}- {value}")
+
+
+def _render_api_json(api_name: str, data) -> str:
+    """Templated chat message for a small JSON API response (no LLM round-trip)"""
+    api_name_lower = api_name.lower()
+    icon = next((icon for key, icon in _API_RESULT_ICONS if key in api_name_lower), "✅")
+    lines = []
+    _append_json_lines(data, lines)
+    return f"{icon} **{api_name} Results:**\n\n" + "\n".join(lines)
+
+
 class CharacterAnimator(QObject):
     """Handles character animation with seamless transitions"""
     def __init__(self, scene):
@@ -31,7 +407,37 @@ class CharacterAnimator(QObject):
         
         # NEW: Pre-loading system for seamless transitions
         self.preloaded_animations = {}  # Cache for loaded animations
+        self.preloaded_index = {}       # (character, interaction) -> set of cached interaction paths
         self.pending_animation = None   # Animation waiting to be displayed
+    
+    @staticmethod
+    def _interaction_key(image_path: str) -> Optional[Tuple[str, str]]:
+        """(character, interaction) for .../characters/<character>/interactions/<interaction>/... paths"""
+        parts = image_path.replace('\\', '/').split('/')
+        # Scan from the end so ancestor folders named "interactions" can't match
+        for i in range(len(parts) - 2, 1, -1):
+            if parts[i] == 'interactions' and parts[i - 2] == 'characters':
+                return parts[i - 1], parts[i + 1]
+        return None
+    
+    def _cache_animation(self, image_path: str, data):
+        """Store decoded animation data and index it if it belongs to an interaction"""
+        self.preloaded_animations[image_path] = data
+        key = self._interaction_key(image_path)
+        if key is not None:
+            self.preloaded_index.setdefault(key, set()).add(image_path)
+    
+    def _uncache_animation(self, image_path: str) -> bool:
+        """Drop one cached animation (and its index entry); True if it was cached"""
+        if self.preloaded_animations.pop(image_path, None) is None:
+            return False
+        key = self._interaction_key(image_path)
+        paths = self.preloaded_index.get(key)
+        if paths is not None:
+            paths.discard(image_path)
+            if not paths:
+                del self.preloaded_index[key]
+        return True
         
     def load_animation(self, image_path: str) -> Tuple[int, int]:
         """Load and prepare animation frames (original method for initial load)"""
@@ -52,7 +458,7 @@ class CharacterAnimator(QObject):
             self.delays = delays
             
             # Cache this animation
-            self.preloaded_animations[image_path] = (frames, delays, width, height)
+            self._cache_animation(image_path, (frames, delays, width, height))
             
             return width, height
             
@@ -66,42 +472,30 @@ class CharacterAnimator(QObject):
         """Clear animation cache for specific image or all animations"""
         if image_path:
             # Clear specific image from cache
-            if image_path in self.preloaded_animations:
-                del self.preloaded_animations[image_path]
+            if self._uncache_animation(image_path):
                 print(f"🧹 Cleared cache for: {image_path}")
         else:
             # Clear all animation cache
-            self.preloaded_animations.clear()
+            self.clear_cache()
             print("🧹 Cleared all animation cache")
 
     def clear_interaction_cache(self, character_name: str, interaction_name: str = None):
         """Clear cache for specific interaction or all interactions of a character"""
         try:
-            # Build paths to check
+            # Look up affected paths in the index instead of scanning the whole cache
             if interaction_name:
                 # Clear specific interaction
-                interaction_path_patterns = [
-                    f"*/{character_name}/interactions/{interaction_name}/base.*",
-                    f"*/characters/{character_name}/interactions/{interaction_name}/base.*"
-                ]
+                keys = [(character_name, interaction_name)]
             else:
                 # Clear all interactions for character
-                interaction_path_patterns = [
-                    f"*/{character_name}/interactions/*/base.*",
-                    f"*/characters/{character_name}/interactions/*/base.*"
-                ]
-            
-            # Remove matching cached animations
-            paths_to_remove = []
-            for cached_path in self.preloaded_animations.keys():
-                for pattern in interaction_path_patterns:
-                    if fnmatch.fnmatch(cached_path, pattern):
-                        paths_to_remove.append(cached_path)
-                        break
+                keys = [key for key in self.preloaded_index if key[0] == character_name]
             
-            for path in paths_to_remove:
-                del self.preloaded_animations[path]
-                print(f"🧹 Cleared interaction cache: {path}")
+            cleared = 0
+            for key in keys:
+                for path in list(self.preloaded_index.get(key, ())):
+                    self._uncache_animation(path)
+                    cleared += 1
+            logger.debug("🧹 Cleared %d cached interaction animation(s) for %s", cleared, character_name)
                 
         except Exception as e:
             print(f"Error clearing interaction cache: {e}")
@@ -134,7 +528,7 @@ class CharacterAnimator(QObject):
             else:
                 # Load and cache new animation
                 frames, delays, width, height = self._load_gif_data(image_path)
-                self.preloaded_animations[image_path] = (frames, delays, width, height)
+                self._cache_animation(image_path, (frames, delays, width, height))
             
             # SEAMLESS SWITCH: Update data and continue animation without stopping
             self.frames = frames
@@ -249,6 +643,7 @@ class CharacterAnimator(QObject):
 
 
 
+    @Slot()
     def force_start_animation(self):
         """Force start animation with better error handling"""
         try:
@@ -396,11 +791,171 @@ class CharacterAnimator(QObject):
     def clear_cache(self):
         """Clear animation cache to free memory"""
         self.preloaded_animations.clear()
+        self.preloaded_index.clear()
+
+
+
+class CharacterExportSignals(QObject):
+    """Signals for CharacterExportWorker (QRunnable is not a QObject)"""
+    progress = Signal(int, int)  # files written, total files
+    finished = Signal(str)       # export path
+    failed = Signal(str)         # error message
+
+
+class CharacterExportWorker(QRunnable):
+    """Writes a character package ZIP on a thread pool thread"""
+    def __init__(self, char_dir: Path, export_path: str, config_bytes: Optional[bytes]):
+        super().__init__()
+        self.char_dir = char_dir
+        self.export_path = export_path
+        self.config_bytes = config_bytes  # Pre-built export config.json, if any
+        self.signals = CharacterExportSignals()
+
+    def _collect_files(self, dir_path: str, arc_prefix: str, files: List[Tuple[str, str]]):
+        """Gather (path, arcname) pairs with os.scandir, reusing its cached file types"""
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                arcname = arc_prefix + entry.name
+                if entry.is_dir():
+                    self._collect_files(entry.path, arcname + '/', files)
+                elif entry.is_file():
+                    # Clean up top-level temp backgrounds instead of exporting them
+                    if not arc_prefix and fnmatch.fnmatch(entry.name, "temp_bg_*.png"):
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+                        continue
+                    files.append((entry.path, arcname))
+
+    def run(self):
+        """Clean temp files and zip the character folder (touches no widgets)"""
+        try:
+            files_to_zip = []
+            self._collect_files(str(self.char_dir), '', files_to_zip)
+            total = len(files_to_zip)
+            
+            # Level 1 is plenty for the JSON/text entries; images are stored as-is
+            with zipfile.ZipFile(self.export_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+                for done, (file_path, arcname) in enumerate(files_to_zip, 1):
+                    if self.config_bytes is not None and arcname == 'config.json':
+                        # Main character config - write the export version
+                        zipf.writestr(arcname, self.config_bytes)
+                    elif os.path.splitext(arcname)[1].lower() in _PRECOMPRESSED_EXTENSIONS:
+                        # Already-compressed media gains nothing from DEFLATE
+                        zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+                    else:
+                        # Regular file (including interaction files) - copy as-is
+                        zipf.write(file_path, arcname)
+                    self.signals.progress.emit(done, total)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        
+        self.signals.finished.emit(self.export_path)
+
+
+class CharacterRenameSignals(QObject):
+    """Signals for CharacterRenameWorker"""
+    finished = Signal(bool)  # rename succeeded
+
+
+class CharacterRenameWorker(QRunnable):
+    """Runs CharacterManager.rename_character (copy/backup/delete) on a thread pool thread"""
+    def __init__(self, character_manager, old_folder_name: str, new_folder_name: str, new_display_name: str):
+        super().__init__()
+        self.character_manager = character_manager
+        self.old_folder_name = old_folder_name
+        self.new_folder_name = new_folder_name
+        self.new_display_name = new_display_name
+        self.signals = CharacterRenameSignals()
+
+    def run(self):
+        """Rename the character folder/config (touches no widgets)"""
+        try:
+            success = self.character_manager.rename_character(
+                self.old_folder_name, self.new_folder_name, self.new_display_name
+            )
+        except Exception as e:
+            print(f"❌ Error during rename: {e}")
+            success = False
+        self.signals.finished.emit(success)
+
+
+class FileWriteWorker(QRunnable):
+    """Writes pre-serialized bytes to disk on a thread pool thread (atomic tmp + replace)"""
+    # Per-path ordering: only the newest queued payload for a path is written
+    _sequence = itertools.count()
+    _latest: Dict[str, int] = {}
+    _locks: Dict[str, threading.Lock] = {}
 
+    def __init__(self, payload: bytes, file_path):
+        super().__init__()
+        self.payload = payload
+        self.file_path = file_path
+        # Workers are created on the UI thread, so creation order is save order
+        self._key = os.path.abspath(file_path)
+        self._seq = next(FileWriteWorker._sequence)
+        FileWriteWorker._latest[self._key] = self._seq
+        self._lock = FileWriteWorker._locks.setdefault(self._key, threading.Lock())
+
+    def run(self):
+        """Write the file unless a newer save for the same path superseded it (touches no widgets)"""
+        try:
+            with self._lock:
+                if FileWriteWorker._latest.get(self._key) != self._seq:
+                    return
+                write_file_atomic(self.payload, self.file_path)
+        except Exception as e:
+            print(f"Error writing {self.file_path}: {e}")
+
+
+class OlderMessagesSignals(QObject):
+    """Signals for OlderMessagesWorker"""
+    finished = Signal(object, object)  # (sorted messages, their timestamps), page of older messages
+
+
+class OlderMessagesWorker(QRunnable):
+    """Sorts the active history and picks the next page of older messages on a thread pool thread"""
+    def __init__(self, messages: List[ChatMessage], timestamps: Optional[List[str]], loaded_ids: set,
+                 oldest_timestamp, page_size: int):
+        super().__init__()
+        self.messages = messages  # Snapshot list - never the live chat tree
+        self.timestamps = timestamps  # Parallel sorted timestamps, or None if messages are unsorted
+        self.loaded_ids = loaded_ids
+        self.oldest_timestamp = oldest_timestamp
+        self.page_size = page_size
+        self.signals = OlderMessagesSignals()
+
+    def run(self):
+        """Select the page (touches no widgets)"""
+        try:
+            messages, timestamps = self.messages, self.timestamps
+            if timestamps is None:
+                messages = sorted(messages, key=lambda msg: msg.timestamp)
+                timestamps = [msg.timestamp for msg in messages]
+            index = (messages, timestamps)
+            
+            # Binary search to the oldest displayed message, then walk back one page
+            end = len(messages) if self.oldest_timestamp is None else bisect.bisect_left(timestamps, self.oldest_timestamp)
+            page = []
+            for i in range(end - 1, -1, -1):
+                msg = messages[i]
+                if msg.id not in self.loaded_ids:
+                    page.append(msg)
+                    if len(page) == self.page_size:
+                        break
+            page.reverse()
+        except Exception as e:
+            print(f"Error selecting older messages: {e}")
+            index, page = None, []
+        self.signals.finished.emit(index, page)
 
 
 class MainApplication(QMainWindow):
     """Main application window with dynamic color updates"""
+    IMAGE_FILTER = "Image files (*.gif *.png *.jpg *.jpeg);;All files (*.*)"
+
     def __init__(self):
         super().__init__()
         
@@ -414,13 +969,20 @@ class MainApplication(QMainWindow):
 
 
 
+        # Data paths are fixed for the app's lifetime - resolve them once
+        self._app_data_dir = get_app_data_dir()
+        self._characters_root = self._app_data_dir / "characters"
+        self._state_file = self._app_data_dir / "app_state.json"
         self.current_character = None
-        self.chat_windows = {}
+        # folder name -> ChatWindow; entries drop out on their own once Qt destroys the window
+        self.chat_windows = weakref.WeakValueDictionary()
+        # One bounded pool for /use external API calls from every chat window
+        self._api_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="api")
+        self._api_futures = set()
         self.interaction_icons = []
+        self._interaction_icon_set = set()  # Same icons, for O(1) click hit-testing
         self.editor_mode = False
-        self.current_interaction_timer = None
         self.interaction_in_progress = False
-        self.current_interaction_timer = None
         self.last_interaction_time = 0
         self.interaction_debounce_ms = 300
         self._original_image_path = None
@@ -430,6 +992,40 @@ class MainApplication(QMainWindow):
         self.interaction_locks = {}
         self.last_interaction_times = {}
         self.interaction_sequences = {}
+
+        # Single reusable timer for returning from an interaction animation
+        self._interaction_return_timer = QTimer(self)
+        self._interaction_return_timer.setSingleShot(True)
+        self._interaction_return_timer.timeout.connect(self._restore_original_animation)
+
+        # Debounced character display refresh (see refresh_character_display)
+        self._refresh_debounce = QTimer(self)
+        self._refresh_debounce.setSingleShot(True)
+        self._refresh_debounce.setInterval(150)
+        self._refresh_debounce.timeout.connect(self._do_refresh_character_display)
+        self._last_char_sig = None
+
+        # Running CharacterExportWorker / CharacterRenameWorker (kept alive until they report back)
+        self._export_worker = None
+        self._rename_worker = None
+
+        # Debounced app_state.json writes (drags, toggles, character switches)
+        self._save_state_timer = QTimer(self)
+        self._save_state_timer.setSingleShot(True)
+        self._save_state_timer.timeout.connect(self._do_save_state)
+        self._last_saved_state = None  # Last state written, to skip identical rewrites
+
+        # folder name -> display name for the Characters menu
+        self._display_name_cache = {}
+
+        # Last folders used by export/import/image dialogs (restored from app state)
+        self._last_export_dir = Path.home()
+        self._last_import_dir = Path.home()
+        self._last_image_dir = Path.home()
+
+        # Proactive check-in caches (rebuilt on character/settings change)
+        self._checkin_paths = None
+        self._checkin_settings_cache = None
         
         self.global_schedule_timer = QTimer()
         self.global_schedule_timer.timeout.connect(self._check_all_scheduled_reminders)
@@ -450,8 +1046,36 @@ class MainApplication(QMainWindow):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.always_on_top = False
         
+        # Pending coalesced update_colors pass
+        self._color_update_pending = False
+        self._last_main_colors = None
+        
+        # Widgets created by _setup_ui (update_colors may run before then)
+        self.title_bar = None
+        self.character_view = None
+        self.menu_toggle_btn = None
+        self.pin_btn = None
+        
         # IMPORTANT: Set up UI FIRST before connecting to color signals
         self._setup_ui()
+        
+        # Reused Yes/No box for confirmations (see _confirm)
+        self._confirm_box = QMessageBox(self)
+        self._confirm_box.setIcon(QMessageBox.Question)
+        self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        
+        # Menu actions that only make sense with a character loaded
+        self._character_dependent_actions = (
+            self.add_interaction_action,
+            self.edit_image_action,
+            self.edit_personality_action,
+            self.edit_names_action,
+            self.character_colors_action,
+            self.editor_mode_action,
+            self.delete_character_action,
+            self.export_character_action,
+            self.external_apis_action,
+        )
         app_colors.colors_changed.connect(self.update_colors)
 
         
@@ -464,6 +1088,16 @@ class MainApplication(QMainWindow):
         # For window dragging
         self.drag_position = None
     
+    @property
+    def current_character(self):
+        return self._current_character
+
+    @current_character.setter
+    def current_character(self, character):
+        # Keep the character's folder path in step with the character itself
+        self._current_character = character
+        self._current_char_dir = self._characters_root / character.folder_name if character else None
+
     def show_about_dialog(self):
         enabled = getattr(self.user_profile_manager.settings, "show_about_on_startup", True)
         dlg = AboutDialog(self, show_on_startup=enabled)
@@ -482,6 +1116,25 @@ class MainApplication(QMainWindow):
         if getattr(self.user_profile_manager.settings, "show_about_on_startup", True):
             self.show_about_dialog()
 
+    def _confirm(self, title: str, text: str) -> bool:
+        """Ask a Yes/No question using the shared confirmation box"""
+        self._confirm_box.setWindowTitle(title)
+        self._confirm_box.setText(text)
+        self._confirm_box.setDefaultButton(QMessageBox.No)
+        return self._confirm_box.exec() == QMessageBox.Yes
+
+    def _toggle_success_dialogs(self, checked: bool):
+        """Turn the export/import/API success pop-ups on or off"""
+        self.user_profile_manager.settings.show_success_dialogs = checked
+        self.user_profile_manager.save_settings()
+
+    def _show_success(self, title: str, message: str):
+        """Show a success pop-up, or just a brief tooltip when pop-ups are turned off"""
+        if self.user_profile_manager.settings.show_success_dialogs:
+            QMessageBox.information(self, title, message)
+        else:
+            QToolTip.showText(self.mapToGlobal(self.rect().center()), message.split("\n", 1)[0], self, QRect(), 3000)
+
 
 
 
@@ -632,6 +1285,9 @@ class MainApplication(QMainWindow):
         # Store current dimensions
         self.current_image_width = 400
         self.current_image_height = 400
+        
+        # Overlay holding the interaction icons (swapped out wholesale on clear)
+        self._interaction_container = self._new_interaction_container()
     
 
 
@@ -685,9 +1341,12 @@ class MainApplication(QMainWindow):
         if not self.current_character:
             return
         
+        # The character folder is being copied/removed - don't reopen a chat window into it
+        if self._rename_worker is not None:
+            return
+        
         # Load scheduled dialogs for current character
-        app_data_dir = get_app_data_dir()
-        dialog_file = app_data_dir / "characters" / self.current_character.name / "scheduled_dialogs.json"
+        dialog_file = self._current_char_dir / "scheduled_dialogs.json"
         
         if dialog_file.exists():
             try:
@@ -758,44 +1417,65 @@ class MainApplication(QMainWindow):
         # 🆕 NEW: Window is closed, but we might still need to check-in and auto-open
         self._check_checkin_for_closed_window()
 
+    def _get_checkin_paths(self):
+        """Return (settings_file, history_file, checkin_state_file) for the current character"""
+        char_name = self.current_character.name
+        if self._checkin_paths is None or self._checkin_paths[0] != char_name:
+            char_dir = self._characters_root / char_name
+            self._checkin_paths = (
+                char_name,
+                char_dir / "checkin_settings.json",
+                char_dir / "chat_history.json",
+                char_dir / "last_checkin.json",
+            )
+        return self._checkin_paths[1:]
+
+    def _get_checkin_settings(self, settings_file):
+        """Load check-in settings, re-reading the file and thresholds only when it changes"""
+        try:
+            mtime = settings_file.stat().st_mtime
+        except OSError:
+            return None
+        
+        cached = self._checkin_settings_cache
+        if cached and cached[0] == settings_file and cached[1] == mtime:
+            return cached[2]
+        
+        with open(settings_file, 'r', encoding='utf-8') as f:
+            checkin_settings = CheckInSettings.from_dict(json.load(f))
+        
+        self._checkin_settings_cache = (settings_file, mtime, checkin_settings)
+        return checkin_settings
+
     def _check_checkin_for_closed_window(self):
         """Check if we should send check-in for closed window and auto-open"""
         try:
             # Load check-in settings for the character
-            app_data_dir = get_app_data_dir()
-            settings_file = app_data_dir / "characters" / self.current_character.name / "checkin_settings.json"
-            
-            if not settings_file.exists():
-                return
+            settings_file, history_file, checkin_state_file = self._get_checkin_paths()
+            checkin_settings = self._get_checkin_settings(settings_file)
             
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                checkin_settings = CheckInSettings.from_dict(data)
-            
-            if not checkin_settings.enabled:
+            if not checkin_settings or not checkin_settings.enabled:
                 return
             
             # Load last user message time from chat history
-            history_file = app_data_dir / "characters" / self.current_character.name / "chat_history.json"
             if not history_file.exists():
                 return
             
-            with open(history_file, 'r', encoding='utf-8') as f:
-                history_data = json.load(f)
+            history_data = load_json_file(history_file)
             
-            # Find the most recent user message
-            last_user_time = None
-            if "messages" in history_data:
-                for msg_data in history_data["messages"].values():
-                    if msg_data.get("role") == "user":
-                        try:
-                            msg_time = datetime.strptime(msg_data["timestamp"], "%Y-%m-%d %H:%M:%S")
-                            if not last_user_time or msg_time > last_user_time:
-                                last_user_time = msg_time
-                        except:
-                            continue
+            # Find the most recent user message - "YYYY-MM-DD HH:MM:SS" strings
+            # sort chronologically, so only the winner needs parsing
+            latest_ts_str = max(
+                (msg_data["timestamp"] for msg_data in history_data.get("messages", {}).values()
+                 if msg_data.get("role") == "user" and "timestamp" in msg_data),
+                default=None
+            )
+            if not latest_ts_str:
+                return
             
-            if not last_user_time:
+            try:
+                last_user_time = datetime.strptime(latest_ts_str, "%Y-%m-%d %H:%M:%S")
+            except ValueError:
                 return
             
             # Check if enough time has passed for check-in
@@ -807,24 +1487,21 @@ class MainApplication(QMainWindow):
                 return
             
             # Check if should send check-in
-            if (time_since_last >= timedelta(minutes=checkin_settings.interval_minutes) and
-                time_since_last <= timedelta(hours=checkin_settings.max_idle_hours)):
+            if checkin_settings.interval_td <= time_since_last <= checkin_settings.max_idle_td:
                 
                 # Load last check-in time
-                checkin_state_file = app_data_dir / "characters" / self.current_character.name / "last_checkin.json"
                 last_checkin_time = None
                 
                 if checkin_state_file.exists():
                     try:
-                        with open(checkin_state_file, 'r', encoding='utf-8') as f:
-                            state_data = json.load(f)
-                            last_checkin_time = datetime.strptime(state_data["last_checkin"], "%Y-%m-%d %H:%M:%S")
+                        state_data = load_json_file(checkin_state_file)
+                        last_checkin_time = datetime.strptime(state_data["last_checkin"], "%Y-%m-%d %H:%M:%S")
                     except:
                         pass
                 
                 # Check if enough time since last check-in
                 if (not last_checkin_time or 
-                    now - last_checkin_time >= timedelta(minutes=checkin_settings.interval_minutes)):
+                    now - last_checkin_time >= checkin_settings.interval_td):
                     
                     # 🆕 AUTO-OPEN CHAT AND SEND CHECK-IN WITH FLASH
                     print(f"📋 Auto-opening chat for proactive check-in: {self.current_character.display_name}")
@@ -832,33 +1509,14 @@ class MainApplication(QMainWindow):
                     
                     # Save check-in time
                     checkin_state_file.parent.mkdir(parents=True, exist_ok=True)
-                    with open(checkin_state_file, 'w', encoding='utf-8') as f:
-                        json.dump({"last_checkin": now.strftime("%Y-%m-%d %H:%M:%S")}, f)
+                    dump_json_file({"last_checkin": now.strftime("%Y-%m-%d %H:%M:%S")}, checkin_state_file)
         
         except Exception as e:
             print(f"Error checking proactive check-in: {e}")
 
     def _is_quiet_hours_global(self, settings):
         """Check if current time is within quiet hours - GLOBAL VERSION"""
-        if not settings.quiet_hours_start or not settings.quiet_hours_end:
-            return False
-            
-        now = datetime.now().time()
-        try:
-            start = datetime.strptime(settings.quiet_hours_start, "%H:%M").time()
-            end = datetime.strptime(settings.quiet_hours_end, "%H:%M").time()
-            
-            # 🆕 SPECIAL CASE: 00:00 to 00:00 means "always quiet" (block all messages)
-            if start == end and start.hour == 0 and start.minute == 0:
-                print(f"🔇 Always quiet hours detected (00:00-00:00) - blocking all messages")
-                return True
-            
-            if start <= end:
-                return start <= now <= end
-            else:  # Quiet hours span midnight
-                return now >= start or now <= end
-        except:
-            return False
+        return settings.quiet_predicate(datetime.now().time())
 
     def _create_new_chat_window_for_checkin(self):
         """Create new chat window specifically for check-in with flash"""
@@ -875,12 +1533,23 @@ class MainApplication(QMainWindow):
         
         # Create new window with check-in flag
         chat_window = ChatWindow(self, self.current_character, self.ai_interface, None, is_checkin=True)
-        self.chat_windows[char_name] = chat_window
+        self._track_chat_window(char_name, chat_window)
         
         print(f"Chat window created for check-in: {char_name}")
         chat_window.show()
         return chat_window
 
+    def _track_chat_window(self, char_name: str, chat_window):
+        """Track a chat window and drop it from chat_windows once Qt destroys it"""
+        self.chat_windows[char_name] = chat_window
+
+        def untrack(_=None):
+            # Identity check only - a replacement window may already be tracked under this name
+            if self.chat_windows.get(char_name) is chat_window:
+                del self.chat_windows[char_name]
+
+        chat_window.destroyed.connect(untrack)
+
     def _handle_scheduled_reminder(self, prompt_text: str):
         """Handle scheduled reminder - INSTANT PROCESSING"""
         char_name = self.current_character.name
@@ -904,39 +1573,28 @@ class MainApplication(QMainWindow):
 
 
     def update_colors(self):
+        """Schedule a color update - bursts of calls coalesce into one pass"""
+        if not self._color_update_pending:
+            self._color_update_pending = True
+            QTimer.singleShot(0, self._do_update_colors)
+
+    def _do_update_colors(self):
         """Update all colors in main window - FIXED VERSION"""
-        # Debouncing
-        current_time = time.time()
-        if hasattr(self, '_last_color_update_time'):
-            if current_time - self._last_color_update_time < 0.1:
-                return
-        self._last_color_update_time = current_time
+        self._color_update_pending = False
         
         # Check if UI components exist before updating them
-        if not hasattr(self, 'title_bar') or self.title_bar is None:
+        if self.title_bar is None:
             return
         
         # DETERMINE WHICH COLORS TO USE: Character-specific or Global
-        primary_color = app_colors.PRIMARY
-        secondary_color = app_colors.SECONDARY
-        
-        # Check if current character has custom colors enabled
-        if (hasattr(self, 'current_character') and 
-            self.current_character and 
-            getattr(self.current_character, 'use_character_colors', False)):
-            
-            # Use character-specific colors
-            char_primary = getattr(self.current_character, 'character_primary_color', '')
-            char_secondary = getattr(self.current_character, 'character_secondary_color', '')
-            
-            if char_primary and char_secondary:
-                primary_color = char_primary
-                secondary_color = char_secondary
+        primary_color, secondary_color = (
+            self.current_character.resolved_colors if self.current_character
+            else (app_colors.PRIMARY, app_colors.SECONDARY)
+        )
         
         # Only update if colors actually changed
-        if hasattr(self, '_last_main_colors'):
-            if self._last_main_colors == (primary_color, secondary_color):
-                return
+        if self._last_main_colors == (primary_color, secondary_color):
+            return
         
         self._last_main_colors = (primary_color, secondary_color)
         
@@ -947,13 +1605,13 @@ class MainApplication(QMainWindow):
             pass
         
         # UPDATE CHARACTER VIEW - ONLY if not using custom background settings
-        if hasattr(self, 'character_view') and self.character_view is not None:
+        if self.character_view is not None:
             try:
                 # OPTION 1: Don't change character view background at all
                 # (Comment out the lines below to prevent any background changes)
                 
                 # OPTION 2: Only change in editor mode, otherwise keep original
-                if hasattr(self, 'editor_mode') and self.editor_mode:
+                if self.editor_mode:
                     bg_color = "#FFE0E0"  # Editor mode color
                     self.character_view.setStyleSheet(f"background-color: {bg_color}; border: none;")
                 # Don't change background for normal mode - let it keep its original color
@@ -964,16 +1622,9 @@ class MainApplication(QMainWindow):
         # UPDATE ALL CONTROL BUTTONS
         self._update_all_control_buttons_with_colors(primary_color, secondary_color)
         
-        # UPDATE CHAT WINDOWS (call their update_colors method)
-        if hasattr(self, 'chat_windows'):
-            for name, window in list(self.chat_windows.items()):
-                try:
-                    if window and hasattr(window, 'update_colors'):
-                        window.update_colors()
-                except (RuntimeError, AttributeError):
-                    # Remove invalid windows
-                    if name in self.chat_windows:
-                        del self.chat_windows[name]
+        # UPDATE CHAT WINDOWS (destroyed windows untrack themselves)
+        for window in self.chat_windows.values():
+            window.update_colors()
         
         # Single clean log message
         print(f"🎨 MainWindow: Colors updated ({primary_color[:7]} / {secondary_color[:7]})")
@@ -982,12 +1633,12 @@ class MainApplication(QMainWindow):
     def _update_all_control_buttons_with_colors(self, primary_color, secondary_color):
         """Update all control button styles with specific colors"""
         # Check if title_bar exists and has been set up
-        if not hasattr(self, 'title_bar') or self.title_bar is None:
+        if self.title_bar is None:
             return
         
         try:
             # Update menu toggle button
-            if hasattr(self, 'menu_toggle_btn') and self.menu_toggle_btn is not None:
+            if self.menu_toggle_btn is not None:
                 self.menu_toggle_btn.setStyleSheet(f"""
                     QPushButton {{
                         background-color: transparent;
@@ -1004,8 +1655,8 @@ class MainApplication(QMainWindow):
                 """)
             
             # Update pin button with special logic for active/inactive state
-            if hasattr(self, 'pin_btn') and self.pin_btn is not None:
-                pin_color = "#FFD700" if getattr(self, 'always_on_top', False) else secondary_color
+            if self.pin_btn is not None:
+                pin_color = "#FFD700" if self.always_on_top else secondary_color
                 self.pin_btn.setStyleSheet(f"""
                     QPushButton {{
                         background-color: transparent;
@@ -1023,66 +1674,65 @@ class MainApplication(QMainWindow):
                 """)
             
             # Update all other title bar buttons
-            if hasattr(self, 'title_bar') and self.title_bar is not None:
-                title_buttons = self.title_bar.findChildren(QPushButton)
-                for btn in title_buttons:
-                    if not btn:
-                        continue
-                        
-                    button_text = btn.text()
+            title_buttons = self.title_bar.findChildren(QPushButton)
+            for btn in title_buttons:
+                if not btn:
+                    continue
+                    
+                button_text = btn.text()
+                
+                if button_text == "❖":  # Settings button
+                    btn.setStyleSheet(f"""
+                        QPushButton {{
+                            background-color: transparent;
+                            color: {secondary_color};
+                            border: none;
+                            font-size: 11pt;
+                            border-radius: 3px;
+                        }}
+                        QPushButton:hover {{
+                            background-color: rgba(255, 255, 255, 0.2);
+                        }}
+                        QPushButton:pressed {{
+                            background-color: rgba(255, 255, 255, 0.3);
+                        }}
+                    """)
+                elif button_text == "−":  # Minimize button
+                    btn.setStyleSheet(f"""
+                        QPushButton {{
+                            background-color: transparent;
+                            color: {secondary_color};
+                            border: none;
+                            font-size: 12pt;
+                            font-weight: bold;
+                            border-radius: 3px;
+                        }}
+                        QPushButton:hover {{
+                            background-color: rgba(255, 255, 255, 0.2);
+                        }}
+                        QPushButton:pressed {{
+                            background-color: rgba(255, 255, 255, 0.3);
+                        }}
+                    """)
+                elif button_text == "×":  # Close button
+                    btn.setStyleSheet(f"""
+                        QPushButton {{
+                            background-color: transparent;
+                            color: {secondary_color};
+                            border: none;
+                            font-size: 14pt;
+                            font-weight: bold;
+                            border-radius: 3px;
+                            padding: -3px 0px 0px 0px;
+                        }}
+                        QPushButton:hover {{
+                            background-color: rgba(255, 0, 0, 0.3);
+                        }}
+                        QPushButton:pressed {{
+                            background-color: rgba(255, 0, 0, 0.5);
+                        }}
+                    """)
                     
-                    if button_text == "❖":  # Settings button
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: transparent;
-                                color: {secondary_color};
-                                border: none;
-                                font-size: 11pt;
-                                border-radius: 3px;
-                            }}
-                            QPushButton:hover {{
-                                background-color: rgba(255, 255, 255, 0.2);
-                            }}
-                            QPushButton:pressed {{
-                                background-color: rgba(255, 255, 255, 0.3);
-                            }}
-                        """)
-                    elif button_text == "−":  # Minimize button
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: transparent;
-                                color: {secondary_color};
-                                border: none;
-                                font-size: 12pt;
-                                font-weight: bold;
-                                border-radius: 3px;
-                            }}
-                            QPushButton:hover {{
-                                background-color: rgba(255, 255, 255, 0.2);
-                            }}
-                            QPushButton:pressed {{
-                                background-color: rgba(255, 255, 255, 0.3);
-                            }}
-                        """)
-                    elif button_text == "×":  # Close button
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: transparent;
-                                color: {secondary_color};
-                                border: none;
-                                font-size: 14pt;
-                                font-weight: bold;
-                                border-radius: 3px;
-                                padding: -3px 0px 0px 0px;
-                            }}
-                            QPushButton:hover {{
-                                background-color: rgba(255, 0, 0, 0.3);
-                            }}
-                            QPushButton:pressed {{
-                                background-color: rgba(255, 0, 0, 0.5);
-                            }}
-                        """)
-                        
         except (AttributeError, RuntimeError) as e:
             print(f"Error updating control buttons: {e}")
 
@@ -1107,28 +1757,15 @@ class MainApplication(QMainWindow):
         if not self._original_image_path:
             self._original_image_path = self.animator.current_image_path
         
-        # Clean up any existing timer
-        if self.current_interaction_timer:
-            self.current_interaction_timer.stop()
-            self.current_interaction_timer.deleteLater()
-            self.current_interaction_timer = None
-        
         # Mark interaction as in progress
         self.interaction_in_progress = True
         
         # SEAMLESS TRANSITION: Load new animation without stopping current display
         self.animator.seamless_load_animation(interaction.base_image_path)
         
-        # Create timer for returning to original
-        self.current_interaction_timer = QTimer()
-        self.current_interaction_timer.setSingleShot(True)
-        self.current_interaction_timer.timeout.connect(
-            lambda: self._restore_original_animation()
-        )
-        
-        # Start timer
+        # (Re)start timer for returning to original - start() resets a running timer
         duration_ms = max(interaction.duration * 1000, 1000)
-        self.current_interaction_timer.start(duration_ms)
+        self._interaction_return_timer.start(duration_ms)
         
         # Send to chat if window is open
         self._send_interaction_to_chat_if_open(interaction)
@@ -1156,16 +1793,9 @@ class MainApplication(QMainWindow):
             self.animator.load_animation(interaction.base_image_path)
             self.animator.start_animation()
             
-            # Create timer for returning to original
-            self.current_interaction_timer = QTimer()
-            self.current_interaction_timer.setSingleShot(True)
-            self.current_interaction_timer.timeout.connect(
-                lambda: self._restore_original_animation()
-            )
-            
-            # Start timer
+            # Start timer for returning to original
             duration_ms = max(interaction.duration * 1000, 1000)  # Minimum 1 second
-            self.current_interaction_timer.start(duration_ms)
+            self._interaction_return_timer.start(duration_ms)
             
             print(f"Interaction timer started for {duration_ms}ms")
             
@@ -1244,20 +1874,14 @@ class MainApplication(QMainWindow):
             # CRITICAL: Force immediate UI update for user message
             print(f"💬 Creating immediate bubble for interaction message...")
             
-            # Use the signal-based approach to ensure immediate display
+            # Queued signal - the bubble is added and painted on the next
+            # event-loop pass, ahead of any AI reply emitted afterwards
             chat_window.add_bubble_signal.emit(user_msg)
             
-            # Process any pending UI events to ensure bubble appears
-            from PySide6.QtWidgets import QApplication
-            QApplication.processEvents()
-            
-            # Small delay to ensure UI is updated
-            time.sleep(0.05)
+            print(f"✅ User message bubble queued")
             
-            print(f"✅ User message bubble should now be visible")
-            
-            # Save chat history immediately after user message
-            chat_window._save_chat_history()
+            # Save chat history (coalesced with other rapid interactions)
+            chat_window._schedule_save()
             
             # Get character and user names for personality enhancement
             user_profile = chat_window._get_effective_user_profile()
@@ -1288,29 +1912,16 @@ class MainApplication(QMainWindow):
             
             print(f"🎭 Enhanced personality prepared")
             
-            # Temporarily override personality
-            original_personality = chat_window.character.personality
-            chat_window.character.personality = enhanced_personality
-            
-            # Queue for AI response
+            # Queue for AI response - the enhanced personality travels with the
+            # request instead of overriding the shared character config
             print(f"📤 Queuing for AI: '{interaction_message}' -> {user_msg.id[:8]}")
             
             if hasattr(chat_window, 'message_queue'):
-                chat_window.message_queue.put((interaction_message, user_msg.id))
+                chat_window.message_queue.put((interaction_message, user_msg.id, enhanced_personality))
                 print(f"✅ Queued successfully")
             else:
                 print(f"❌ No message queue found!")
             
-            # Restore original personality after a delay
-            def restore_personality():
-                try:
-                    chat_window.character.personality = original_personality
-                except:
-                    pass
-            
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(100, restore_personality)
-            
             return True
             
         finally:
@@ -1452,6 +2063,10 @@ class MainApplication(QMainWindow):
         view_menu = QMenu(self)
         view_menu.addAction("Reset Window", self._reset_window)
         view_menu.addAction("Edit Colors", self._open_color_editor)
+        success_dialogs_action = view_menu.addAction("Show Success Dialogs")
+        success_dialogs_action.setCheckable(True)
+        success_dialogs_action.setChecked(self.user_profile_manager.settings.show_success_dialogs)
+        success_dialogs_action.toggled.connect(self._toggle_success_dialogs)
         view_menu.addSeparator()
         view_menu.addAction("About", self.show_about_dialog)
         view_btn.setMenu(view_menu)
@@ -1493,7 +2108,7 @@ class MainApplication(QMainWindow):
             combo.addItem(name, name)
         
         # Set current selection
-        if hasattr(self.current_character, 'api_config_name') and self.current_character.api_config_name:
+        if self.current_character.api_config_name:
             index = combo.findData(self.current_character.api_config_name)
             if index >= 0:
                 combo.setCurrentIndex(index)
@@ -1517,16 +2132,14 @@ class MainApplication(QMainWindow):
             self.current_character.api_config_name = selected_config
             
             # FIXED: Save character config using proper path structure
-            app_data_dir = get_app_data_dir()
-            char_dir = app_data_dir / "characters" / self.current_character.folder_name
-            config_file = char_dir / "config.json"
+            config_file = self._current_char_dir / "config.json"
             
             try:
-                with open(config_file, 'w', encoding='utf-8') as f:
-                    json.dump(asdict(self.current_character), f, indent=2)
+                dump_json_file(self.current_character.to_dict(), config_file, indent=True)
+                self.character_manager.invalidate(self.current_character.folder_name)
                 
                 api_name = selected_config or "Default"
-                QMessageBox.information(self, "Success", f"API set to: {api_name}")
+                self._show_success("Success", f"API set to: {api_name}")
                 print(f"✅ Saved API config '{api_name}' for character '{self.current_character.folder_name}'")
                 
             except Exception as e:
@@ -1541,75 +2154,97 @@ class MainApplication(QMainWindow):
 
 
     def refresh_character_display(self):
+        """Schedule a character display refresh - bursts of calls coalesce into one rebuild"""
+        self._refresh_debounce.start()
+
+    def _get_base_image_signature(self, image_path):
+        """(path, mtime_ns, size) of a base image, or None if it is missing"""
+        try:
+            st = os.stat(image_path)
+        except (OSError, TypeError):
+            return None
+        return (image_path, st.st_mtime_ns, st.st_size)
+
+    def _do_refresh_character_display(self):
         """SAFE refresh ONLY the character display without affecting chat windows or interactions"""
         try:
-            print("🔄 Refreshing character display only (isolated)...")
+            logger.debug("🔄 Refreshing character display only (isolated)...")
             
             if not self.current_character:
-                print("⚠️ No current character to refresh")
+                logger.warning("⚠️ No current character to refresh")
+                return
+            
+            # Reload the character to get the updated image path
+            updated_character = self.character_manager.load_character(self.current_character.name)
+            if not updated_character:
+                logger.warning("⚠️ Could not reload character data")
+                return
+            
+            # Nothing to rebuild if the base image file is unchanged
+            new_sig = self._get_base_image_signature(updated_character.base_image)
+            if new_sig is not None and new_sig == self._last_char_sig:
+                logger.debug("ℹ️ Character image unchanged - skipping scene rebuild")
+                self.current_character = updated_character
+                self.setWindowTitle(f"Character Manager - {updated_character.display_name}")
                 return
             
             # CRITICAL: Stop all animations BEFORE clearing anything
-            if hasattr(self, 'animator') and self.animator:
-                print("🛑 Stopping animations before refresh...")
+            if self.animator:
+                logger.debug("🛑 Stopping animations before refresh...")
                 self.animator.stop_animation()
                 # Give Qt time to process the stop
                 QCoreApplication.processEvents()
             
             # Stop any interaction timers (but don't affect interactions)
-            if hasattr(self, 'current_interaction_timer') and self.current_interaction_timer:
-                self.current_interaction_timer.stop()
-                self.current_interaction_timer = None
+            self._interaction_return_timer.stop()
             
-            # Clear only character-specific caches
-            QPixmapCache.clear()
+            # Clear only character-specific caches - evict the old and new base
+            # image frames instead of wiping the app-wide QPixmapCache
+            self.animator.clear_animation_cache(self.current_character.base_image)
+            self.animator.clear_animation_cache(updated_character.base_image)
             
-            # Reload the character to get the updated image path
-            updated_character = self.character_manager.load_character(self.current_character.name)
-            if updated_character:
-                # Update the current character reference
-                old_character_name = self.current_character.display_name
-                self.current_character = updated_character
+            # Update the current character reference
+            old_character_name = self.current_character.display_name
+            self.current_character = updated_character
+            
+            # SAFE: Clear and rebuild the scene
+            if self.scene:
+                logger.debug("🧹 Safely clearing scene...")
+                self.scene.clear()  # This will properly delete all items
+            
+            # CRITICAL: Reload and restart the animation (like _load_character does)
+            if updated_character.base_image and os.path.exists(updated_character.base_image):
+                logger.debug("🔄 Reloading character animation: %s", updated_character.base_image)
                 
-                # SAFE: Clear and rebuild the scene
-                if hasattr(self, 'scene') and self.scene:
-                    print("🧹 Safely clearing scene...")
-                    self.scene.clear()  # This will properly delete all items
+                # Load animation (this sets up frames and dimensions)
+                width, height = self.animator.load_animation(updated_character.base_image)
+                logger.debug("📏 Animation loaded with dimensions: %dx%d", width, height)
                 
-                # CRITICAL: Reload and restart the animation (like _load_character does)
-                if updated_character.base_image and os.path.exists(updated_character.base_image):
-                    print(f"🔄 Reloading character animation: {os.path.basename(updated_character.base_image)}")
-                    
-                    # Load animation (this sets up frames and dimensions)
-                    width, height = self.animator.load_animation(updated_character.base_image)
-                    print(f"📏 Animation loaded with dimensions: {width}x{height}")
-                    
-                    # Update stored dimensions
-                    self.current_image_width = width
-                    self.current_image_height = height
-                    
-                    # Update window size if needed
-                    self._update_window_size()
-                    print("📐 Window size updated")
-                    
-                    # Start the animation with a small delay to ensure scene is ready
-                    QTimer.singleShot(100, self.animator.force_start_animation)
-                    print("⏰ Animation start scheduled")
-                    
-                    print(f"✅ Character animation reloaded: {width}x{height}")
-                else:
-                    print(f"⚠️ Character base image not found: {updated_character.base_image}")
+                # Update stored dimensions
+                self.current_image_width = width
+                self.current_image_height = height
                 
-                # Update window title if it shows character name
-                if hasattr(self, 'setWindowTitle'):
-                    self.setWindowTitle(f"Character Manager - {updated_character.display_name}")
+                # Update window size if needed
+                self._update_window_size()
+                logger.debug("📐 Window size updated")
+                
+                self._last_char_sig = new_sig
                 
-                print(f"✅ Character display safely refreshed for: {updated_character.display_name}")
+                # Start the animation on the next event loop pass, once the scene is built
+                QMetaObject.invokeMethod(self.animator, "force_start_animation", Qt.ConnectionType.QueuedConnection)
+                logger.debug("⏰ Animation start scheduled")
+                
+                logger.debug("✅ Character animation reloaded: %dx%d", width, height)
             else:
-                print("⚠️ Could not reload character data")
+                logger.warning("⚠️ Character base image not found: %s", updated_character.base_image)
+            
+            # Update window title if it shows character name
+            self.setWindowTitle(f"Character Manager - {updated_character.display_name}")
+            
+            logger.debug("✅ Character display safely refreshed for: %s", updated_character.display_name)
                 
         except Exception as e:
-            print(f"❌ Error in isolated character refresh: {e}")
+            logger.error("❌ Error in isolated character refresh: %s", e)
 
 
     # 7. REMOVE/SIMPLIFY the _update_character_view_image_only method (no longer needed)
@@ -1671,193 +2306,155 @@ class MainApplication(QMainWindow):
             QMessageBox.warning(self, "No Character", "Please load a character first.")
             return
         
+        if self._export_worker is not None:
+            QMessageBox.information(self, "Export in Progress", "A character export is already running.")
+            return
+        
         # Use display_name for the suggested filename, but sanitize it
-        display_name = getattr(self.current_character, 'display_name', self.current_character.name)
-        safe_name = re.sub(r'[<>:"/\\|?*\s]', '_', display_name)
+        display_name = self.current_character.display_name
+        safe_name = _FILENAME_SANITIZE_RE.sub('_', display_name)
         
         # Select export location
         export_path, _ = QFileDialog.getSaveFileName(
             self, 
             "Export Character Package", 
-            f"{safe_name}.zip",
+            str(self._last_export_dir / f"{safe_name}.zip"),
             "ZIP files (*.zip)"
         )
         
         if export_path:
             try:
-                import zipfile
-                app_data_dir = get_app_data_dir()
                 # Use folder_name for the actual directory path
-                folder_name = getattr(self.current_character, 'folder_name', self.current_character.name)
-                char_dir = app_data_dir / "characters" / folder_name
+                folder_name = self.current_character.folder_name
+                char_dir = self._current_char_dir
                 
                 # IMPORTANT: Get interactions using CharacterManager
                 interactions = self.character_manager.get_interactions(folder_name)
                 
-                # Clean up temp files before export
-                for temp_file in char_dir.glob("temp_bg_*.png"):
-                    try:
-                        temp_file.unlink()
-                    except:
-                        pass
-                
-                with zipfile.ZipFile(export_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for file_path in char_dir.rglob('*'):
-                        if file_path.is_file():
-                            # Handle config.json specially to include ALL current fields
-                            if file_path.name == 'config.json' and file_path.parent == char_dir:
-                                # This is the main character config, not an interaction config
-                                # Read and modify config for export
-                                with open(file_path, 'r', encoding='utf-8') as f:
-                                    config_data = json.load(f)
-                                
-                                # Handle API config (clear for compatibility)
-                                original_api_config = None
-                                if 'api_config_name' in config_data:
-                                    original_api_config = config_data['api_config_name']
-                                    config_data['api_config_name'] = None
-                                
-                                # Ensure ALL current character fields are included
-                                char = self.current_character
-                                
-                                # Core fields
-                                config_data['folder_name'] = getattr(char, 'folder_name', char.name)
-                                config_data['display_name'] = getattr(char, 'display_name', char.name)
-                                config_data['base_image'] = getattr(char, 'base_image', '')
-                                config_data['personality'] = getattr(char, 'personality', '')
-                                
-                                # Bubble colors and transparency
-                                config_data['bubble_color'] = getattr(char, 'bubble_color', '#E3F2FD')
-                                config_data['user_bubble_color'] = getattr(char, 'user_bubble_color', '#F0F0F0')
-                                config_data['bubble_transparency'] = getattr(char, 'bubble_transparency', 0)
-                                config_data['user_bubble_transparency'] = getattr(char, 'user_bubble_transparency', 0)
-                                
-                                # Typography
-                                config_data['text_font'] = getattr(char, 'text_font', 'Arial')
-                                config_data['text_size'] = getattr(char, 'text_size', 11)
-
-                                
-                                # Text colors - ALL of them
-                                config_data['text_color'] = getattr(char, 'text_color', '#1976D2')
-                                config_data['user_text_color'] = getattr(char, 'user_text_color', '#333333')
-                                config_data['quote_color'] = getattr(char, 'quote_color', '#666666')
-                                config_data['emphasis_color'] = getattr(char, 'emphasis_color', '#0D47A1')
-                                config_data['strikethrough_color'] = getattr(char, 'strikethrough_color', '#757575')
-                                config_data['code_bg_color'] = getattr(char, 'code_bg_color', 'rgba(0,0,0,0.1)')
-                                config_data['code_text_color'] = getattr(char, 'code_text_color', '#D32F2F')
-                                config_data['link_color'] = getattr(char, 'link_color', '#1976D2')
-                                
-                                # Character-specific colors
-                                config_data['use_character_colors'] = getattr(char, 'use_character_colors', False)
-                                config_data['character_primary_color'] = getattr(char, 'character_primary_color', '')
-                                config_data['character_secondary_color'] = getattr(char, 'character_secondary_color', '')
-                                
-                                # External APIs - handle both dict and object formats
-                                if hasattr(char, 'external_apis') and char.external_apis:
-                                    exported_apis = []
-                                    for api in char.external_apis:
-                                        if hasattr(api, '__dict__'):
-                                            # It's an object, convert to dict
-                                            api_dict = {
-                                                'name': getattr(api, 'name', ''),
-                                                'url': getattr(api, 'url', ''),
-                                                'method': getattr(api, 'method', 'GET'),
-                                                'headers': getattr(api, 'headers', {}),
-                                                'params': getattr(api, 'params', {}),
-                                                'enabled': getattr(api, 'enabled', True),
-                                                'description': getattr(api, 'description', ''),
-                                                'timeout': getattr(api, 'timeout', 10),
-                                            }
-                                        else:
-                                            # Already a dict
-                                            api_dict = dict(api)
-                                        exported_apis.append(api_dict)
-                                    config_data['external_apis'] = exported_apis
-                                else:
-                                    config_data['external_apis'] = []
-                                
-                                # Handle character colors (preserve them)
-                                has_character_colors = (
-                                    config_data.get('use_character_colors', False) and
-                                    config_data.get('character_primary_color', '') and
-                                    config_data.get('character_secondary_color', '')
-                                )
-                                
-                                # Add export metadata for import processing
-                                config_data['_export_info'] = {
-                                    'exported_by': 'Character Chat System',
-                                    'export_date': datetime.now().isoformat(),
-                                    'original_api_config': original_api_config,
-                                    'has_character_colors': has_character_colors,
-                                    'character_colors_info': {
-                                        'primary': config_data.get('character_primary_color', ''),
-                                        'secondary': config_data.get('character_secondary_color', ''),
-                                        'enabled': config_data.get('use_character_colors', False)
-                                    } if has_character_colors else None,
-                                    'export_version': '1.1',  # Updated version
-                                    'has_interactions': len(interactions) > 0,  # NEW: Track interactions
-                                    'interactions_count': len(interactions),     # NEW: Count interactions
-                                    'notes': [
-                                        'API config cleared for compatibility',
-                                        'All character features preserved',
-                                        'Character colors preserved' if has_character_colors else 'No character colors',
-                                        f'External APIs: {len(config_data.get("external_apis", []))} included',
-                                        f'Interactions: {len(interactions)} included',  # NEW
-                                        'Typography settings preserved',
-                                        'Transparency settings preserved'
-                                    ]
-                                }
-                                
-                                # Write modified config to zip
-                                arcname = file_path.relative_to(char_dir)
-                                zipf.writestr(str(arcname), json.dumps(config_data, indent=2))
-                            else:
-                                # Regular file (including interaction files) - copy as-is
-                                arcname = file_path.relative_to(char_dir)
-                                zipf.write(file_path, arcname)
+                # Build the export config on the GUI thread; the worker only writes bytes
+                config_bytes = None
+                config_file = char_dir / 'config.json'
+                if config_file.is_file():
+                    # This is the main character config, not an interaction config
+                    # Read and modify config for export
+                    config_data = load_json_file(config_file)
+                    
+                    # Handle API config (clear for compatibility)
+                    original_api_config = None
+                    if 'api_config_name' in config_data:
+                        original_api_config = config_data['api_config_name']
+                        config_data['api_config_name'] = None
+                    
+                    # Ensure ALL current character fields are included, in one
+                    # pass over the dataclass fields (API config stays cleared)
+                    char = self.current_character
+                    config_data.update(
+                        (name, value) for name, value in char.to_dict().items()
+                        if name not in _EXPORT_EXCLUDED_FIELDS
+                    )
+                    
+                    # Handle character colors (preserve them)
+                    has_character_colors = (
+                        config_data.get('use_character_colors', False) and
+                        config_data.get('character_primary_color', '') and
+                        config_data.get('character_secondary_color', '')
+                    )
+                    
+                    # Add export metadata for import processing
+                    config_data['_export_info'] = {
+                        'exported_by': 'Character Chat System',
+                        'export_date': datetime.now().isoformat(),
+                        'original_api_config': original_api_config,
+                        'has_character_colors': has_character_colors,
+                        'character_colors_info': {
+                            'primary': config_data.get('character_primary_color', ''),
+                            'secondary': config_data.get('character_secondary_color', ''),
+                            'enabled': config_data.get('use_character_colors', False)
+                        } if has_character_colors else None,
+                        'export_version': '1.1',  # Updated version
+                        'has_interactions': len(interactions) > 0,  # NEW: Track interactions
+                        'interactions_count': len(interactions),     # NEW: Count interactions
+                        'notes': [
+                            'API config cleared for compatibility',
+                            'All character features preserved',
+                            'Character colors preserved' if has_character_colors else 'No character colors',
+                            f'External APIs: {len(config_data.get("external_apis", []))} included',
+                            f'Interactions: {len(interactions)} included',  # NEW
+                            'Typography settings preserved',
+                            'Transparency settings preserved'
+                        ]
+                    }
+                    
+                    config_bytes = dump_json_bytes(config_data, indent=True)
                 
                 # Enhanced success message with interactions info
-                success_msg = f"Character '{display_name}' exported successfully!"
+                success_parts = [f"Character '{display_name}' exported successfully!"]
                 
                 # Add API config info
-                if hasattr(self.current_character, 'api_config_name') and self.current_character.api_config_name:
-                    success_msg += f"\n\n📡 API Configuration: Cleared for compatibility"
+                if self.current_character.api_config_name:
+                    success_parts.append(f"\n📡 API Configuration: Cleared for compatibility")
                 
                 # Add character colors info
-                if (hasattr(self.current_character, 'use_character_colors') and 
-                    self.current_character.use_character_colors and
+                if (self.current_character.use_character_colors and
                     self.current_character.character_primary_color and
                     self.current_character.character_secondary_color):
-                    success_msg += f"\n\n🎨 Character Colors: Included in export"
-                    success_msg += f"\n   Primary: {self.current_character.character_primary_color}"
-                    success_msg += f"\n   Secondary: {self.current_character.character_secondary_color}"
+                    success_parts.append(f"\n🎨 Character Colors: Included in export")
+                    success_parts.append(f"   Primary: {self.current_character.character_primary_color}")
+                    success_parts.append(f"   Secondary: {self.current_character.character_secondary_color}")
                 else:
-                    success_msg += f"\n\n🎨 Character Colors: Using global colors"
+                    success_parts.append(f"\n🎨 Character Colors: Using global colors")
                 
                 # Add external APIs info
-                if hasattr(self.current_character, 'external_apis') and self.current_character.external_apis:
+                if self.current_character.external_apis:
                     api_count = len(self.current_character.external_apis)
-                    success_msg += f"\n\n🔗 External APIs: {api_count} included"
+                    success_parts.append(f"\n🔗 External APIs: {api_count} included")
                 
                 # Add interactions info - NEW
                 if interactions:
-                    success_msg += f"\n\n⚡ Interactions: {len(interactions)} included"
-                    for interaction in interactions[:3]:  # Show first 3
-                        success_msg += f"\n   • {interaction.name}"
+                    success_parts.append(f"\n⚡ Interactions: {len(interactions)} included")
+                    success_parts.extend(f"   • {i.name}" for i in interactions[:3])  # Show first 3
                     if len(interactions) > 3:
-                        success_msg += f"\n   ... and {len(interactions) - 3} more"
+                        success_parts.append(f"   ... and {len(interactions) - 3} more")
                 else:
-                    success_msg += f"\n\n⚡ Interactions: None"
+                    success_parts.append(f"\n⚡ Interactions: None")
                 
                 # Add typography info
-                success_msg += f"\n\n📝 Typography: All settings preserved"
-                success_msg += f"\n💫 Transparency: Bubble settings preserved"
+                success_parts.append(f"\n📝 Typography: All settings preserved")
+                success_parts.append(f"💫 Transparency: Bubble settings preserved")
+                
+                success_parts.append(f"\n💾 Exported to: {export_path}")
+                success_msg = "\n".join(success_parts)
                 
-                success_msg += f"\n\n💾 Exported to: {export_path}"
+                progress = QProgressDialog("Exporting character package...", "Cancel", 0, 0, self)
+                progress.setCancelButton(None)
+                progress.setWindowModality(Qt.WindowModal)
+                progress.show()
                 
-                QMessageBox.information(self, "Export Successful", success_msg)
+                def on_progress(done, total):
+                    progress.setMaximum(total)
+                    progress.setValue(done)
+                
+                def on_finished(path):
+                    self._export_worker = None
+                    self._last_export_dir = Path(path).parent
+                    progress.close()
+                    self._show_success("Export Successful", success_msg)
+                
+                def on_failed(error):
+                    self._export_worker = None
+                    progress.close()
+                    QMessageBox.critical(self, "Error", f"Export failed: {error}")
+                
+                # Compress on the thread pool so large packages don't freeze the UI
+                worker = CharacterExportWorker(char_dir, export_path, config_bytes)
+                worker.signals.progress.connect(on_progress)
+                worker.signals.finished.connect(on_finished)
+                worker.signals.failed.connect(on_failed)
+                self._export_worker = worker
+                QThreadPool.globalInstance().start(worker)
                 
             except Exception as e:
+                self._export_worker = None
                 QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
 
 
@@ -1885,7 +2482,7 @@ class MainApplication(QMainWindow):
         import_path, _ = QFileDialog.getOpenFileName(
             self,
             "Import Character Package",
-            "",
+            str(self._last_import_dir),
             "ZIP files (*.zip)"
         )
         
@@ -1902,23 +2499,27 @@ class MainApplication(QMainWindow):
                 display_name = dialog.display_name
                 color_choice = dialog.color_choice
                 
-                app_data_dir = get_app_data_dir()
-                char_dir = app_data_dir / "characters" / folder_name
+                char_dir = self._characters_root / folder_name
                 
                 if char_dir.exists():
                     QMessageBox.critical(self, "Error", "Character folder name already exists!")
                     return
                 
-                # Extract zip - this will include the interactions directory automatically
                 with zipfile.ZipFile(import_path, 'r') as zipf:
-                    zipf.extractall(char_dir)
+                    # Parse the main config straight from the archive so it is
+                    # read once and written once (after the fix-ups below)
+                    member_names = zipf.namelist()
+                    data = None
+                    if 'config.json' in member_names:
+                        with zipf.open('config.json') as cf:
+                            data = json.load(cf)
+                    
+                    # Extract everything else - this will include the interactions directory automatically
+                    zipf.extractall(char_dir, [name for name in member_names if name != 'config.json'])
                 
-                # Process and fix the config after extraction
+                # Process and fix the config
                 config_file = char_dir / "config.json"
-                if config_file.exists():
-                    with open(config_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
+                if data is not None:
                     # Store original export info
                     export_info = data.get('_export_info', {})
                     has_character_colors = export_info.get('has_character_colors', False)
@@ -1953,29 +2554,9 @@ class MainApplication(QMainWindow):
                         print(f"✅ Set to use global colors")
                     
                     # Add any missing fields with current defaults
-                    missing_fields = {
-                        'bubble_transparency': 0,
-                        'user_bubble_transparency': 0,
-                        'text_font': 'Arial',
-                        'text_size': 11,
-                        'text_color': '#1976D2',
-                        'user_text_color': '#333333',
-                        'quote_color': '#666666',
-                        'emphasis_color': '#0D47A1',
-                        'strikethrough_color': '#757575',
-                        'code_bg_color': 'rgba(0,0,0,0.1)',
-                        'code_text_color': '#D32F2F',
-                        'link_color': '#1976D2',
-                        'bubble_color': '#E3F2FD',
-                        'user_bubble_color': '#F0F0F0',
-                        'external_apis': [],
-                    }
-                    
-                    # Add missing fields
-                    for field, default_value in missing_fields.items():
-                        if field not in data:
-                            data[field] = default_value
-                            print(f"✅ Added missing field: {field}")
+                    for field_name, default_value in _IMPORT_DEFAULT_FIELDS.items():
+                        data.setdefault(field_name, default_value)
+                    data.setdefault('external_apis', [])
                     
                     # Handle external APIs - ensure proper format
                     if 'external_apis' in data and data['external_apis']:
@@ -2003,6 +2584,7 @@ class MainApplication(QMainWindow):
                         del data['_export_info']
                     
                     # Save the cleaned config
+                    char_dir.mkdir(parents=True, exist_ok=True)
                     with open(config_file, 'w', encoding='utf-8') as f:
                         json.dump(data, f, indent=2)
                     
@@ -2010,61 +2592,60 @@ class MainApplication(QMainWindow):
                     interactions_dir = char_dir / "interactions"
                     imported_interactions = []
                     if interactions_dir.exists():
-                        for interaction_folder in interactions_dir.iterdir():
-                            if interaction_folder.is_dir():
-                                interaction_config = interaction_folder / "config.json"
-                                if interaction_config.exists():
-                                    try:
-                                        with open(interaction_config, 'r', encoding='utf-8') as f:
-                                            interaction_data = json.load(f)
-                                            imported_interactions.append(interaction_data.get('name', interaction_folder.name))
-                                    except:
-                                        imported_interactions.append(interaction_folder.name)
+                        interaction_configs = [
+                            folder / "config.json" for folder in interactions_dir.iterdir()
+                            if folder.is_dir() and (folder / "config.json").exists()
+                        ]
+                        # Overlap the file reads for characters with many interactions
+                        with ThreadPoolExecutor(max_workers=4) as executor:
+                            imported_interactions = list(executor.map(_read_interaction_name, interaction_configs))
                     
                     # Enhanced success message
-                    success_msg = f"Character '{display_name}' imported successfully!"
+                    success_parts = [f"Character '{display_name}' imported successfully!"]
                     
                     # API config info
                     if original_api_config:
-                        success_msg += f"\n\n📡 API: Original config '{original_api_config}' was cleared"
-                        success_msg += f"\n   You can set a new API config in the API menu"
+                        success_parts.append(f"\n📡 API: Original config '{original_api_config}' was cleared")
+                        success_parts.append(f"   You can set a new API config in the API menu")
                     
                     # Character colors info
                     if color_choice == "preserve" and has_character_colors:
-                        success_msg += f"\n\n🎨 Colors: Character colors preserved"
-                        success_msg += f"\n   Primary: {original_colors.get('primary', 'Unknown')}"
-                        success_msg += f"\n   Secondary: {original_colors.get('secondary', 'Unknown')}"
+                        success_parts.append(f"\n🎨 Colors: Character colors preserved")
+                        success_parts.append(f"   Primary: {original_colors.get('primary', 'Unknown')}")
+                        success_parts.append(f"   Secondary: {original_colors.get('secondary', 'Unknown')}")
                     elif has_character_colors:
-                        success_msg += f"\n\n🎨 Colors: Using your global colors instead"
-                        success_msg += f"\n   Original colors were discarded by your choice"
+                        success_parts.append(f"\n🎨 Colors: Using your global colors instead")
+                        success_parts.append(f"   Original colors were discarded by your choice")
                     else:
-                        success_msg += f"\n\n🎨 Colors: Using your global colors"
-                        success_msg += f"\n   Character had no custom colors"
+                        success_parts.append(f"\n🎨 Colors: Using your global colors")
+                        success_parts.append(f"   Character had no custom colors")
                     
                     # External APIs info
                     if 'external_apis' in data and data['external_apis']:
                         api_count = len(data['external_apis'])
-                        success_msg += f"\n\n🔗 External APIs: {api_count} imported and configured"
+                        success_parts.append(f"\n🔗 External APIs: {api_count} imported and configured")
                     else:
-                        success_msg += f"\n\n🔗 External APIs: None found"
+                        success_parts.append(f"\n🔗 External APIs: None found")
                     
                     # NEW: Interactions info
                     if imported_interactions:
-                        success_msg += f"\n\n⚡ Interactions: {len(imported_interactions)} imported"
-                        for interaction_name in imported_interactions[:3]:  # Show first 3
-                            success_msg += f"\n   • {interaction_name}"
+                        success_parts.append(f"\n⚡ Interactions: {len(imported_interactions)} imported")
+                        success_parts.extend(f"   • {n}" for n in imported_interactions[:3])  # Show first 3
                         if len(imported_interactions) > 3:
-                            success_msg += f"\n   ... and {len(imported_interactions) - 3} more"
+                            success_parts.append(f"   ... and {len(imported_interactions) - 3} more")
                     elif has_interactions:
-                        success_msg += f"\n\n⚡ Interactions: Expected {interactions_count} but found 0"
-                        success_msg += f"\n   ⚠️ Interactions may not have imported correctly"
+                        success_parts.append(f"\n⚡ Interactions: Expected {interactions_count} but found 0")
+                        success_parts.append(f"   ⚠️ Interactions may not have imported correctly")
                     else:
-                        success_msg += f"\n\n⚡ Interactions: None found in package"
+                        success_parts.append(f"\n⚡ Interactions: None found in package")
                     
-                    success_msg += f"\n\n📝 All typography and visual settings preserved"
+                    success_parts.append(f"\n📝 All typography and visual settings preserved")
+                    success_msg = "\n".join(success_parts)
                     
-                    QMessageBox.information(self, "Import Successful", success_msg)
+                    self._show_success("Import Successful", success_msg)
                 
+                self.character_manager.invalidate(folder_name)
+                self._last_import_dir = Path(import_path).parent
                 self._update_characters_menu()
                 
             except Exception as e:
@@ -2084,29 +2665,31 @@ class MainApplication(QMainWindow):
         if not self.current_character:
             return
         
+        if self._rename_worker is not None:
+            QMessageBox.information(self, "Rename in Progress", "A character rename is already running.")
+            return
+        
         dialog = CharacterNameEditDialog(self, self.current_character)
         if dialog.exec() and dialog.result:
             result = dialog.result
             
             # Show warning if folder name is changing
             if result["folder_changed"]:
-                reply = QMessageBox.question(
-                    self, 
+                if not self._confirm(
                     "Confirm Folder Rename",
                     "Changing the folder name will move all character files.\n"
                     "A backup will be created for safety.\n"
-                    "This may take a moment. Continue?",
-                    QMessageBox.Yes | QMessageBox.No
-                )
-                if reply != QMessageBox.Yes:
+                    "This may take a moment. Continue?"
+                ):
                     return
             
             # Show progress dialog for folder operations
+            progress = None
             if result["folder_changed"]:
                 progress = QProgressDialog("Renaming character folder safely...", "Cancel", 0, 0, self)
+                progress.setCancelButton(None)
                 progress.setWindowModality(Qt.WindowModal)
                 progress.show()
-                QApplication.processEvents()
             
             # SAFE: Close any open chat window for this character BEFORE renaming
             old_name = self.current_character.folder_name
@@ -2123,52 +2706,61 @@ class MainApplication(QMainWindow):
                     del self.chat_windows[old_name]
                     print(f"🗑️ Removed {old_name} from chat_windows tracking")
             
-            # Perform the rename
-            success = self.character_manager.rename_character(
-                self.current_character.folder_name,
+            def on_done(success):
+                self._rename_worker = None
+                if progress is not None:
+                    progress.close()
+                
+                self._display_name_cache.pop(old_name, None)
+                self._display_name_cache.pop(result["folder_name"], None)
+                
+                if success:
+                    # Reload the character with new name
+                    self._load_character(result["folder_name"])
+                    self._update_characters_menu()
+                    
+                    QMessageBox.information(self, "Success", 
+                        f"✅ Character successfully renamed!\n"
+                        f"📁 Folder: {result['folder_name']}\n"
+                        f"📝 Display: {result['display_name']}")
+                else:
+                    QMessageBox.critical(self, "Error", 
+                        "❌ Failed to rename character.\n"
+                        "All original files have been preserved.\n"
+                        "Check the console for details.")
+            
+            # Perform the rename off the GUI thread (copies the whole folder)
+            worker = CharacterRenameWorker(
+                self.character_manager,
+                old_name,
                 result["folder_name"],
                 result["display_name"]
             )
-            
-            if result["folder_changed"]:
-                progress.close()
-            
-            if success:
-                # Reload the character with new name
-                self._load_character(result["folder_name"])
-                self._update_characters_menu()
-                
-                QMessageBox.information(self, "Success", 
-                    f"✅ Character successfully renamed!\n"
-                    f"📁 Folder: {result['folder_name']}\n"
-                    f"📝 Display: {result['display_name']}")
-            else:
-                QMessageBox.critical(self, "Error", 
-                    "❌ Failed to rename character.\n"
-                    "All original files have been preserved.\n"
-                    "Check the console for details.")
+            worker.signals.finished.connect(on_done)
+            self._rename_worker = worker
+            QThreadPool.globalInstance().start(worker)
 
 
     # 2. In MainApplication class (around line 3500):
     def mousePressEvent(self, event):
         """Handle mouse press for window dragging"""
+        global_pt = event.globalPosition().toPoint()
+        
         if event.button() == Qt.LeftButton:
             # Check if click is on title bar
             if event.position().y() <= 30:
-                self.drag_position = event.globalPosition().toPoint() - self.pos()
+                self.drag_position = global_pt - self.pos()
         
         # Check if click is on character
         if self.current_character and not self.editor_mode:
-            view_pos = self.character_view.mapFromGlobal(event.globalPosition().toPoint())
-            scene_pos = self.character_view.mapToScene(view_pos)
+            view_pos = self.character_view.mapFromGlobal(global_pt)
             
-            # Check interaction icons first
-            for icon in self.interaction_icons:
-                if icon.geometry().contains(view_pos):
-                    return
+            # Check interaction icons first (Qt's native child hit-test)
+            if self.character_view.childAt(view_pos) in self._interaction_icon_set:
+                return
             
             # Check if click is within character bounds
-            if self.scene.sceneRect().contains(scene_pos):
+            if self.scene.sceneRect().contains(self.character_view.mapToScene(view_pos)):
                 self._open_or_focus_chat()
     
     def mouseMoveEvent(self, event):
@@ -2202,12 +2794,8 @@ class MainApplication(QMainWindow):
         try:
             self.always_on_top = not self.always_on_top
             
-            if self.always_on_top:
-                # Set window to stay on top
-                self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
-            else:
-                # Remove stay on top flag
-                self.setWindowFlags(self.windowFlags() & ~Qt.WindowStaysOnTopHint)
+            # Flip only the stay-on-top bit
+            self.setWindowFlag(Qt.WindowStaysOnTopHint, self.always_on_top)
             
             # Always show after changing flags
             self.show()
@@ -2227,12 +2815,14 @@ class MainApplication(QMainWindow):
 
     def _keep_window_on_top(self):
         """Keep main application window on top by raising it when needed"""
-        if (self.always_on_top and 
-            self.isVisible() and 
-            not self.isMinimized() and 
-            QApplication.activeWindow() != self):
-            
-            self.raise_()
+        # Cheapest checks first - bail out before touching the window system
+        if not self.always_on_top:
+            return
+        if self.windowState() & Qt.WindowMinimized:
+            return
+        if not self.isVisible() or QApplication.activeWindow() is self:
+            return
+        self.raise_()
 
     def _minimize_window(self):
         """Minimize the main application window"""
@@ -2263,18 +2853,18 @@ class MainApplication(QMainWindow):
             self.characters_menu.addAction("(No characters)").setEnabled(False)
         else:
             for folder_name in characters:
-                # Load character to get display name
-                character = self.character_manager.load_character(folder_name)
-                if character:
-                    display_name = getattr(character, 'display_name', character.name)
-                    menu_text = f"{display_name}"
-                    if display_name != folder_name:
-                        menu_text += f" ({folder_name})"
-                    
-                    self.characters_menu.addAction(menu_text, lambda c=folder_name: self._load_character(c))
+                # Display names are cached; only load characters not seen yet
+                display_name = self._display_name_cache.get(folder_name)
+                if display_name is None:
+                    character = self.character_manager.load_character(folder_name)
+                    if character:
+                        display_name = self._display_name_cache[folder_name] = character.display_name
+                # Fall back to the folder name if the character can't be loaded
+                if display_name and display_name != folder_name:
+                    menu_text = f"{display_name} ({folder_name})"
                 else:
-                    # Fallback if character can't be loaded
-                    self.characters_menu.addAction(folder_name, lambda c=folder_name: self._load_character(c))
+                    menu_text = folder_name
+                self.characters_menu.addAction(menu_text, lambda c=folder_name: self._load_character(c))
     
     def _new_character(self):
         """Create a new character"""
@@ -2309,8 +2899,7 @@ class MainApplication(QMainWindow):
             # Character colors disabled - use global colors
             print("ℹ️ Using global colors")
         
-        # Trigger UI update without changing global color storage
-        self.update_colors()
+        # The UI update itself is scheduled by the caller (see _load_character)
 
     def _open_character_colors(self):
         """Open character color customization dialog"""
@@ -2329,50 +2918,36 @@ class MainApplication(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to load character '{name}'")
             return
         
-        # Temporarily disconnect color signals to prevent spam
-        if hasattr(self, 'current_character') and self.current_character:
-            try:
-                app_colors.colors_changed.disconnect(self.update_colors)
-            except:
-                pass
-        
-        self.current_character = character
-        
-        # Clear existing interactions
-        self._clear_interactions()
-        
-        # Load animation
-        width, height = self.animator.load_animation(character.base_image)
-        
-        # Store dimensions
-        self.current_image_width = width
-        self.current_image_height = height
-        
-        # Update window size
-        self._update_window_size()
-        
-        # Start animation
-        self.animator.start_animation()
-        
-        # Load interactions
-        self._load_interactions()
-        
-        # Apply character colors once
-        self._apply_character_colors()
-        
-        # Reconnect color signal
-        app_colors.colors_changed.connect(self.update_colors)
+        # Block color signals while loading to prevent spam
+        with QSignalBlocker(app_colors):
+            self.current_character = character
+            
+            # Clear existing interactions
+            self._clear_interactions()
+            
+            # Load animation
+            width, height = self.animator.load_animation(character.base_image)
+            self._last_char_sig = self._get_base_image_signature(character.base_image)
+            
+            # Store dimensions
+            self.current_image_width = width
+            self.current_image_height = height
+            
+            # Update window size
+            self._update_window_size()
+            
+            # Start animation
+            self.animator.start_animation()
+            
+            # Load interactions
+            self._load_interactions()
+            
+            # Apply character colors once
+            self._apply_character_colors()
         
         # Enable menu items
-        self.add_interaction_action.setEnabled(True)
-        self.edit_image_action.setEnabled(True)
-        self.edit_personality_action.setEnabled(True)
-        self.edit_names_action.setEnabled(True)
-        self.character_colors_action.setEnabled(True)
-        self.editor_mode_action.setEnabled(True)
-        self.delete_character_action.setEnabled(True)
-        self.export_character_action.setEnabled(True)
-        self.external_apis_action.setEnabled(True)
+        for action in self._character_dependent_actions:
+            action.setEnabled(True)
         
         self._save_state()
         
@@ -2419,13 +2994,16 @@ class MainApplication(QMainWindow):
             
             # Update chat windows
             if hasattr(self, 'chat_windows'):
-                for name, window in list(self.chat_windows.items()):
+                stale = []
+                for name, window in self.chat_windows.items():
                     try:
                         if window and hasattr(window, 'update_colors'):
                             window.update_colors()
                     except (RuntimeError, AttributeError):
-                        if name in self.chat_windows:
-                            del self.chat_windows[name]
+                        stale.append(name)
+                # Drop dead windows after the loop so the dict isn't resized mid-iteration
+                for name in stale:
+                    self.chat_windows.pop(name, None)
             
         except Exception as e:
             print(f"Error applying colors to UI: {e}")
@@ -2448,12 +3026,22 @@ class MainApplication(QMainWindow):
         # Update scene size
         self.scene.setSceneRect(0, 0, self.current_image_width, self.current_image_height)
         self.character_view.setFixedSize(self.current_image_width, self.current_image_height)
+        self._interaction_container.setGeometry(0, 0, self.current_image_width, self.current_image_height)
+    
+    def _new_interaction_container(self) -> QWidget:
+        """Create the transparent overlay that parents all interaction icons"""
+        container = QWidget(self.character_view)
+        container.setStyleSheet("background: transparent;")  # Don't inherit the view's opaque background
+        container.setGeometry(0, 0, self.current_image_width, self.current_image_height)
+        container.show()
+        return container
     
     def _clear_interactions(self):
-        """Clear all interaction icons"""
-        for icon in self.interaction_icons:
-            icon.deleteLater()
+        """Clear all interaction icons - one deferred delete for the whole container"""
+        self._interaction_container.deleteLater()
+        self._interaction_container = self._new_interaction_container()
         self.interaction_icons.clear()
+        self._interaction_icon_set.clear()
     
     def _load_interactions(self):
         """Load and display character interactions"""
@@ -2462,16 +3050,19 @@ class MainApplication(QMainWindow):
             
         interactions = self.character_manager.get_interactions(self.current_character.name)
         
-        for interaction in interactions:
-            self._create_interaction_icon(interaction)
+        # Size the icon list once, then fill it by index
+        self.interaction_icons = [None] * len(interactions)
+        for index, interaction in enumerate(interactions):
+            self._create_interaction_icon(index, interaction)
     
-    def _create_interaction_icon(self, interaction: Interaction):
-        """Create an interaction icon"""
-        icon = InteractionIcon(self.character_view, interaction, self.editor_mode)
+    def _create_interaction_icon(self, index: int, interaction: Interaction):
+        """Create an interaction icon in slot `index` of interaction_icons"""
+        icon = InteractionIcon(self._interaction_container, interaction, self.editor_mode)
         icon.clicked.connect(lambda i: self._run_interaction(i))
         icon.position_updated.connect(self._handle_interaction_position_update)
         icon.context_menu_requested.connect(self._handle_interaction_context_menu)
-        self.interaction_icons.append(icon)
+        self.interaction_icons[index] = icon
+        self._interaction_icon_set.add(icon)
         icon.show()
     
     def _handle_interaction_position_update(self, interaction: Interaction, event_type: str):
@@ -2490,11 +3081,8 @@ class MainApplication(QMainWindow):
         try:
             print("Forcing interaction cleanup")
             
-            # Stop and cleanup any existing timer
-            if self.current_interaction_timer:
-                self.current_interaction_timer.stop()
-                self.current_interaction_timer.deleteLater()
-                self.current_interaction_timer = None
+            # Stop any pending return timer
+            self._interaction_return_timer.stop()
             
             # Reset flags
             self.interaction_in_progress = False
@@ -2533,18 +3121,15 @@ class MainApplication(QMainWindow):
 
             except (RuntimeError, AttributeError) as e:
                 print(f"Chat window no longer valid: {e}")
-                del self.chat_windows[char_name]
+                self.chat_windows.pop(char_name, None)
 
 
 
     def _restore_original_animation(self):
         """Restore original character animation seamlessly"""
         try:
-            # Clean up timer
-            if self.current_interaction_timer:
-                self.current_interaction_timer.stop()
-                self.current_interaction_timer.deleteLater()
-                self.current_interaction_timer = None
+            # Stop timer in case this was called directly
+            self._interaction_return_timer.stop()
             
             # Reset state
             self.interaction_in_progress = False
@@ -2566,7 +3151,9 @@ class MainApplication(QMainWindow):
         dialog = InteractionEditDialog(self)
         if dialog.exec():
             if self.character_manager.save_interaction(self.current_character.name, dialog.result):
-                self._load_character(self.current_character.name)
+                # Only the icons changed - no need to reload the whole character
+                self._clear_interactions()
+                self._load_interactions()
                 QMessageBox.information(self, "Success", "Interaction added successfully!")
             else:
                 QMessageBox.critical(self, "Error", "Failed to add interaction.")
@@ -2580,18 +3167,22 @@ class MainApplication(QMainWindow):
         dialog = InteractionEditDialog(self, interaction)
         if dialog.exec() and dialog.result:
             try:
+                # Decoded frames only go stale when the animation itself changes
+                image_changed = dialog.result.base_image_path != original_base_image
+                
                 # Clear animation cache BEFORE saving
                 print("🧹 Clearing animation cache before saving interaction...")
                 
-                # Clear cache for the old interaction
+                # Clear cache for the old interaction (its folder key may be renamed)
                 self.animator.clear_interaction_cache(self.current_character.name, original_name)
                 
-                # Also clear any cache for the specific image path
-                if original_base_image and os.path.exists(original_base_image):
-                    self.animator.clear_animation_cache(original_base_image)
-                
-                # Clear Qt's pixmap cache too
-                QPixmapCache.clear()
+                if image_changed:
+                    # Also clear any cache for the specific image path
+                    if original_base_image and os.path.exists(original_base_image):
+                        self.animator.clear_animation_cache(original_base_image)
+                    
+                    # Clear Qt's pixmap cache too
+                    QPixmapCache.clear()
                 
                 # If name changed, handle the transition carefully
                 if original_name != dialog.result.name:
@@ -2612,11 +3203,12 @@ class MainApplication(QMainWindow):
                         return
                 
                 # IMPORTANT: Clear cache for the NEW interaction too
-                print("🧹 Clearing cache for new interaction data...")
-                self.animator.clear_interaction_cache(self.current_character.name, dialog.result.name)
+                if image_changed:
+                    print("🧹 Clearing cache for new interaction data...")
+                    self.animator.clear_interaction_cache(self.current_character.name, dialog.result.name)
                 
                 # Force refresh the interaction if it's currently displayed
-                if hasattr(self, '_original_image_path') and self._original_image_path:
+                if image_changed and self._original_image_path:
                     try:
                         # Get the updated interaction
                         updated_interactions = self.character_manager.get_interactions(self.current_character.name)
@@ -2624,9 +3216,7 @@ class MainApplication(QMainWindow):
                         
                         if updated_interaction and updated_interaction.base_image_path:
                             # If this interaction's base image is currently showing, force reload
-                            if (hasattr(self, 'current_interaction_timer') and 
-                                self.current_interaction_timer and 
-                                self.current_interaction_timer.isActive()):
+                            if self._interaction_return_timer.isActive():
                                 print("🔄 Interaction currently active - forcing reload of new image")
                                 self.animator.force_reload_animation(updated_interaction.base_image_path)
                                 
@@ -2634,7 +3224,7 @@ class MainApplication(QMainWindow):
                         print(f"⚠️ Could not force reload current interaction: {e}")
                 
                 # Use the new refresh method instead of full reload
-                self.refresh_interaction_animations(dialog.result.name)
+                self.refresh_interaction_animations(dialog.result.name, clear_caches=image_changed)
                 QMessageBox.information(self, "Success", "Interaction updated successfully! No restart needed.")
                 
             except Exception as e:
@@ -2644,13 +3234,16 @@ class MainApplication(QMainWindow):
 
     def _delete_interaction(self, interaction: Interaction):
         """Delete an interaction"""
-        reply = QMessageBox.question(self, "Delete Interaction", 
-                                   f"Are you sure you want to delete '{interaction.name}'?",
-                                   QMessageBox.Yes | QMessageBox.No)
-        
-        if reply == QMessageBox.Yes:
+        if self._confirm("Delete Interaction", f"Are you sure you want to delete '{interaction.name}'?"):
             if self.character_manager.delete_interaction(self.current_character.name, interaction.name):
-                self._load_character(self.current_character.name)
+                # Return to the base animation if the deleted interaction is playing
+                if (self._interaction_return_timer.isActive() and
+                        self.animator.current_image_path == interaction.base_image_path):
+                    self._restore_original_animation()
+                
+                # Only the icons changed - no need to reload the whole character
+                self._clear_interactions()
+                self._load_interactions()
                 QMessageBox.information(self, "Success", "Interaction deleted successfully!")
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete interaction.")
@@ -2686,12 +3279,13 @@ class MainApplication(QMainWindow):
         filename, _ = QFileDialog.getOpenFileName(
             self,
             "Select New Character Image",
-            "",
-            "Image files (*.gif *.png *.jpg *.jpeg);;All files (*.*)"
+            str(self._last_image_dir),
+            self.IMAGE_FILTER
         )
         
         if filename:
             print(f"🖼️ Updating character image to: {filename}")
+            self._last_image_dir = Path(filename).parent
             
             # Use the SAFE update method
             if self.character_manager.update_character_image(self.current_character.name, filename):
@@ -2755,14 +3349,13 @@ class MainApplication(QMainWindow):
             self.current_character.personality = new_personality
             
             # Save to file
-            app_data_dir = get_app_data_dir()
-            char_dir = app_data_dir / "characters" / getattr(self.current_character, 'folder_name', self.current_character.name)
+            char_dir = self._current_char_dir
             with open(char_dir / "personality.txt", 'w', encoding='utf-8') as f:
                 f.write(new_personality)
             
             # Update config
-            with open(char_dir / "config.json", 'w', encoding='utf-8') as f:
-                json.dump(asdict(self.current_character), f, indent=2)
+            dump_json_file(self.current_character.to_dict(), char_dir / "config.json", indent=True)
+            self.character_manager.invalidate(self.current_character.folder_name)
             
             QMessageBox.information(self, "Success", "Personality updated successfully!")
             dialog.accept()
@@ -2772,38 +3365,34 @@ class MainApplication(QMainWindow):
         if not self.current_character:
             return
             
-        reply = QMessageBox.question(self, "Delete Character", 
-                                f"Are you sure you want to delete '{self.current_character.name}'?",
-                                QMessageBox.Yes | QMessageBox.No)
-        
-        if reply == QMessageBox.Yes:
+        if self._confirm("Delete Character", f"Are you sure you want to delete '{self.current_character.name}'?"):
             # Close chat window if open
             char_name = self.current_character.name  # Store the name first
             if char_name in self.chat_windows:
                 try:
                     self.chat_windows[char_name].close()
                     del self.chat_windows[char_name]
-                    print(f"Closed and removed chat window for {char_name}")
+                    logger.debug("Closed and removed chat window for %s", char_name)
                 except (KeyError, RuntimeError):
                     # Window might already be closed/removed
-                    print(f"Chat window for {char_name} was already removed")
+                    logger.debug("Chat window for %s was already removed", char_name)
             
             # Clean up any temp files for this character
             try:
-                app_data_dir = get_app_data_dir()
-                char_dir = app_data_dir / "characters" / char_name
-                for temp_file in char_dir.glob("temp_bg_*.png"):
-                    temp_file.unlink()
-                
-                # Clean up profile selection file
-                profile_file = char_dir / "selected_profile.json"
-                if profile_file.exists():
-                    profile_file.unlink()
+                char_dir = os.path.join(self._characters_root, char_name)
+                remove_temp_backgrounds(char_dir)
+                
+                # Clean up profile selection file (one unlink instead of stat + unlink)
+                try:
+                    os.unlink(os.path.join(char_dir, "selected_profile.json"))
+                except FileNotFoundError:
+                    pass
                     
             except Exception as e:
                 print(f"Error during cleanup: {e}")
             
             # Delete character
+            self._display_name_cache.pop(char_name, None)
             if self.character_manager.delete_character(char_name):
                 self.animator.stop_animation()
                 self.scene.clear()
@@ -2811,13 +3400,8 @@ class MainApplication(QMainWindow):
                 self.current_character = None
                 
                 # Disable menu items
-                self.add_interaction_action.setEnabled(False)
-                self.edit_image_action.setEnabled(False)
-                self.edit_personality_action.setEnabled(False)
-                self.edit_names_action.setEnabled(False)
-                self.editor_mode_action.setEnabled(False)
-                self.delete_character_action.setEnabled(False)
-                self.export_character_action.setEnabled(False) 
+                for action in self._character_dependent_actions:
+                    action.setEnabled(False)
                 
                 self._update_characters_menu()
                 self._save_state()
@@ -2838,32 +3422,22 @@ class MainApplication(QMainWindow):
             
         char_name = self.current_character.name
         
-        # Check if window exists and is still valid
-        if char_name in self.chat_windows:
-            chat_window = self.chat_windows[char_name]
-            
-            # Check if window still exists and is valid
-            try:
-                # Test if the window object still exists
-                if chat_window.isVisible():
-                    # Window is visible, bring to front
-                    chat_window.raise_()
-                    chat_window.activateWindow()
-                    return
-                elif hasattr(chat_window, 'minimize_bar') and chat_window.minimize_bar and chat_window.minimize_bar.isVisible():
-                    # Window is minimized, restore it
-                    chat_window._restore_window()
-                    return
-                else:
-                    # Window exists but is hidden, show it
-                    chat_window.show()
-                    chat_window.raise_()
-                    chat_window.activateWindow()
-                    return
-            except (RuntimeError, AttributeError):
-                # Window was destroyed, remove from tracking
-                print(f"Removing invalid chat window for {char_name}")
-                del self.chat_windows[char_name]
+        # Destroyed windows are already gone from the weak mapping
+        chat_window = self.chat_windows.get(char_name)
+        if chat_window is not None:
+            if chat_window.isVisible():
+                # Window is visible, bring to front
+                chat_window.raise_()
+                chat_window.activateWindow()
+            elif getattr(chat_window, 'minimize_bar', None) and chat_window.minimize_bar.isVisible():
+                # Window is minimized, restore it
+                chat_window._restore_window()
+            else:
+                # Window exists but is hidden, show it
+                chat_window.show()
+                chat_window.raise_()
+                chat_window.activateWindow()
+            return
         
         # Create new window
         self._create_new_chat_window(None)
@@ -2875,51 +3449,31 @@ class MainApplication(QMainWindow):
             return
             
         char_name = self.current_character.name
-        print(f"Creating new chat window for {char_name}")
+        logger.debug("Creating new chat window for %s", char_name)
         
         # Remove any existing reference
         if char_name in self.chat_windows:
-            print(f"Removing existing window reference for {char_name}")
+            logger.debug("Removing existing window reference for %s", char_name)
             del self.chat_windows[char_name]
         
         # 🔧 LOAD FRESH CHARACTER DATA BEFORE CREATING WINDOW
         fresh_character = self.character_manager.load_character(char_name)
         if fresh_character:
             self.current_character = fresh_character
-            print(f"🎨 Pre-loaded character colors: use_colors={getattr(fresh_character, 'use_character_colors', False)}")
-            
-            if (hasattr(fresh_character, 'use_character_colors') and 
-                fresh_character.use_character_colors and
-                hasattr(fresh_character, 'character_primary_color') and
-                hasattr(fresh_character, 'character_secondary_color')):
-                print(f"🎨 Character colors: {fresh_character.character_primary_color}, {fresh_character.character_secondary_color}")
-            else:
-                print(f"🎨 Will use global colors: {app_colors.PRIMARY}, {app_colors.SECONDARY}")
+            logger.debug("🎨 Pre-loaded character colors: %s", fresh_character.resolved_colors)
         
         # Create new window with pre-loaded character data
         chat_window = ChatWindow(self, self.current_character, self.ai_interface, scheduled_reminder)
-        self.chat_windows[char_name] = chat_window
+        self._track_chat_window(char_name, chat_window)
         
-        print(f"Chat window created and tracked for {char_name}")
+        logger.debug("Chat window created and tracked for %s", char_name)
         chat_window.show()
         return chat_window
     
     def _initialize_character_colors(self):
         """Initialize character colors on window creation - NEW METHOD"""
         try:
-            print(f"🎨 Initializing colors for chat window: {self.character.display_name}")
-            
-            # Check if character has specific colors
-            if (hasattr(self.character, 'use_character_colors') and 
-                self.character.use_character_colors and
-                hasattr(self.character, 'character_primary_color') and
-                hasattr(self.character, 'character_secondary_color') and
-                self.character.character_primary_color and
-                self.character.character_secondary_color):
-                
-                print(f"🎨 Using character colors: {self.character.character_primary_color}, {self.character.character_secondary_color}")
-            else:
-                print(f"🎨 Using global colors: {app_colors.PRIMARY}, {app_colors.SECONDARY}")
+            print(f"🎨 Initializing colors for chat window: {self.character.display_name} {self.character.resolved_colors}")
             
             # Trigger color update to apply the correct colors
             self.update_colors()
@@ -2933,8 +3487,12 @@ class MainApplication(QMainWindow):
 
 
 
-    def _save_state(self):
-        """Save application state including menu toggle state"""
+    def _save_state(self, delay_ms: int = 300):
+        """Save application state after a short delay - repeated requests coalesce into one write"""
+        self._save_state_timer.start(delay_ms)
+
+    def _do_save_state(self, background: bool = False):
+        """Write application state including menu toggle state (optionally on the thread pool)"""
         state = {
             "geometry": {
                 "x": self.x(),
@@ -2944,25 +3502,31 @@ class MainApplication(QMainWindow):
             },
             "always_on_top": self.always_on_top,
             "current_character": self.current_character.name if self.current_character else None,
-            "menu_visible": self.menu_visible  # Add this line to save menu state
+            "menu_visible": self.menu_visible,  # Add this line to save menu state
+            "last_export_dir": str(self._last_export_dir),
+            "last_import_dir": str(self._last_import_dir),
+            "last_image_dir": str(self._last_image_dir)
         }
         
+        # Nothing changed since the last write (e.g. closeEvent right after a delete)
+        if state == self._last_saved_state:
+            return
+        
         try:
-            app_data_dir = get_app_data_dir()
-            state_file = app_data_dir / "app_state.json"
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            if background:
+                # Not remembered as saved - the pool write may still fail
+                payload = dump_json_bytes(state, indent=True)
+                QThreadPool.globalInstance().start(FileWriteWorker(payload, self._state_file))
+            else:
+                dump_json_file(state, self._state_file, indent=True)
+                self._last_saved_state = state
         except Exception as e:
             print(f"Error saving state: {e}")
 
     def _load_state(self):
         """Load application state including menu toggle state"""
         try:
-            app_data_dir = get_app_data_dir()
-            state_file = app_data_dir / "app_state.json"
-            
-            with open(state_file, 'r') as f:
-                state = json.load(f)
+            state = load_json_file(self._state_file)
                 
             if "geometry" in state:
                 self.move(state["geometry"]["x"], state["geometry"]["y"])
@@ -2978,6 +3542,13 @@ class MainApplication(QMainWindow):
                 self.menu_visible = state["menu_visible"]
                 # Apply the menu state after UI is loaded
                 QTimer.singleShot(150, self._apply_saved_menu_state)
+            
+            # Restore last export/import/image folders if they still exist
+            for key, attr in (("last_export_dir", "_last_export_dir"),
+                              ("last_import_dir", "_last_import_dir"),
+                              ("last_image_dir", "_last_image_dir")):
+                if state.get(key) and os.path.isdir(state[key]):
+                    setattr(self, attr, Path(state[key]))
                 
         except FileNotFoundError:
             pass
@@ -2994,54 +3565,41 @@ class MainApplication(QMainWindow):
 
 
 
-    def refresh_interaction_animations(self, interaction_name: str = None):
+    def refresh_interaction_animations(self, interaction_name: str = None, clear_caches: bool = True):
         """Refresh interaction animations after editing - no restart needed"""
         try:
             if not self.current_character:
                 return
                 
-            print(f"🔄 Refreshing interaction animations for character: {self.current_character.name}")
-            
-            # Clear all caches
-            print("🧹 Clearing animation caches...")
+            logger.debug("🔄 Refreshing interaction animations for character: %s", self.current_character.name)
             
-            # Clear Qt pixmap cache
-            QPixmapCache.clear()
-            
-            # Clear animator cache
-            if interaction_name:
-                self.animator.clear_interaction_cache(self.current_character.name, interaction_name)
-            else:
-                self.animator.clear_interaction_cache(self.current_character.name)
-            
-            # Clear any additional internal caches
-            if hasattr(self.animator, 'preloaded_animations'):
-                # Clear interaction-related entries from preloaded cache
-                paths_to_remove = []
-                for path in self.animator.preloaded_animations.keys():
-                    if f"/{self.current_character.name}/interactions/" in path:
-                        if not interaction_name or f"/{interaction_name}/" in path:
-                            paths_to_remove.append(path)
+            if clear_caches:
+                # Clear all caches
+                logger.debug("🧹 Clearing animation caches...")
                 
-                for path in paths_to_remove:
-                    del self.animator.preloaded_animations[path]
-                    print(f"🧹 Removed from preloaded cache: {path}")
+                # Clear Qt pixmap cache
+                QPixmapCache.clear()
+                
+                # Clear animator cache (drops the matching preloaded entries via its index)
+                if interaction_name:
+                    self.animator.clear_interaction_cache(self.current_character.name, interaction_name)
+                else:
+                    self.animator.clear_interaction_cache(self.current_character.name)
             
             # Force reload current interactions
-            print("🔄 Reloading interaction icons...")
+            logger.debug("🔄 Reloading interaction icons...")
             self._clear_interactions()
             self._load_interactions()
             
             # If an interaction is currently running, handle it properly
             if (hasattr(self, 'interaction_in_progress') and self.interaction_in_progress and
-                hasattr(self, 'current_interaction_timer') and self.current_interaction_timer and
-                self.current_interaction_timer.isActive()):
+                self._interaction_return_timer.isActive()):
                 
-                print("⚠️ Interaction currently running - will refresh after completion")
+                logger.debug("⚠️ Interaction currently running - will refresh after completion")
                 # The interaction will naturally return to the original image when timer ends
                 # The cache clearing ensures the next interaction run will use fresh data
             
-            print("✅ Interaction animations refreshed successfully")
+            logger.debug("✅ Interaction animations refreshed successfully")
             
         except Exception as e:
             print(f"❌ Error refreshing interaction animations: {e}")
@@ -3056,7 +3614,7 @@ class MainApplication(QMainWindow):
             
             # Clear animator caches
             if hasattr(self.animator, 'preloaded_animations'):
-                self.animator.preloaded_animations.clear()
+                self.animator.clear_cache()
             
             # Stop any current animation
             if hasattr(self.animator, 'stop_animation'):
@@ -3072,6 +3630,13 @@ class MainApplication(QMainWindow):
         except Exception as e:
             print(f"❌ Error in force refresh: {e}")
 
+    def submit_api_call(self, fn) -> Future:
+        """Run a chat window's /use call on the shared API pool"""
+        future = self._api_executor.submit(fn)
+        self._api_futures.add(future)
+        future.add_done_callback(self._api_futures.discard)
+        return future
+
     def closeEvent(self, event):
         """Handle application closing with proper cleanup"""
         print("Closing main application")
@@ -3083,15 +3648,27 @@ class MainApplication(QMainWindow):
         if hasattr(self, 'animator') and self.animator:
             self.animator.stop_animation()
         
-        # Close all chat windows
+        # Close all chat windows - their history/state files are serialized here
+        # but written on the thread pool, so the writes overlap instead of queueing
         for window in list(self.chat_windows.values()):
             try:
+                window._write_in_background = True
                 window.close()
-            except:
+            except RuntimeError:
                 pass
         
-        # Save state
-        self._save_state()
+        # Drop queued /use calls; in-flight ones see their window closed and skip the LLM summary
+        # (shutdown's cancel_futures needs Python 3.9+)
+        for future in list(self._api_futures):
+            future.cancel()
+        self._api_executor.shutdown(wait=False)
+        
+        # Save state now, replacing any pending debounced save
+        self._save_state_timer.stop()
+        self._do_save_state(background=True)
+        
+        # Wait for the parallel writes so nothing is lost when the process exits
+        QThreadPool.globalInstance().waitForDone(5000)
         
         # Accept the close event
         event.accept()
@@ -3099,6 +3676,8 @@ class MainApplication(QMainWindow):
 
 class ChatWindow(QMainWindow):
     """Chat window with tree-based conversation support"""
+    _ACTIVE_TD = timedelta(minutes=2)  # User counts as "actively chatting" within this window
+    _BUBBLE_POOL_LIMIT = 64  # Removed bubbles kept hidden for reuse; extras are deleted
     # Define signals for thread-safe communication
     add_bubble_signal = Signal(object)  # Now accepts ChatMessage object
     add_streaming_bubble_signal = Signal()
@@ -3128,8 +3707,20 @@ class ChatWindow(QMainWindow):
         self.streaming_text = ""
         self.streaming_bubble = None
         self.messages_per_page = 25  # Number of messages to load at once
+        self.max_mounted_messages = 50  # Older bubbles are unmounted at the bottom; scrolling up reloads them
         self.loaded_message_ids = set()  # Track which messages are loaded
         self.oldest_loaded_timestamp = None  # Track oldest loaded message
+        self._sorted_all_messages = None  # Built on first scroll-up, dropped when the tree changes
+        self._sorted_timestamps = None  # Timestamps parallel to _sorted_all_messages, for bisect
+        self._history_generation = 0  # Bumped whenever the cached history goes stale
+        self._prefetched_page = None  # (generation, oldest timestamp, messages) for the next scroll-up
+        self._indent_cache: Dict[str, int] = {}  # message id -> bubble indent level
+        self._siblings_cache: Dict[Tuple, Dict[str, Tuple[int, int]]] = {}  # sibling group -> id -> (index, count)
+        self._bubble_pool: Dict[Tuple, List[ChatBubble]] = {}  # ChatBubble.pool_key -> hidden reusable bubbles
+        self._bubble_pool_size = 0
+        self._bubble_pool_icons = (None, None)  # Icons the parked bubbles were built with
+        self._older_messages_worker = None
+        self._prefetch_worker = None
         self.is_loading_messages = False  # Prevent concurrent loads
         self.loader_widget = None  # Loading indicator widget
         self.cancel_non_streaming = False  # Add this flag
@@ -3153,7 +3744,7 @@ class ChatWindow(QMainWindow):
         # Connect signals to slots
 
         app_colors.colors_changed.connect(self.update_colors)
-        self.add_bubble_signal.connect(self._add_bubble)
+        self.add_bubble_signal.connect(self._add_bubble, Qt.QueuedConnection)
         self.add_streaming_bubble_signal.connect(self._add_streaming_bubble)
         self.update_streaming_bubble_signal.connect(self._update_streaming_bubble)
         self.finalize_streaming_bubble_signal.connect(self._finalize_streaming_bubble)
@@ -3219,6 +3810,27 @@ class ChatWindow(QMainWindow):
         # Message queue for threading
         self.message_queue = queue.Queue()
         
+        # Coalesced chat history saves (see _schedule_save)
+        self._save_dirty = False
+        self._save_pending = False
+        self._write_in_background = False  # Set by MainApplication.closeEvent during shutdown
+        
+        # This window's /use calls on MainApplication's shared API pool
+        self._api_futures = set()
+        self._closed = False  # Set in closeEvent; API workers stop posting once it is
+        
+        # Debounced checkin_settings.json writes (see _save_checkin_settings)
+        self._checkin_dirty = False
+        self._checkin_save_timer = QTimer(self)
+        self._checkin_save_timer.setSingleShot(True)
+        self._checkin_save_timer.timeout.connect(self._flush_checkin_settings)
+        
+        # Coalesced color updates (see update_colors)
+        self._color_update_timer = QTimer(self)
+        self._color_update_timer.setSingleShot(True)
+        self._color_update_timer.setInterval(50)
+        self._color_update_timer.timeout.connect(self._apply_colors_now)
+        
         self._setup_ui()
         self._apply_chat_background()
         self._load_chat_history()
@@ -3226,12 +3838,7 @@ class ChatWindow(QMainWindow):
         self._apply_window_settings()
         self.chat_area.verticalScrollBar().valueChanged.connect(self._on_scroll)
 
-        app_colors.colors_changed.connect(self.update_colors)
-
         self._load_scheduled_dialogs()
-        QTimer.singleShot(1000, self._debug_profile_system)
-        QTimer.singleShot(500, self._setup_transparency)
-        QTimer.singleShot(200, self._load_window_state)
         # Schedule timer
 
         print(f"✅ Schedule timer started for {self.character.name}")
@@ -3247,23 +3854,42 @@ class ChatWindow(QMainWindow):
         
         # For window dragging
         self.drag_position = None
-        if scheduled_reminder:
-            # Flash immediately for scheduled reminder
-            QTimer.singleShot(1, self.flash_window_signal.emit)
-            # Start processing the reminder immediately
-            QTimer.singleShot(1, lambda: self._send_reminder_as_character(scheduled_reminder))
         
-        # 🆕 NEW: Handle check-in auto-send with flash
-        if is_checkin:
-            # Flash immediately for check-in
-            QTimer.singleShot(1, self.flash_window_signal.emit)
-            # Send check-in message after short delay
-            QTimer.singleShot(500, self._send_auto_checkin)
-        self.update_colors()
+        # Deferred startup work runs as one staged timer chain (see _post_init_chain)
+        self._startup_reminder = scheduled_reminder
+        self._startup_checkin = is_checkin
+        QTimer.singleShot(0, self._post_init_chain)
+        self._apply_colors_now()  # First paint needs the colors - no debounce
         
         # Force immediate UI update to prevent any flicker
         self.repaint()
 
+    def _post_init_chain(self):
+        """Stage 1 of deferred startup - runs as soon as the window is shown"""
+        if self._startup_reminder or self._startup_checkin:
+            # Flash immediately for scheduled reminder / check-in
+            self.flash_window_signal.emit()
+        if self._startup_reminder:
+            # Start processing the reminder immediately
+            self._send_reminder_as_character(self._startup_reminder)
+            self._startup_reminder = None
+        QTimer.singleShot(200, self._post_init_restore_state)
+
+    def _post_init_restore_state(self):
+        """Stage 2 of deferred startup - re-apply saved geometry once the window has settled"""
+        self._load_window_state()
+        QTimer.singleShot(300, self._post_init_finish)
+
+    def _post_init_finish(self):
+        """Stage 3 of deferred startup - transparency, pending check-in, debug dump"""
+        self._setup_transparency()
+        if self._startup_checkin:
+            # Send check-in message after short delay
+            self._startup_checkin = False
+            self._send_auto_checkin()
+        if logger.isEnabledFor(logging.DEBUG):
+            self._debug_profile_system()
+
     def _send_auto_checkin(self):
         """Send automatic check-in message when window auto-opens"""
         try:
@@ -3306,18 +3932,16 @@ class ChatWindow(QMainWindow):
         dots_layout = QHBoxLayout(dots_container)
         dots_layout.setSpacing(8)
         
+        # Build the two dot states once - the animation only swaps between them
+        self._dot_style_active = f"QLabel {{ color: {app_colors.PRIMARY}; font-size: 18pt; padding: 0px; }}"
+        self._dot_style_inactive = "QLabel { color: #666666; font-size: 16pt; padding: 0px; }"
+        
         # Create three animated dots
         self.loader_dots = []
         for i in range(3):
             dot = QLabel("●")
             dot.setObjectName(f"loaderDot{i}")
-            dot.setStyleSheet(f"""
-                QLabel {{
-                    color: {app_colors.PRIMARY};
-                    font-size: 9pt;
-                    padding: 0px;
-                }}
-            """)
+            dot.setStyleSheet(self._dot_style_inactive)
             dots_layout.addWidget(dot)
             self.loader_dots.append(dot)
         
@@ -3348,31 +3972,20 @@ class ChatWindow(QMainWindow):
         self.loader_timer.timeout.connect(self._animate_loader_dots)
         self.loader_timer.start(300)  # Update every 300ms
         self.loader_animation_step = 0
+        self.loader_dots[0].setStyleSheet(self._dot_style_active)
 
     def _animate_loader_dots(self):
         """Animate the loading dots"""
         if not hasattr(self, 'loader_dots'):
             return
-            
-        for i, dot in enumerate(self.loader_dots):
-            if i == self.loader_animation_step:
-                dot.setStyleSheet(f"""
-                    QLabel {{
-                        color: {app_colors.PRIMARY};
-                        font-size: 18pt;
-                        padding: 0px;
-                    }}
-                """)
-            else:
-                dot.setStyleSheet("""
-                    QLabel {
-                        color: #666666;
-                        font-size: 16pt;
-                        padding: 0px;
-                    }
-                """)
+        if self.loader_widget is None or not self.loader_widget.isVisible():
+            return
         
-        self.loader_animation_step = (self.loader_animation_step + 1) % 3
+        # Restyle only the dot losing focus and the dot gaining it
+        old_step = self.loader_animation_step
+        self.loader_animation_step = (old_step + 1) % 3
+        self.loader_dots[old_step].setStyleSheet(self._dot_style_inactive)
+        self.loader_dots[self.loader_animation_step].setStyleSheet(self._dot_style_active)
 
 
 
@@ -3399,6 +4012,53 @@ class ChatWindow(QMainWindow):
         if value <= 100:
             # Load more messages if available
             self._load_more_messages()
+        elif value >= scroll_bar.maximum() - 10:
+            # Back at the bottom - drop bubbles paged in while reading history
+            self._trim_mounted_messages()
+
+    def _trim_mounted_messages(self):
+        """Unmount the oldest bubbles beyond max_mounted_messages - scrolling up loads them back"""
+        excess = len(self.bubble_widgets) - self.max_mounted_messages
+        if excess <= 0 or self.is_loading_messages:
+            return
+        
+        # Oldest first in layout order; the loader and streaming bubble are never evicted
+        evicted = []
+        for i in range(self.chat_layout.count()):
+            if len(evicted) == excess:
+                break
+            widget = self.chat_layout.itemAt(i).widget()
+            message_obj = getattr(widget, 'message_obj', None)
+            if message_obj is not None and self.bubble_widgets.get(message_obj.id) is widget:
+                evicted.append(widget)
+        
+        # Paging walks back from the oldest bubble still mounted (strictly older timestamps),
+        # so only evict bubbles older than it or they could never be paged back in
+        evicted_ids = {widget.message_obj.id for widget in evicted}
+        boundary = min((bubble.message_obj.timestamp for msg_id, bubble in self.bubble_widgets.items()
+                        if msg_id not in evicted_ids), default=None)
+        if boundary is not None:
+            evicted = [widget for widget in evicted if widget.message_obj.timestamp < boundary]
+        if not evicted:
+            return
+        
+        self.chat_area.setUpdatesEnabled(False)
+        try:
+            for widget in evicted:
+                msg_id = widget.message_obj.id
+                self.chat_layout.removeWidget(widget)
+                del self.bubble_widgets[msg_id]
+                self.loaded_message_ids.discard(msg_id)
+                self._recycle_bubble(widget)
+        finally:
+            self.chat_area.setUpdatesEnabled(True)
+        
+        # Paging resumes from the oldest bubble still mounted; drop any page selected before the trim
+        self.oldest_loaded_timestamp = min(
+            (bubble.message_obj.timestamp for bubble in self.bubble_widgets.values()), default=None
+        )
+        self._prefetched_page = None
+        self._history_generation += 1
 
 # Add method to load more messages:
     def _load_more_messages(self):
@@ -3409,21 +4069,37 @@ class ChatWindow(QMainWindow):
         self.is_loading_messages = True
         
         try:
-            # Get all messages sorted by timestamp
-            all_messages = self._collect_all_active_messages()
-            all_messages.sort(key=lambda msg: msg.timestamp)
-            
-            # Find messages older than currently loaded
-            older_messages = []
-            for msg in all_messages:
-                if msg.id not in self.loaded_message_ids:
-                    if self.oldest_loaded_timestamp is None or msg.timestamp < self.oldest_loaded_timestamp:
-                        older_messages.append(msg)
+            # Save scroll position
+            scroll_bar = self.chat_area.verticalScrollBar()
+            old_max = scroll_bar.maximum()
+            old_value = scroll_bar.value()
             
-            if not older_messages:
-                self.is_loading_messages = False
+            # Page already fetched in the background - show it straight away
+            prefetched = self._prefetched_page
+            if prefetched and prefetched[:2] == (self._history_generation, self.oldest_loaded_timestamp):
+                if prefetched[2]:
+                    self._prefetched_page = None
+                # An empty page stays cached so repeated scrolls at the top stay free
+                self._finish_loading_messages(prefetched[2], old_max, old_value)
                 return
-                
+            self._prefetched_page = None
+            
+            generation = self._history_generation
+            
+            def on_finished(index, page):
+                self._older_messages_worker = None
+                if generation != self._history_generation:
+                    # History changed while sorting - drop the stale page but still tear down the loader
+                    self._finish_loading_messages([], old_max, old_value)
+                    return
+                if index is not None:
+                    self._sorted_all_messages, self._sorted_timestamps = index
+                self._finish_loading_messages(page, old_max, old_value)
+            
+            worker = self._create_older_messages_worker()
+            worker.signals.finished.connect(on_finished)
+            self._older_messages_worker = worker
+            
             # Show loader
             if not self.loader_widget:
                 self.loader_widget = self._create_loader_widget()
@@ -3431,18 +4107,53 @@ class ChatWindow(QMainWindow):
             # Insert loader at top
             self.chat_layout.insertWidget(0, self.loader_widget)
             
-            # Save scroll position
-            scroll_bar = self.chat_area.verticalScrollBar()
-            old_max = scroll_bar.maximum()
-            old_value = scroll_bar.value()
-            
-            # Simulate loading delay (remove in production)
-            QTimer.singleShot(300, lambda: self._finish_loading_messages(older_messages, old_max, old_value))
+            QThreadPool.globalInstance().start(worker)
             
         except Exception as e:
             print(f"Error loading more messages: {e}")
+            self._older_messages_worker = None
             self.is_loading_messages = False
 
+    def _create_older_messages_worker(self) -> OlderMessagesWorker:
+        """Build a worker for the page just older than what is currently displayed"""
+        if self._sorted_timestamps is not None:
+            messages, timestamps = self._sorted_all_messages, self._sorted_timestamps
+        else:
+            # Walk the tree here on the UI thread; the worker only sorts the snapshot
+            messages, timestamps = self._collect_all_active_messages(), None
+        return OlderMessagesWorker(messages, timestamps, set(self.loaded_message_ids),
+                                   self.oldest_loaded_timestamp, self.messages_per_page)
+
+    def _prefetch_older_messages(self):
+        """Select the next older page in the background so the following scroll-up is instant"""
+        if self._prefetch_worker is not None:
+            return
+        generation = self._history_generation
+        oldest_timestamp = self.oldest_loaded_timestamp
+        
+        def on_finished(index, page):
+            self._prefetch_worker = None
+            if generation != self._history_generation:
+                return
+            if index is not None:
+                self._sorted_all_messages, self._sorted_timestamps = index
+            if oldest_timestamp == self.oldest_loaded_timestamp:
+                self._prefetched_page = (generation, oldest_timestamp, page)
+        
+        worker = self._create_older_messages_worker()
+        worker.signals.finished.connect(on_finished)
+        self._prefetch_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _invalidate_sorted_messages(self):
+        """Drop the cached sorted history, tree-shape caches and any prefetched page"""
+        self._indent_cache.clear()
+        self._siblings_cache.clear()
+        self._sorted_all_messages = None
+        self._sorted_timestamps = None
+        self._prefetched_page = None
+        self._history_generation += 1
+
     def _finish_loading_messages(self, messages_to_load, old_scroll_max, old_scroll_value):
         """Finish loading older messages"""
         try:
@@ -3455,20 +4166,27 @@ class ChatWindow(QMainWindow):
                 self.chat_layout.removeWidget(self.loader_widget)
                 self.loader_widget.deleteLater()
                 self.loader_widget = None
-            # Remove loader
-
+            
+            if not messages_to_load:
+                return
             
             # Load up to messages_per_page older messages
             messages_to_add = messages_to_load[-self.messages_per_page:]
             
-            # Add messages at the top
-            for i, msg in enumerate(messages_to_add):
-                self._add_bubble_at_position(msg, i)
-                self.loaded_message_ids.add(msg.id)
-                
-                # Update oldest timestamp
-                if self.oldest_loaded_timestamp is None or msg.timestamp < self.oldest_loaded_timestamp:
-                    self.oldest_loaded_timestamp = msg.timestamp
+            # Add messages at the top - hold repaints so the page lays out in one pass
+            self.chat_area.setUpdatesEnabled(False)
+            try:
+                for i, msg in enumerate(messages_to_add):
+                    self._add_bubble_at_position(msg, i)
+                self.loaded_message_ids.update(msg.id for msg in messages_to_add)
+            finally:
+                self.chat_area.setUpdatesEnabled(True)
+            self.chat_layout.activate()
+            
+            # Update oldest timestamp once for the whole page
+            page_oldest = min(msg.timestamp for msg in messages_to_add)
+            if self.oldest_loaded_timestamp is None or page_oldest < self.oldest_loaded_timestamp:
+                self.oldest_loaded_timestamp = page_oldest
             
             # Restore scroll position to maintain view
             def restore_scroll():
@@ -3479,6 +4197,9 @@ class ChatWindow(QMainWindow):
             
             QTimer.singleShot(10, restore_scroll)
             
+            # Get the next page ready while the user reads this one
+            self._prefetch_older_messages()
+            
         finally:
             self.is_loading_messages = False
 
@@ -3527,20 +4248,13 @@ class ChatWindow(QMainWindow):
         try:
             if not hasattr(self, 'chat_tree') or not self.chat_tree.messages:
                 return
-                
-            # Find the most recent user message
-            latest_user_msg = None
-            for msg in self.chat_tree.messages.values():
-                if msg.role == "user":
-                    if not latest_user_msg or msg.timestamp > latest_user_msg.timestamp:
-                        latest_user_msg = msg
             
-            if latest_user_msg:
-                try:
-                    self.last_user_message_time = datetime.strptime(latest_user_msg.timestamp, "%Y-%m-%d %H:%M:%S")
-                    print(f"🕐 Loaded last user message time: {self.last_user_message_time}")
-                except:
-                    pass
+            # The tree memoizes its newest user message and each message its parsed time
+            latest_user_msg = self.chat_tree.latest_user_message()
+            parsed = latest_user_msg.parsed_time if latest_user_msg else None
+            if parsed and parsed != self.last_user_message_time:
+                self.last_user_message_time = parsed
+                print(f"🕐 Loaded last user message time: {self.last_user_message_time}")
                     
         except Exception as e:
             print(f"Error loading last user message time: {e}")
@@ -3563,15 +4277,24 @@ class ChatWindow(QMainWindow):
         except Exception as e:
             print(f"Error loading check-in settings: {e}")
 
-    def _save_checkin_settings(self):
-        """Save check-in settings to file"""
+    def _save_checkin_settings(self, delay_ms: int = 500):
+        """Save check-in settings after a short delay - bursts of edits coalesce into one write"""
+        self._checkin_dirty = True
+        self._checkin_save_timer.start(delay_ms)
+
+    def _flush_checkin_settings(self):
+        """Write check-in settings to file if they changed since the last write"""
+        self._checkin_save_timer.stop()
+        if not self._checkin_dirty:
+            return
+        self._checkin_dirty = False
         try:
             app_data_dir = get_app_data_dir()
             settings_file = app_data_dir / "characters" / self.character.name / "checkin_settings.json"
             settings_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.checkin_settings.to_dict(), f, indent=2)
+            # Machine-read settings - compact JSON, one write, atomic swap
+            dump_json_file(self.checkin_settings.to_dict(), settings_file)
         except Exception as e:
             print(f"Error saving check-in settings: {e}")
 
@@ -3582,107 +4305,91 @@ class ChatWindow(QMainWindow):
 
     def _is_quiet_hours(self) -> bool:
         """Check if current time is within quiet hours"""
-        if not hasattr(self, 'checkin_settings'):
-            return False
-            
-        if not self.checkin_settings.quiet_hours_start or not self.checkin_settings.quiet_hours_end:
-            return False
-            
-        now = datetime.now().time()
+        return self._is_quiet_hours_at(datetime.now().time())
+
+    def _is_quiet_hours_at(self, now_time) -> bool:
+        """Check if the given time of day is within quiet hours"""
         try:
-            start = datetime.strptime(self.checkin_settings.quiet_hours_start, "%H:%M").time()
-            end = datetime.strptime(self.checkin_settings.quiet_hours_end, "%H:%M").time()
-            
-            # 🆕 SPECIAL CASE: 00:00 to 00:00 means "always quiet" (block all messages)
-            if start == end and start.hour == 0 and start.minute == 0:
-                print(f"🔇 Always quiet hours detected (00:00-00:00) - blocking all messages")
-                return True
-            
-            if start <= end:
-                return start <= now <= end
-            else:  # Quiet hours span midnight
-                return now >= start or now <= end
-        except:
+            is_quiet = self.checkin_settings.quiet_predicate  # Specialized once, memoized on the settings
+        except AttributeError:
             return False
+        return is_quiet(now_time)
 
     def _should_check_in(self) -> bool:
-        """Determine if character should check in - FIXED VERSION"""
-        if not hasattr(self, 'checkin_settings') or not self.checkin_settings.enabled:
-            print(f"🚫 Check-in disabled or settings missing")
-            return False
-            
-        if self._is_quiet_hours():
-            print(f"🔇 In quiet hours")
+        """Determine if character should check in - cheap timing checks first, one shared `now`"""
+        settings = getattr(self, 'checkin_settings', None)
+        if settings is None or not settings.enabled:
+            logger.debug("🚫 Check-in disabled or settings missing")
             return False
         
-        # 🆕 Don't check in if user is actively chatting
-        if self._is_user_actively_chatting():
-            print(f"🚫 User is actively chatting")
-            return False
-            
         now = datetime.now()
-        
-        # 🆕 NEW: Check if enough time has passed since last check-in
-        if hasattr(self, 'last_checkin_time') and self.last_checkin_time:
-            time_since_last_checkin = now - self.last_checkin_time
-            if time_since_last_checkin < timedelta(minutes=self.checkin_settings.interval_minutes):
-                print(f"🕐 Too soon since last check-in ({time_since_last_checkin.total_seconds()/60:.1f} min ago)")
+        last_checkin_time = getattr(self, 'last_checkin_time', None)
+        last_user_message_time = getattr(self, 'last_user_message_time', None)
+        
+        # Check if enough time has passed since last check-in
+        if last_checkin_time:
+            time_since_last_checkin = now - last_checkin_time
+            if time_since_last_checkin < settings.interval_td:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("🕐 Too soon since last check-in (%.1f min ago)", time_since_last_checkin.total_seconds() / 60)
                 return False
         
-        # 🆕 FIXED: For proactive check-ins, we have two scenarios:
-        
-        # Scenario 1: User has sent messages before - check timing
-        if hasattr(self, 'last_user_message_time') and self.last_user_message_time:
-            time_since_last_message = now - self.last_user_message_time
+        # User has sent messages before - check timing
+        if last_user_message_time:
+            time_since_last_message = now - last_user_message_time
             
             # Don't check if user was active very recently (less than interval)
-            if time_since_last_message < timedelta(minutes=self.checkin_settings.interval_minutes):
-                print(f"🕐 User message too recent ({time_since_last_message.total_seconds()/60:.1f} min ago)")
+            if time_since_last_message < settings.interval_td:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("🕐 User message too recent (%.1f min ago)", time_since_last_message.total_seconds() / 60)
                 return False
                 
             # Don't check if too much time has passed (user might be away)
-            if time_since_last_message > timedelta(hours=self.checkin_settings.max_idle_hours):
-                print(f"⏰ User idle too long ({time_since_last_message.total_seconds()/3600:.1f} hours)")
+            if time_since_last_message > settings.max_idle_td:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("⏰ User idle too long (%.1f hours)", time_since_last_message.total_seconds() / 3600)
                 return False
-                
-            print(f"✅ User message timing good ({time_since_last_message.total_seconds()/60:.1f} min ago)")
-            return True
         
-        # 🆕 Scenario 2: No user messages yet - check if enough time since character creation/last check-in
-        else:
-            # For new characters or those without user interaction, 
-            # check if we should send an initial greeting check-in
-            
-            # If we've never checked in, allow initial check-in after a short delay
-            if not hasattr(self, 'last_checkin_time') or not self.last_checkin_time:
-                print(f"✅ No previous check-in - allowing initial check-in")
-                return True
-                
-            # Otherwise, use normal interval timing for subsequent check-ins
-            time_since_last_checkin = now - self.last_checkin_time
-            if time_since_last_checkin >= timedelta(minutes=self.checkin_settings.interval_minutes):
-                print(f"✅ Time for follow-up check-in ({time_since_last_checkin.total_seconds()/60:.1f} min since last)")
-                return True
-            
-            print(f"🕐 Too soon for follow-up check-in ({time_since_last_checkin.total_seconds()/60:.1f} min since last)")
+        # Predicates last, sharing the same `now`
+        if self._is_quiet_hours_at(now.time()):
+            logger.debug("🔇 In quiet hours")
             return False
+        
+        if self._is_user_actively_chatting_at(now):
+            logger.debug("🚫 User is actively chatting")
+            return False
+        
+        if last_user_message_time:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("✅ User message timing good (%.1f min ago)", time_since_last_message.total_seconds() / 60)
+            return True
+        
+        # No user messages yet - allow an initial greeting, then follow-ups on the interval
+        # (a follow-up that is too soon was already rejected above)
+        if not last_checkin_time:
+            logger.debug("✅ No previous check-in - allowing initial check-in")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("✅ Time for follow-up check-in (%.1f min since last)", time_since_last_checkin.total_seconds() / 60)
+        return True
 
 
 
     def _is_user_actively_chatting(self) -> bool:
         """Check if user is actively chatting (sent message in last 2 minutes)"""
+        return self._is_user_actively_chatting_at(datetime.now())
+
+    def _is_user_actively_chatting_at(self, now: datetime) -> bool:
+        """Check if user sent a message within 2 minutes of `now`"""
         if not hasattr(self, 'last_user_message_time') or not self.last_user_message_time:
             return False
         
-        now = datetime.now()
         time_since_last = now - self.last_user_message_time
         
         # Consider user "actively chatting" if they sent a message in the last 2 minutes
-        active_threshold = timedelta(minutes=2)
-        is_active = time_since_last < active_threshold
+        is_active = time_since_last < self._ACTIVE_TD
         
-        if is_active:
-            print(f"👤 User is actively chatting (last message {time_since_last.total_seconds():.0f}s ago)")
+        if is_active and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("👤 User is actively chatting (last message %.0fs ago)", time_since_last.total_seconds())
         
         return is_active
 
@@ -3850,237 +4557,141 @@ class ChatWindow(QMainWindow):
 
     def _execute_external_api_call(self, api: ExternalAPI, args_dict: Dict[str, str]):
         """Execute external API call in background thread with LLM summarization"""
+        if requests is None:
+            # Optional dependency (see common_imports) - nothing to call with
+            self._add_system_message(f"❌ {api.name} API unavailable: the 'requests' package is not installed")
+            return
+        
+        def post(text: str):
+            if not self._closed:
+                self._add_system_message(text)
+        
         def run_api_call():
             try:
-                import requests
-                
-                # Replace parameters in URL and params
-                url = api.url
-                params = {}
-                headers = api.headers.copy()
-                
-                # Replace {param} placeholders
-                for key, value in api.params.items():
-                    if value.startswith("{") and value.endswith("}"):
-                        param_name = value[1:-1]  # Remove { and }
-                        if param_name in args_dict:
-                            params[key] = args_dict[param_name]
-                        else:
-                            params[key] = value  # Keep original if no replacement
-                    else:
-                        params[key] = value
-                
-                # Replace placeholders in URL
-                for param_name, param_value in args_dict.items():
-                    url = url.replace(f"{{{param_name}}}", param_value)
-                    # Also replace in headers
-                    for header_key, header_value in headers.items():
-                        headers[header_key] = header_value.replace(f"{{{param_name}}}", param_value)
-                
-                # Make API request
-                response = requests.request(
+                # Replace {param} placeholders in one regex pass per string
+                # (unknown names keep their placeholder)
+                def fill(text: str) -> str:
+                    return _PLACEHOLDER_RE.sub(lambda m: args_dict.get(m.group(1), m.group(0)), text)
+                
+                url = fill(api.url)
+                headers = {key: fill(value) for key, value in api.headers.items()}
+                params = {key: fill(value) for key, value in api.params.items()}
+                
+                # Make API request - streamed so only the first max_response_bytes are ever read
+                max_bytes = getattr(api, 'max_response_bytes', DEFAULT_MAX_RESPONSE_BYTES)
+                with requests.request(
                     api.method,
                     url,
                     headers=headers,
                     params=params if api.method == "GET" else None,
                     json=params if api.method in ["POST", "PUT"] else None,
-                    timeout=api.timeout
-                )
+                    timeout=api.timeout,
+                    stream=True
+                ) as response:
+                    body = response.raw.read(max_bytes + 1, decode_content=True)
+                    status_code = response.status_code
+                    encoding = response.encoding or 'utf-8'
+                
+                truncated = len(body) > max_bytes
+                raw_data = body[:max_bytes].decode(encoding, errors='replace')
+                
+                # Small JSON bodies are rendered directly when the API opts out of LLM summaries
+                fast_data = None
+                if (status_code == 200 and not truncated and not getattr(api, 'use_llm_summary', True)
+                        and len(body) < _API_JSON_FAST_PATH_BYTES):
+                    try:
+                        fast_data = json.loads(raw_data)
+                    except ValueError:
+                        pass
                 
                 # Handle response
-                if response.status_code == 200:
+                if fast_data is not None:
+                    result_text = _render_api_json(api.name, fast_data)
+                elif status_code == 200 and self._closed:
+                    return  # Window closed mid-request - skip the LLM summary nobody will see
+                elif status_code == 200:
                     try:
-                        # Get the raw response
-                        raw_data = response.text
-                        
-                        # Create a summarization prompt
-                        summarization_prompt = f"""Please analyze and summarize this API response from {api.name} in a clear, user-friendly way:
-
-    API Response:
-    {raw_data}
-
-    IMPORTANT REQUIREMENTS:
-    - Provide COMPLETE information - don't cut off mid-sentence
-    - Include all URLs and links from the response so users can access them
-    - For updates/patches, include specific details about what changed
-    - Make sure all information is clear and actionable
-
-    Please provide:
-    1. A brief summary of what this data shows
-    2. The key information extracted in an easy-to-read format with COMPLETE details
-    3. Any important details or highlights
-    4. Include all relevant URLs/links from the response
-
-    Format your response to be helpful for a regular user, not technical JSON. Make it conversational, complete, and useful."""
-
-                        # Use the AI interface to summarize
-                        api_config_name = getattr(self.character, 'api_config_name', None)
-                        
-                        # Create a simple conversation for the summarization
-                        summary_messages = [{"role": "user", "content": summarization_prompt}]
-                        
-                        # Get AI summary
-                        ai_summary = self.ai_interface.get_response(
-                            summary_messages, 
-                            f"You are a helpful assistant that summarizes API responses clearly and concisely. Focus on extracting the most useful information for the user.",
-                            api_config_name
-                        )
-                        
-                        # Format the final result
-                        result_text = f"✅ **{api.name} Results:**\n\n{ai_summary}"
-                        
-                    except Exception as e:
-                        # Fallback to raw response if LLM summarization fails
-                        print(f"LLM summarization failed: {e}")
-                        try:
-                            # Try to format as JSON if possible
-                            json_data = response.json()
-                            formatted_response = json.dumps(json_data, indent=2)
-                            result_text = f"✅ {api.name} API Result:\n```json\n{formatted_response}\n```"
-                        except:
-                            # Ultimate fallback to plain text
-                            result_text = f"✅ {api.name} API Result:\n{response.text[:1000]}{'...' if len(response.text) > 1000 else ''}"
-                else:
-                    result_text = f"❌ {api.name} API Error (Status {response.status_code}):\n{response.text[:300]}{'...' if len(response.text) > 300 else ''}"
-                
-                # Add result to chat
-                self._add_system_message(result_text)
-                
-            except requests.exceptions.Timeout:
-                self._add_system_message(f"❌ {api.name} API timeout after {api.timeout} seconds")
-            except requests.exceptions.RequestException as e:
-                self._add_system_message(f"❌ {api.name} API request failed: {str(e)}")
-            except Exception as e:
-                self._add_system_message(f"❌ {api.name} API error: {str(e)}")
-        
-        # Run in background thread
-        threading.Thread(target=run_api_call, daemon=True).start()
-
-    # Optional: Add a method to handle different types of API responses with custom prompts
-    def _get_api_summarization_prompt(self, api_name: str, raw_data: str) -> str:
-        """Get a custom summarization prompt based on API type"""
-        
-        api_name_lower = api_name.lower()
-        
-        if "steam" in api_name_lower or "news" in api_name_lower:
-            return f"""Please summarize this gaming news API response from {api_name}:
-
-    {raw_data}
-
-    IMPORTANT REQUIREMENTS:
-    - Include the complete summary for each news item - don't cut off mid-sentence
-    - Always include the actual URLs/links so users can read the full articles
-    - For updates/patches, explain what specific changes were made
-    - Present all information clearly and completely
-
-    Extract and present:
-    - The most interesting news items (top 3-5) with COMPLETE descriptions
-    - Headlines and FULL summaries (don't truncate)
-    - Authors and dates where available
-    - The actual URLs/links for each article
-    - For game updates: specific changes, features, bug fixes
-    - Make it engaging and informative for a gamer
-
-    Format as a friendly news update with clickable links."""
-        
-        elif "weather" in api_name_lower:
-            return f"""Please summarize this weather API response from {api_name}:
-
-    {raw_data}
-
-    Extract and present:
-    - Current temperature and conditions
-    - Location information
-    - Any forecasts or additional details
-    - Make it conversational and easy to understand
-
-    Format as a friendly weather update."""
-        
-        elif "stock" in api_name_lower or "finance" in api_name_lower:
-            return f"""Please summarize this financial API response from {api_name}:
-
-    {raw_data}
-
-    Extract and present:
-    - Key financial metrics
-    - Stock prices, changes, or trends
-    - Important financial data
-    - Make it understandable for someone checking investments
-
-    Format as a clear financial summary."""
-        
-        else:
-            # Generic prompt for unknown API types
-            return f"""Please analyze and summarize this API response from {api_name}:
-
-    {raw_data}
-
-    Extract and present:
-    - The most important information
-    - Key data points in an organized way
-    - Any notable details or insights
-    - Make it easy to understand and useful
-
-    Format as a clear, friendly summary."""
-
-    # Optional: Add a method to handle different types of API responses with custom prompts
-    def _get_api_summarization_prompt(self, api_name: str, raw_data: str) -> str:
-        """Get a custom summarization prompt based on API type"""
-        
-        api_name_lower = api_name.lower()
-        
-        if "steam" in api_name_lower or "news" in api_name_lower:
-            return f"""Please summarize this gaming news API response from {api_name}:
-
-    {raw_data}
+                        truncation_note = (
+                            f"\n\n    NOTE: The response was larger than {max_bytes // 1024} KB and has been truncated - "
+                            "summarize what is shown and mention that more data was available."
+                            if truncated else ""
+                        )
+                        
+                        # Create a summarization prompt
+                        summarization_prompt = f"""Please analyze and summarize this API response from {api.name} in a clear, user-friendly way:
 
-    Extract and present:
-    - The most interesting news items (top 3-5)
-    - Headlines and brief summaries
-    - Authors and dates where available
-    - Make it engaging for a gamer to read
+    API Response:
+    {raw_data}{truncation_note}
 
-    Format as a friendly news update."""
-        
-        elif "weather" in api_name_lower:
-            return f"""Please summarize this weather API response from {api_name}:
+    IMPORTANT REQUIREMENTS:
+    - Provide COMPLETE information - don't cut off mid-sentence
+    - Include all URLs and links from the response so users can access them
+    - For updates/patches, include specific details about what changed
+    - Make sure all information is clear and actionable
 
-    {raw_data}
+    Please provide:
+    1. A brief summary of what this data shows
+    2. The key information extracted in an easy-to-read format with COMPLETE details
+    3. Any important details or highlights
+    4. Include all relevant URLs/links from the response
 
-    Extract and present:
-    - Current temperature and conditions
-    - Location information
-    - Any forecasts or additional details
-    - Make it conversational and easy to understand
+    Format your response to be helpful for a regular user, not technical JSON. Make it conversational, complete, and useful."""
 
-    Format as a friendly weather update."""
+                        # Use the AI interface to summarize
+                        api_config_name = getattr(self.character, 'api_config_name', None)
+                        
+                        # Create a simple conversation for the summarization
+                        summary_messages = [{"role": "user", "content": summarization_prompt}]
+                        
+                        # Get AI summary
+                        ai_summary = self.ai_interface.get_response(
+                            summary_messages, 
+                            f"You are a helpful assistant that summarizes API responses clearly and concisely. Focus on extracting the most useful information for the user.",
+                            api_config_name
+                        )
+                        
+                        # Format the final result
+                        result_text = f"✅ **{api.name} Results:**\n\n{ai_summary}"
+                        
+                    except Exception as e:
+                        # Fallback to raw response if LLM summarization fails
+                        print(f"LLM summarization failed: {e}")
+                        try:
+                            # Try to format as JSON if possible (a truncated body won't parse)
+                            json_data = json.loads(raw_data)
+                            formatted_response = json.dumps(json_data, indent=2)
+                            result_text = f"✅ {api.name} API Result:\n```json\n{formatted_response}\n```"
+                        except ValueError:
+                            # Ultimate fallback to plain text
+                            result_text = f"✅ {api.name} API Result:\n{raw_data[:1000]}{'...' if truncated or len(raw_data) > 1000 else ''}"
+                else:
+                    result_text = f"❌ {api.name} API Error (Status {status_code}):\n{raw_data[:300]}{'...' if truncated or len(raw_data) > 300 else ''}"
+                
+                # Add result to chat
+                post(result_text)
+                
+            except requests.exceptions.Timeout:
+                post(f"❌ {api.name} API timeout after {api.timeout} seconds")
+            except requests.exceptions.RequestException as e:
+                post(f"❌ {api.name} API request failed: {str(e)}")
+            except Exception as e:
+                post(f"❌ {api.name} API error: {str(e)}")
         
-        elif "stock" in api_name_lower or "finance" in api_name_lower:
-            return f"""Please summarize this financial API response from {api_name}:
-
-    {raw_data}
-
-    Extract and present:
-    - Key financial metrics
-    - Stock prices, changes, or trends
-    - Important financial data
-    - Make it understandable for someone checking investments
+        # Run on MainApplication's shared API worker pool
+        future = self.parent().submit_api_call(run_api_call)
+        self._api_futures.add(future)
+        future.add_done_callback(self._api_futures.discard)
 
-    Format as a clear financial summary."""
+    # Optional: Add a method to handle different types of API responses with custom prompts
+    def _get_api_summarization_prompt(self, api_name: str, raw_data: str) -> str:
+        """Get a custom summarization prompt based on API type"""
+        api_name_lower = api_name.lower()
+        for key, template in _API_PROMPT_TEMPLATES.items():
+            if key in api_name_lower:
+                return template.format(api_name=api_name, raw_data=raw_data)
         
-        else:
-            # Generic prompt for unknown API types
-            return f"""Please analyze and summarize this API response from {api_name}:
-
-    {raw_data}
-
-    Extract and present:
-    - The most important information
-    - Key data points in an organized way
-    - Any notable details or insights
-    - Make it easy to understand and useful
-
-    Format as a clear, friendly summary."""
+        # Generic prompt for unknown API types
+        return _API_PROMPT_GENERIC.format(api_name=api_name, raw_data=raw_data)
 
 
     def _update_messages_incrementally(self, target_messages: List[ChatMessage]):
@@ -4089,86 +4700,129 @@ class ChatWindow(QMainWindow):
         existing_ids = set(self.bubble_widgets.keys())
         target_id_set = set(target_ids)
         
-        # Remove widgets for messages that are no longer active
-        to_remove = existing_ids - target_id_set
-        for msg_id in to_remove:
-            if msg_id in self.bubble_widgets:
-                widget = self.bubble_widgets[msg_id]
-                self.chat_layout.removeWidget(widget)
-                widget.deleteLater()
-                del self.bubble_widgets[msg_id]
-        
-        # Add or update messages
-        for i, message in enumerate(target_messages):
+        # Apply all removals/updates/inserts with painting off - one relayout at the end
+        removed_widgets = []
+        self.chat_area.setUpdatesEnabled(False)
+        try:
+            # Remove widgets for messages that are no longer active
+            to_remove = existing_ids - target_id_set
+            for msg_id in to_remove:
+                if msg_id in self.bubble_widgets:
+                    widget = self.bubble_widgets.pop(msg_id)
+                    self.chat_layout.removeWidget(widget)
+                    widget.hide()
+                    removed_widgets.append(widget)
+            
+            self._apply_incremental_updates(target_messages)
+        finally:
+            self.chat_area.setUpdatesEnabled(True)
+            # Pooled (or deleted) only once the layout has settled
+            for widget in removed_widgets:
+                self._recycle_bubble(widget)
+
+    def _apply_incremental_updates(self, target_messages: List[ChatMessage]):
+        """Update existing bubbles in place and insert bubbles for new messages"""
+        # Add or update messages - new bubbles are inserted together afterwards
+        to_add = []
+        for message in target_messages:
             if message.id in self.bubble_widgets:
                 # Update existing widget if content changed
                 widget = self.bubble_widgets[message.id]
                 if widget.message_obj.content != message.content:
                     # Update content without recreating widget
-                    formatted_content = widget._format_text(message.content)
-                    widget.bubble_label.setText(formatted_content)
+                    widget.set_message_text(message.content)
                     widget.message_obj.content = message.content
                 
                 # Update opacity if active state changed
                 if widget.message_obj.is_active != message.is_active:
                     opacity = 1.0 if message.is_active else 0.6
                     style = widget.bubble_label.styleSheet()
-                    # Simple opacity update
-                    new_style = re.sub(r'opacity:\s*[\d.]+;', f'opacity: {opacity};', style)
-                    if 'opacity:' not in style:
-                        new_style = style.rstrip('}') + f' opacity: {opacity}; }}'
-                    widget.bubble_label.setStyleSheet(new_style)
+                    # Simple opacity update (skip the restyle if nothing changes)
+                    new_style = _style_with_opacity(style, opacity)
+                    if new_style != style:
+                        widget.bubble_label.setStyleSheet(new_style)
                     widget.message_obj.is_active = message.is_active
             else:
                 # Create new widget only if needed
-                self._add_single_bubble(message)
+                to_add.append(message)
+        
+        if to_add:
+            self._batch_insert_bubbles(to_add)
 
 
     def _add_single_bubble(self, message_obj: ChatMessage):
         """Add a single bubble at the correct position"""
+        self._batch_insert_bubbles([message_obj])
+
+    def _batch_insert_bubbles(self, messages: List[ChatMessage]):
+        """Insert bubbles for several messages at their timestamp positions in one pass"""
         try:
-            # If this is called during a refresh, just add to end
-            # The refresh process will handle proper ordering
-            if self.update_in_progress:
-                return self._create_and_add_bubble(message_obj)
-            
-            # For individual adds, we need to find correct position
-            all_active_messages = self._collect_all_active_messages()
-            all_active_messages.sort(key=lambda msg: msg.timestamp)
-            
-            # Find where this message should be positioned
-            target_position = None
-            for i, msg in enumerate(all_active_messages):
-                if msg.id == message_obj.id:
-                    target_position = i
-                    break
-            
-            if target_position is not None:
-                # Create bubble
-                bubble = self._create_bubble_widget(message_obj)
-                
-                # Insert at correct position
-                self.chat_layout.insertWidget(target_position, bubble)
-                self.bubble_widgets[message_obj.id] = bubble
-                
-                # Update indices for all widgets after this one
-                self._update_widget_indices()
-            else:
-                # Fallback: add at end
-                self._create_and_add_bubble(message_obj)
+            # Timestamps in layout order; non-bubble items (loader, streaming bubble)
+            # carry their neighbour's value so the list stays sorted for bisect
+            timestamps = []
+            last_ts = ""
+            for i in range(self.chat_layout.count()):
+                widget = self.chat_layout.itemAt(i).widget()
+                if hasattr(widget, 'message_obj'):
+                    last_ts = widget.message_obj.timestamp
+                timestamps.append(last_ts)
+            
+            # Callers that already paused painting re-enable it themselves
+            pause_updates = self.chat_area.updatesEnabled()
+            if pause_updates:
+                self.chat_area.setUpdatesEnabled(False)
+            try:
+                for message_obj in sorted(messages, key=lambda msg: msg.timestamp):
+                    position = bisect.bisect_right(timestamps, message_obj.timestamp)
+                    bubble = self._create_bubble_widget(message_obj)
+                    self.chat_layout.insertWidget(position, bubble)
+                    timestamps.insert(position, message_obj.timestamp)
+                    self.bubble_widgets[message_obj.id] = bubble
+            finally:
+                if pause_updates:
+                    self.chat_area.setUpdatesEnabled(True)
                 
         except Exception as e:
-            print(f"Error adding single bubble: {e}")
-            # Fallback to simple add
-            self._create_and_add_bubble(message_obj)
-
-    def _update_widget_indices(self):
-        """Update widget position tracking after insertions"""
-        for msg_id, widget in self.bubble_widgets.items():
-            index = self.chat_layout.indexOf(widget)
-            if index >= 0:
-                # Update any internal tracking if needed
-                pass
+            print(f"Error adding bubbles: {e}")
+
+    def _get_sibling_position(self, message_obj: ChatMessage) -> Optional[Tuple[int, int]]:
+        """(index, count) among the message's siblings, or None if it has none"""
+        if message_obj.parent_id:
+            parent = self.chat_tree.messages.get(message_obj.parent_id)
+            group_size = len(parent.children_ids) if parent else 0
+        else:
+            group_size = len(self.chat_tree.roots)
+        
+        # Adding/removing siblings changes the group size, so it is part of the key
+        key = (message_obj.parent_id, message_obj.role, group_size)
+        positions = self._siblings_cache.get(key)
+        if positions is None or message_obj.id not in positions:
+            siblings = self.chat_tree.get_siblings(message_obj.id)
+            positions = {sibling_id: (i, len(siblings)) for i, sibling_id in enumerate(siblings)}
+            self._siblings_cache[key] = positions
+        
+        position = positions.get(message_obj.id)
+        return position if position and position[1] > 1 else None
+
+    def _get_indent_level(self, message_obj: ChatMessage) -> int:
+        """Bubble indent (depth below the root, capped at 3), reusing cached ancestor levels"""
+        indent_level = self._indent_cache.get(message_obj.id)
+        if indent_level is not None:
+            return indent_level
+        
+        indent_level = 0
+        current_id = message_obj.parent_id
+        while current_id and indent_level < 3:
+            ancestor_level = self._indent_cache.get(current_id)
+            if ancestor_level is not None:
+                indent_level = min(3, indent_level + 1 + ancestor_level)
+                break
+            indent_level += 1
+            parent = self.chat_tree.messages.get(current_id)
+            current_id = parent.parent_id if parent else None
+        
+        self._indent_cache[message_obj.id] = indent_level
+        return indent_level
 
     def _create_bubble_widget(self, message_obj: ChatMessage):
         """Create bubble widget without adding to layout - OPTIMIZED VERSION"""
@@ -4180,8 +4834,7 @@ class ChatWindow(QMainWindow):
                 # Update content if it changed, but reuse the widget
                 if existing_bubble.message_obj.content != message_obj.content:
                     existing_bubble.message_obj = message_obj
-                    formatted_content = existing_bubble._format_text(message_obj.content)
-                    existing_bubble.bubble_label.setText(formatted_content)
+                    existing_bubble.set_message_text(message_obj.content)
                 return existing_bubble
         
         # Get names for placeholder replacement
@@ -4190,23 +4843,12 @@ class ChatWindow(QMainWindow):
         user_profile = self._get_effective_user_profile()
         user_name = user_profile.user_name if user_profile else "User"
         
-        # Get siblings for navigation
-        siblings = self.chat_tree.get_siblings(message_obj.id)
-        has_siblings = len(siblings) > 1
-        sibling_position = None
-        
-        if has_siblings:
-            sibling_index = siblings.index(message_obj.id)
-            sibling_position = (sibling_index, len(siblings))
+        # Get siblings for navigation (memoized per sibling group)
+        sibling_position = self._get_sibling_position(message_obj)
+        has_siblings = sibling_position is not None
         
-        # Calculate indent level
-        indent_level = 0
-        if message_obj.parent_id:
-            current_id = message_obj.parent_id
-            while current_id and indent_level < 3:
-                indent_level += 1
-                parent = self.chat_tree.messages.get(current_id)
-                current_id = parent.parent_id if parent else None
+        # Calculate indent level (memoized per message)
+        indent_level = self._get_indent_level(message_obj)
         
         # ✅ OPTIMIZED: Get colors with caching and smart logging
         if (getattr(self.character, 'use_character_colors', False) and
@@ -4261,23 +4903,12 @@ class ChatWindow(QMainWindow):
         user_profile = self._get_effective_user_profile()
         user_name = user_profile.user_name if user_profile else "User"
         
-        # Get siblings for navigation
-        siblings = self.chat_tree.get_siblings(message_obj.id)
-        has_siblings = len(siblings) > 1
-        sibling_position = None
-        
-        if has_siblings:
-            sibling_index = siblings.index(message_obj.id)
-            sibling_position = (sibling_index, len(siblings))
+        # Get siblings for navigation (memoized per sibling group)
+        sibling_position = self._get_sibling_position(message_obj)
+        has_siblings = sibling_position is not None
         
-        # Calculate indent level
-        indent_level = 0
-        if message_obj.parent_id:
-            current_id = message_obj.parent_id
-            while current_id and indent_level < 3:
-                indent_level += 1
-                parent = self.chat_tree.messages.get(current_id)
-                current_id = parent.parent_id if parent else None
+        # Calculate indent level (memoized per message)
+        indent_level = self._get_indent_level(message_obj)
         
         # ENHANCED: Always get character colors correctly
         print(f"🎨 Creating bubble for message: {message_obj.content[:30]}...")
@@ -4300,6 +4931,20 @@ class ChatWindow(QMainWindow):
             color_source = "global"
             print(f"🎨 Using global colors: {primary_color} / {secondary_color}")
         
+        # Reuse a pooled bubble with the same structure instead of building a new one
+        # (after an icon reload no parked bubble can match again - drop them)
+        pool_user_icon, pool_character_icon = self._bubble_pool_icons
+        if pool_user_icon is not self.user_icon or pool_character_icon is not self.character_icon:
+            self._clear_bubble_pool()
+            self._bubble_pool_icons = (self.user_icon, self.character_icon)
+        pool_key = ChatBubble.make_pool_key(message_obj.role == "user", has_siblings, message_obj.is_active,
+                                            primary_color, secondary_color, self.user_icon, self.character_icon)
+        bubble = self._take_pooled_bubble(pool_key)
+        if bubble is not None:
+            bubble.rebind(message_obj, sibling_position, indent_level, character_name, user_name)
+            bubble.show()
+            return bubble  # Signals were connected when it was first built
+        
         # Create the ChatBubble with the colors
         bubble = ChatBubble(
             message_obj,
@@ -4351,20 +4996,61 @@ class ChatWindow(QMainWindow):
 
     def _refresh_display_simple(self):
         """Simple fallback refresh method for error recovery"""
-        # Clear all bubbles
+        # Clear all bubbles - they go back to the pool for the rebuild below
         while self.chat_layout.count():
             item = self.chat_layout.takeAt(0)
             if item.widget():
-                item.widget().deleteLater()
+                self._recycle_bubble(item.widget())
         
         self.bubble_widgets.clear()
-        
-        # Re-add all active messages
-        all_active_messages = self._collect_all_active_messages()
-        all_active_messages.sort(key=lambda msg: msg.timestamp)
-        
-        for msg in all_active_messages:
-            self._add_single_bubble(msg)
+        self.loaded_message_ids.clear()
+        
+        # Re-add only the most recent page - older messages load on scroll-up
+        recent_messages = self._collect_recent_active_messages(self.messages_per_page)
+        self._batch_insert_bubbles(recent_messages)
+        self.loaded_message_ids.update(msg.id for msg in recent_messages)
+        self.oldest_loaded_timestamp = recent_messages[0].timestamp if recent_messages else None
+
+    def _recycle_bubble(self, widget):
+        """Park a bubble taken out of the layout for reuse, or delete it if it can't be pooled"""
+        pool_key = widget.pool_key if isinstance(widget, ChatBubble) and widget is not self.streaming_bubble else None
+        if pool_key is None:
+            widget.deleteLater()
+            return
+        if self._bubble_pool_size >= self._BUBBLE_POOL_LIMIT:
+            # Full - evict from the key parked under longest ago, so keys left behind
+            # by an icon change drain first instead of blocking the pool
+            stale_key = next(iter(self._bubble_pool))
+            stale = self._bubble_pool[stale_key]
+            stale.pop(0).deleteLater()
+            if not stale:
+                del self._bubble_pool[stale_key]
+            self._bubble_pool_size -= 1
+        widget.hide()
+        # Re-insert so dict order tracks the most recently parked key last
+        pooled = self._bubble_pool.pop(pool_key, [])
+        pooled.append(widget)
+        self._bubble_pool[pool_key] = pooled
+        self._bubble_pool_size += 1
+
+    def _take_pooled_bubble(self, pool_key: Tuple) -> Optional[ChatBubble]:
+        """Pop a parked bubble with the given pool key, if any"""
+        pooled = self._bubble_pool.get(pool_key)
+        if not pooled:
+            return None
+        self._bubble_pool_size -= 1
+        bubble = pooled.pop()
+        if not pooled:
+            del self._bubble_pool[pool_key]
+        return bubble
+
+    def _clear_bubble_pool(self):
+        """Delete every parked bubble"""
+        for pooled in self._bubble_pool.values():
+            for bubble in pooled:
+                bubble.deleteLater()
+        self._bubble_pool.clear()
+        self._bubble_pool_size = 0
 
     def _remove_bubble_and_descendants(self, message_id: str):
         """Remove bubble and all its descendant bubbles"""
@@ -4376,7 +5062,7 @@ class ChatWindow(QMainWindow):
         if message_id in self.bubble_widgets:
             widget = self.bubble_widgets[message_id]
             self.chat_layout.removeWidget(widget)
-            widget.deleteLater()
+            self._recycle_bubble(widget)
             del self.bubble_widgets[message_id]
         
         # Recursively remove children
@@ -4483,8 +5169,7 @@ class ChatWindow(QMainWindow):
             opacity = 1.0 if bubble.message_obj.is_active else 0.6
             
             # CRITICAL: Reformat text content with new colors
-            formatted_content = bubble._format_text(bubble.message_obj.content)
-            bubble.bubble_label.setText(formatted_content)
+            bubble.set_message_text(bubble.message_obj.content)
             
             # Apply stylesheet
             new_style = f"""
@@ -4519,22 +5204,15 @@ class ChatWindow(QMainWindow):
         self.save_chat_history_signal.emit()
 
     def update_colors(self):
-        """Enhanced update_colors method for ChatWindow - SKIP BACKGROUND UPDATES"""
-        # Debouncing: Prevent rapid repeated calls
-        current_time = time.time()
-        if hasattr(self, '_last_color_update_time'):
-            if current_time - self._last_color_update_time < 0.1:  # 100ms debounce
-                return
-        self._last_color_update_time = current_time
-        
+        """Schedule a color update - a burst of calls is applied once, 50ms after the last"""
+        self._color_update_timer.start()
+
+    def _apply_colors_now(self):
+        """Apply the current colors to the window chrome and bubbles - SKIP BACKGROUND UPDATES"""
+        self._color_update_timer.stop()
         try:
-            # Determine which colors to use
-            if getattr(self.character, 'use_character_colors', False):
-                primary = getattr(self.character, 'character_primary_color', app_colors.PRIMARY)
-                secondary = getattr(self.character, 'character_secondary_color', app_colors.SECONDARY)
-            else:
-                primary = app_colors.PRIMARY
-                secondary = app_colors.SECONDARY
+            # Determine which colors to use (memoized on the character)
+            primary, secondary = self.character.resolved_colors
             
             # Only update if colors actually changed
             if hasattr(self, '_last_applied_colors'):
@@ -4542,7 +5220,14 @@ class ChatWindow(QMainWindow):
                     return  # No change, skip update
             
             self._last_applied_colors = (primary, secondary)
-            
+            self._clear_bubble_pool()  # Parked bubbles carry the old colors - no key can match them now
+        except (AttributeError, RuntimeError):
+            # Silent fail for cleanup
+            return
+        
+        # Restyle everything with painting off - one repaint at the end
+        self.setUpdatesEnabled(False)
+        try:
             # UPDATE TITLE BAR
             if hasattr(self, 'title_bar') and self.title_bar is not None:
                 self.title_bar.setStyleSheet(f"background-color: {primary};")
@@ -4560,141 +5245,18 @@ class ChatWindow(QMainWindow):
                 for btn in title_buttons:
                     if not btn:
                         continue
-                        
-                    button_text = btn.text()
-                    
-                    if button_text == "×":  # Close button
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: transparent;
-                                color: {secondary};
-                                border: none;
-                                font-size: 14pt;
-                                font-weight: bold;
-                                border-radius: 3px;
-                                padding: -3px 0px 0px 0px;
-                            }}
-                            QPushButton:hover {{
-                                background-color: rgba(255, 0, 0, 0.3);
-                            }}
-                            QPushButton:pressed {{
-                                background-color: rgba(255, 0, 0, 0.5);
-                            }}
-                        """)
-                    elif button_text == "−":  # Minimize button
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: transparent;
-                                color: {secondary};
-                                border: none;
-                                font-size: 12pt;
-                                font-weight: bold;
-                                border-radius: 3px;
-                            }}
-                            QPushButton:hover {{
-                                background-color: rgba(255, 255, 255, 0.2);
-                            }}
-                            QPushButton:pressed {{
-                                background-color: rgba(255, 255, 255, 0.3);
-                            }}
-                        """)
-                    elif button_text == "❖":  # Settings button
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: transparent;
-                                color: {secondary};
-                                border: none;
-                                font-size: 11pt;
-                                border-radius: 3px;
-                            }}
-                            QPushButton:hover {{
-                                background-color: rgba(255, 255, 255, 0.2);
-                            }}
-                            QPushButton:pressed {{
-                                background-color: rgba(255, 255, 255, 0.3);
-                            }}
-                        """)
-                    elif button_text == "📌":  # Pin button
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: transparent;
-                                color: {secondary};
-                                border: none;
-                                font-size: 11pt;
-                                border-radius: 3px;
-                            }}
-                            QPushButton:hover {{
-                                background-color: rgba(255, 255, 255, 0.2);
-                            }}
-                            QPushButton:pressed {{
-                                background-color: rgba(255, 255, 255, 0.3);
-                            }}
-                        """)
+                    template = _TITLE_BUTTON_STYLES.get(btn.text())
+                    if template is not None:
+                        btn.setStyleSheet(_themed_style(template, primary, secondary))
             
             # UPDATE SEND BUTTON
             if hasattr(self, 'send_btn') and self.send_btn is not None:
-                self.send_btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {secondary};
-                        color: {primary};
-                        border: none;
-                        border-radius: 22px;
-                        font-size: 16pt;
-                        font-weight: bold;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {primary};
-                        color: {secondary};
-                    }}
-                    QPushButton:pressed {{
-                        background-color: {secondary};
-                        color: {primary};
-                    }}
-                    QPushButton:disabled {{
-                        background-color: {secondary};
-                        color: {primary};
-                        border: none;
-                    }}
-                    QToolTip {{
-                        color: {secondary};
-                        background-color: {primary};
-                        border: 1px solid {secondary};
-                        padding: 5px;
-                        border-radius: 3px;
-                    }}
-                """)
+                self.send_btn.setStyleSheet(_themed_style(_SEND_BTN_STYLE, primary, secondary))
             
             # UPDATE CUSTOM SCROLLBAR COLORS
             if hasattr(self, 'scrollbar') and self.scrollbar is not None:
                 try:
-                    from ..utils.helpers import hex_to_rgba
-                    
-                    scrollbar_bg = hex_to_rgba(secondary, 100)
-                    scrollbar_handle = hex_to_rgba(primary, 50)
-                    scrollbar_handle_hover = hex_to_rgba(primary, 70)
-                    
-                    self.scrollbar.setStyleSheet(f"""
-                        QScrollBar:vertical {{
-                            background: {scrollbar_bg};
-                            width: 8px;
-                            border-radius: 4px;
-                            margin: 0px;
-                        }}
-                        QScrollBar::handle:vertical {{
-                            background: {scrollbar_handle};
-                            border-radius: 4px;
-                            min-height: 30px;
-                        }}
-                        QScrollBar::handle:vertical:hover {{
-                            background: {scrollbar_handle_hover};
-                        }}
-                        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                            height: 0px;
-                        }}
-                        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                            background: transparent;
-                        }}
-                    """)
+                    self.scrollbar.setStyleSheet(_scrollbar_style(primary, secondary))
                 except Exception:
                     pass
             
@@ -4702,33 +5264,11 @@ class ChatWindow(QMainWindow):
             if hasattr(self, 'input_text') and self.input_text is not None:
                 input_container = self.input_text.parent()
                 if input_container:
-                    input_container.setStyleSheet(f"""
-                        QWidget {{
-                            background-color: {secondary};
-                            border-top: none;
-                        }}
-                    """)
+                    input_container.setStyleSheet(_themed_style(_INPUT_CONTAINER_STYLE, primary, secondary))
             
             # UPDATE INPUT TEXT AREA - Add this back
             if hasattr(self, 'input_text') and self.input_text is not None:
-                self.input_text.setStyleSheet(f"""
-                    QTextEdit {{
-                        background-color: {secondary};
-                        border: none;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-family: 'Segoe UI', Arial, sans-serif;
-                        font-size: 10pt;
-                        color: {primary}
-                    }}
-                    QTextEdit:focus {{
-                        border: none;
-                        background-color: none;
-                    }}
-                    QTextEdit:hover {{
-                        border: none;
-                    }}
-                """)
+                self.input_text.setStyleSheet(_themed_style(_INPUT_TEXT_STYLE, primary, secondary))
             
             # Update bubble colors if they exist
             self._update_bubble_colors_only(primary, secondary)
@@ -4742,6 +5282,11 @@ class ChatWindow(QMainWindow):
         except (AttributeError, RuntimeError):
             # Silent fail for cleanup
             pass
+        finally:
+            try:
+                self.setUpdatesEnabled(True)
+            except RuntimeError:
+                pass
 
 
 
@@ -4765,7 +5310,8 @@ class ChatWindow(QMainWindow):
         """Refresh all chat bubble action button colors AND navigation arrows - ENHANCED VERSION"""
         if not hasattr(self, 'chat_layout') or self.chat_layout is None:
             return
-            
+        
+        primary, secondary = app_colors.PRIMARY, app_colors.SECONDARY
         try:
             for i in range(self.chat_layout.count()):
                 item = self.chat_layout.itemAt(i)
@@ -4782,69 +5328,18 @@ class ChatWindow(QMainWindow):
                                 if button_text in ["Edit", "Retry", "Del"]:
                                     # Check if button is enabled to apply correct styling
                                     if btn.isEnabled():
-                                        btn.setStyleSheet(f"""
-                                            QPushButton {{
-                                                background-color: {app_colors.SECONDARY};
-                                                color: {app_colors.PRIMARY};
-                                                border: none;
-                                                border-radius: 5px;
-                                                font-size: 8pt;
-                                                font-weight: bold;
-                                            }}
-                                            QPushButton:hover {{
-                                                background-color: {app_colors.PRIMARY};
-                                                color: {app_colors.SECONDARY};
-                                            }}
-                                            QPushButton:pressed {{
-                                                background-color: {app_colors.PRIMARY};
-                                            }}
-                                        """)
+                                        btn.setStyleSheet(_themed_style(_BUBBLE_ACTION_BTN_STYLE, primary, secondary))
                                     else:
                                         # Disabled button styling
-                                        btn.setStyleSheet(f"""
-                                            QPushButton {{
-                                                background-color: #FFF3E0;
-                                                color: #F57C00;
-                                                border: 1px solid #FFCC02;
-                                                border-radius: 5px;
-                                                font-size: 8pt;
-                                                font-weight: bold;
-                                                opacity: 0.5;
-                                            }}
-                                        """)
+                                        btn.setStyleSheet(_BUBBLE_ACTION_BTN_DISABLED_STYLE)
                                 
                                 # FIX: Update navigation arrows (← →)
                                 elif button_text in ["←", "→"]:
                                     # Check if button is enabled to apply correct styling
                                     if btn.isEnabled():
-                                        btn.setStyleSheet(f"""
-                                            QPushButton {{
-                                                background-color: {app_colors.PRIMARY};
-                                                border: none;
-                                                border-radius: 3px;
-                                                font-size: 8pt;
-                                                font-weight: bold;
-                                                color: {app_colors.SECONDARY};
-                                            }}
-                                            QPushButton:hover:enabled {{
-                                                background-color: {app_colors.SECONDARY};
-                                                color: {app_colors.PRIMARY};
-                                            }}
-                                            QPushButton:pressed {{
-                                                background-color: {app_colors.PRIMARY};
-                                            }}
-                                        """)
+                                        btn.setStyleSheet(_themed_style(_BUBBLE_NAV_BTN_STYLE, primary, secondary))
                                     else:
-                                        btn.setStyleSheet(f"""
-                                            QPushButton {{
-                                                color: #CCCCCC;
-                                                background-color: {app_colors.PRIMARY};
-                                                border: none;
-                                                border-radius: 3px;
-                                                font-size: 8pt;
-                                                font-weight: bold;
-                                            }}
-                                        """)
+                                        btn.setStyleSheet(_themed_style(_BUBBLE_NAV_BTN_DISABLED_STYLE, primary, secondary))
                     except (AttributeError, RuntimeError):
                         continue
         except (AttributeError, RuntimeError):
@@ -4983,12 +5478,7 @@ class ChatWindow(QMainWindow):
             temp_image_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Clean up old temp files
-            try:
-                for old_temp in temp_image_path.parent.glob("temp_bg_*.png"):
-                    if old_temp.name != temp_image_path.name:
-                        old_temp.unlink()
-            except:
-                pass
+            remove_temp_backgrounds(temp_image_path.parent, keep=temp_image_path.name)
             
             # Save new background
             bg_pixmap.save(str(temp_image_path))
@@ -5076,12 +5566,7 @@ class ChatWindow(QMainWindow):
         try:
             # Remove any existing temp files
             app_data_dir = get_app_data_dir()
-            char_dir = app_data_dir / "characters" / self.character.name
-            for temp_file in char_dir.glob("temp_bg_*.png"):
-                try:
-                    temp_file.unlink()
-                except:
-                    pass
+            remove_temp_backgrounds(app_data_dir / "characters" / self.character.name)
             
             # Clear widget completely
             self.chat_area.setStyleSheet("")
@@ -5112,12 +5597,7 @@ class ChatWindow(QMainWindow):
         try:
             # Remove any existing temp files first
             app_data_dir = get_app_data_dir()
-            char_dir = app_data_dir / "characters" / self.character.name
-            for temp_file in char_dir.glob("temp_bg_*.png"):
-                try:
-                    temp_file.unlink()
-                except:
-                    pass
+            remove_temp_backgrounds(app_data_dir / "characters" / self.character.name)
             
             # Clear the widget completely
             self.chat_area.setStyleSheet("")
@@ -5941,11 +6421,8 @@ class ChatWindow(QMainWindow):
         try:
             self.always_on_top = not self.always_on_top
             
-            # Apply the pin status directly
-            if self.always_on_top:
-                self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
-            else:
-                self.setWindowFlags(self.windowFlags() & ~Qt.WindowStaysOnTopHint)
+            # Apply the pin status directly (flip only the stay-on-top bit)
+            self.setWindowFlag(Qt.WindowStaysOnTopHint, self.always_on_top)
             
             # Always show after changing flags
             self.show()
@@ -5963,12 +6440,14 @@ class ChatWindow(QMainWindow):
 
     def _keep_window_on_top(self):
         """Keep chat window on top by raising it when needed"""
-        if (self.always_on_top and 
-            self.isVisible() and 
-            not self.isMinimized() and 
-            QApplication.activeWindow() != self):
-            
-            self.raise_()
+        # Cheapest checks first - bail out before touching the window system
+        if not self.always_on_top:
+            return
+        if self.windowState() & Qt.WindowMinimized:
+            return
+        if not self.isVisible() or QApplication.activeWindow() is self:
+            return
+        self.raise_()
 
     def _save_window_state(self):
         """Save chat window state including pin status (async to prevent lag)"""
@@ -5986,16 +6465,8 @@ class ChatWindow(QMainWindow):
                 "always_on_top": getattr(self, 'always_on_top', False)
             }
             
-            # ✅ Save asynchronously to prevent UI lag
-            import threading
-            def save_async():
-                try:
-                    with open(state_file, 'w') as f:
-                        json.dump(state, f, indent=2)
-                except Exception as e:
-                    print(f"Error saving chat window state: {e}")
-            
-            threading.Thread(target=save_async, daemon=True).start()
+            # ✅ Save on the thread pool to prevent UI lag (waited on at app shutdown)
+            QThreadPool.globalInstance().start(FileWriteWorker(dump_json_bytes(state, indent=True), state_file))
                 
         except Exception as e:
             print(f"Error preparing chat window state: {e}")
@@ -6947,7 +7418,7 @@ class ChatWindow(QMainWindow):
             self.input_text.setPlaceholderText("AI is thinking...")
         
         # Queue for AI response
-        self.message_queue.put((message, user_msg.id))
+        self.message_queue.put((message, user_msg.id, None))
         
         # Save history
         self._save_chat_history()
@@ -7091,12 +7562,9 @@ class ChatWindow(QMainWindow):
                 # Update the bubble's internal message reference
                 bubble.message_obj = message
                 
-                # Format text only once
-                formatted_text = bubble._format_text(message.content)
-                
-                # Update text WITHOUT triggering repaint
+                # Update text WITHOUT triggering repaint (no-op if the HTML is unchanged)
                 if hasattr(bubble, 'bubble_label') and bubble.bubble_label:
-                    bubble.bubble_label.setText(formatted_text)
+                    bubble.set_message_text(message.content)
             
             if active_changed:
                 # Update opacity without triggering style recalculation
@@ -7129,16 +7597,10 @@ class ChatWindow(QMainWindow):
         # Get current style and modify opacity without triggering updates
         current_style = bubble.bubble_label.styleSheet()
         
-        # Use regex to replace existing opacity or add new one
-        import re
-        if 'opacity:' in current_style:
-            new_style = re.sub(r'opacity:\s*[\d.]+;?', f'opacity: {opacity};', current_style)
-        else:
-            # Add opacity to existing style
-            if current_style.strip().endswith('}'):
-                new_style = current_style.rstrip('}').rstrip() + f' opacity: {opacity}; }}'
-            else:
-                new_style = current_style + f' opacity: {opacity};'
+        # Replace existing opacity or add new one
+        new_style = _style_with_opacity(current_style, opacity)
+        if new_style == current_style:
+            return
         
         # Block all signals and updates
         bubble.bubble_label.blockSignals(True)
@@ -7358,7 +7820,7 @@ class ChatWindow(QMainWindow):
                 self._smart_refresh_for_navigation(affected_messages)
                 
                 # Process with AI - use tuple format
-                self.message_queue.put((new_content, new_message_id))
+                self.message_queue.put((new_content, new_message_id, None))
             else:
                 # For assistant messages, just update the bubble
                 if new_message:
@@ -7415,7 +7877,7 @@ class ChatWindow(QMainWindow):
                         self._smart_refresh_for_navigation(affected_messages)
                     
                     # Re-send to AI for a new sibling response
-                    self.message_queue.put((parent_message.content, parent_id))
+                    self.message_queue.put((parent_message.content, parent_id, None))
                     self._save_chat_history()
 
     def _handle_delete_message(self, message_obj: ChatMessage):
@@ -7638,6 +8100,7 @@ class ChatWindow(QMainWindow):
             
             # Update the label text (this should set it as plain text, not HTML)
             self.streaming_bubble.bubble_label.setText(display_text)
+            self.streaming_bubble._last_formatted = None  # label no longer holds formatted HTML
             
             # Auto-resize bubble width based on content
             if self.streaming_text.strip():
@@ -7686,7 +8149,10 @@ class ChatWindow(QMainWindow):
         """Background thread with enhanced name replacement and FIXED stop functionality"""
         while True:
             try:
-                message, parent_id = self.message_queue.get(timeout=1)
+                item = self.message_queue.get(timeout=1)
+                if item is None:
+                    break  # Stop sentinel from closeEvent
+                message, parent_id, personality_override = item
 
                 # Reset streaming state for fresh message
                 self.streaming_stopped = False
@@ -7706,16 +8172,19 @@ class ChatWindow(QMainWindow):
                 character_name = getattr(self.character, 'display_name', self.character.name)
                 user_name = user_profile.user_name if user_profile else "User"
 
+                # Per-request personality (e.g. interactions) takes precedence
+                personality = personality_override or self.character.personality
+
                 # Build enhanced personality with user context
                 if user_profile:
-                    enhanced_personality = f"""You are {character_name} - {self.character.personality}
+                    enhanced_personality = f"""You are {character_name} - {personality}
 
     User Profile:
     {user_name} is {user_profile.name}. {user_profile.personality}
 
     Important: Always refer to the user as {user_name} and yourself as {character_name} in your responses."""
                 else:
-                    enhanced_personality = f"""You are {character_name} - {self.character.personality}
+                    enhanced_personality = f"""You are {character_name} - {personality}
 
     Important: Always refer to the user as {user_name} and yourself as {character_name} in your responses."""
 
@@ -7940,11 +8409,10 @@ class ChatWindow(QMainWindow):
         was_at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 10
         saved_scroll = scroll_bar.value() if not was_at_bottom else None
         
+        # Tree may have changed - re-sort lazily on the next scroll-up
+        self._invalidate_sorted_messages()
+        
         try:
-            # IMPORTANT: We get ALL messages but only DISPLAY some
-            all_active_messages = self._collect_all_active_messages()
-            all_active_messages.sort(key=lambda msg: msg.timestamp)
-            
             # If this is the first refresh or we need to rebuild
             if not self.loaded_message_ids or len(self.bubble_widgets) == 0:
                 # Clear current display only
@@ -7959,7 +8427,7 @@ class ChatWindow(QMainWindow):
                 
                 # Load only recent messages for DISPLAY
                 # But ALL messages still exist in chat_tree
-                recent_messages = all_active_messages[-self.messages_per_page:] if len(all_active_messages) > self.messages_per_page else all_active_messages
+                recent_messages = self._collect_recent_active_messages(self.messages_per_page)
                 
                 # Add recent messages to display
                 for msg in recent_messages:
@@ -7971,8 +8439,11 @@ class ChatWindow(QMainWindow):
                     # Track oldest loaded
                     if self.oldest_loaded_timestamp is None or msg.timestamp < self.oldest_loaded_timestamp:
                         self.oldest_loaded_timestamp = msg.timestamp
+                
+                self.last_message_count = len(recent_messages)
             else:
                 # Smart refresh - only update what's needed
+                all_active_messages = self._get_sorted_all_messages()
                 current_message_ids = {msg.id for msg in all_active_messages}
                 
                 # Remove bubbles that shouldn't be displayed
@@ -8001,9 +8472,9 @@ class ChatWindow(QMainWindow):
                                 break
                         
                         self.chat_layout.insertWidget(position, bubble)
-            
-            # Update tracking
-            self.last_message_count = len(all_active_messages)
+                
+                # Update tracking
+                self.last_message_count = len(all_active_messages)
             
         finally:
             self.update_in_progress = False
@@ -8169,6 +8640,23 @@ class ChatWindow(QMainWindow):
         # Filter out hidden messages
         return [msg for msg in active_messages if not getattr(msg, 'is_hidden', False)]
 
+    def _collect_recent_active_messages(self, limit: int) -> List[ChatMessage]:
+        """Return only the newest `limit` active messages, oldest first, without sorting the whole tree"""
+        # Key on (timestamp, position) so equal timestamps keep tree order after the reverse
+        recent = heapq.nlargest(limit, enumerate(self._collect_all_active_messages()),
+                                key=lambda item: (item[1].timestamp, item[0]))
+        recent.reverse()
+        return [msg for _, msg in recent]
+
+    def _get_sorted_all_messages(self) -> List[ChatMessage]:
+        """Return all active messages sorted by timestamp, cached until the tree changes"""
+        if self._sorted_all_messages is None:
+            all_messages = self._collect_all_active_messages()
+            all_messages.sort(key=lambda msg: msg.timestamp)
+            self._sorted_all_messages = all_messages
+            self._sorted_timestamps = [msg.timestamp for msg in all_messages]
+        return self._sorted_all_messages
+
     # 5. Add method to get full conversation for AI (separate from display):
     def _get_full_conversation_for_ai(self) -> List[Dict[str, str]]:
         """Get the complete conversation history for AI context"""
@@ -8199,20 +8687,40 @@ class ChatWindow(QMainWindow):
         # Recursively check all children (not just active ones)
         for child_id in message.children_ids:
             self._collect_active_recursive(child_id, result, visited)    
+    def _schedule_save(self):
+        """Mark chat history dirty and save it once after a short quiet period"""
+        self._save_dirty = True
+        if not self._save_pending:
+            self._save_pending = True
+            QTimer.singleShot(250, self._flush_scheduled_save)
+
+    def _flush_scheduled_save(self):
+        """Write chat history if a scheduled save is still outstanding"""
+        self._save_pending = False
+        if self._save_dirty:
+            self._save_chat_history()
+
     def _save_chat_history(self):
         """Save chat tree to file"""
+        self._save_dirty = False
+        self._invalidate_sorted_messages()
         app_data_dir = get_app_data_dir()
         history_file = app_data_dir / "characters" / self.character.name / "chat_history.json"
         history_file.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(history_file, 'w', encoding='utf-8') as f:
-                # Save the entire tree structure
-                data = {
-                    "messages": {msg_id: asdict(msg) for msg_id, msg in self.chat_tree.messages.items()},
-                    "roots": self.chat_tree.roots
-                }
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Save the entire tree structure
+            data = {
+                "messages": {msg_id: msg.to_dict() for msg_id, msg in self.chat_tree.messages.items()},
+                "roots": self.chat_tree.roots
+            }
+            payload = dump_json_bytes(data, indent=True)
+            if self._write_in_background:
+                # App shutdown - MainApplication waits for the pool before exiting
+                QThreadPool.globalInstance().start(FileWriteWorker(payload, history_file))
+            else:
+                # Atomic swap so a crash mid-write never truncates the history
+                write_file_atomic(payload, history_file)
         except Exception as e:
             print(f"Error saving history: {e}")
     
@@ -8336,6 +8844,11 @@ class ChatWindow(QMainWindow):
         # Save window state (ADD THIS LINE)
         self._save_window_state()
         
+        # Flush any coalesced chat history / check-in settings save
+        if self._save_dirty:
+            self._save_chat_history()
+        self._flush_checkin_settings()
+        
         # Stop the keep on top timer if it exists (ADD THIS)
         if hasattr(self, '_keep_on_top_timer') and self._keep_on_top_timer:
             self._keep_on_top_timer.stop()
@@ -8348,6 +8861,12 @@ class ChatWindow(QMainWindow):
         if hasattr(self, 'schedule_timer') and self.schedule_timer:
             self.schedule_timer.stop()
         
+        # Don't block on in-flight API calls; drop ones still queued. Copy the set -
+        # finishing calls discard themselves from the executor threads
+        self._closed = True
+        for future in list(self._api_futures):
+            future.cancel()
+        
         # Clear from parent's tracking immediately
         try:
             parent = self.parent()
@@ -8360,6 +8879,18 @@ class ChatWindow(QMainWindow):
         
         # Accept the close event
         event.accept()
+        
+        # Closed chat windows are never reused - stop the message thread, then
+        # free the widget tree once it is idle (an in-flight reply still gets saved)
+        self.message_queue.put(None)
+        self._delete_when_idle()
+
+    def _delete_when_idle(self):
+        """deleteLater once the message thread and API calls are done, polling while a reply is in flight"""
+        if self.processing_thread.is_alive() or self._api_futures:
+            QTimer.singleShot(200, self._delete_when_idle)
+            return
+        self.deleteLater()
 
     def _load_icon(self, icon_path, scale=1.0, offset_x=0, offset_y=0, force_refresh=False):
         """Load and create high-quality circular icon with force refresh option"""
@@ -8753,8 +9284,7 @@ class ChatWindow(QMainWindow):
             print("🗑️ Clearing all chat history...")
             
             # Clear the chat tree
-            self.chat_tree.messages.clear()
-            self.chat_tree.roots.clear()
+            self.chat_tree.clear()
             
             # IMPORTANT: Clear the bubble widgets dictionary
             self.bubble_widgets.clear()
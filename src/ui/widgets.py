@@ -1,4 +1,5 @@
 """UI Widgets"""
+import functools
 from ..common_imports import *
 from ..models.character import CharacterConfig, Interaction
 from ..models.chat_models import ChatMessage
@@ -7,6 +8,83 @@ from ..utils.helpers import hex_to_rgba, replace_name_placeholders, get_darker_s
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtCore import QTimer
 
+
+@functools.lru_cache(maxsize=512)
+def _format_text_cached(text: str, character_name: str, user_name: str, colors: Tuple[str, ...]) -> str:
+    """Convert markdown-like syntax to rich text - memoized on content, names and config colors"""
+    emphasis_color, quote_color, strikethrough_color, code_bg_color, code_text_color, link_color = colors
+    
+    # Replace name placeholders FIRST
+    text = replace_name_placeholders(text, character_name, user_name)
+
+    # 1. Escape HTML characters first to prevent conflicts
+    text = html.escape(text)
+
+    # 2. Headers (convert to bold with color and larger size)
+    text = re.sub(r'^#\s+(.+)$', lambda m: (
+        f'<div style="font-size: 14px; font-weight: bold; color: {emphasis_color}; margin: 8px 0 4px 0;">{m.group(1)}</div>'
+    ), text, flags=re.MULTILINE)
+
+    # 3. Block quotes (enhanced styling with left border)
+    def replace_blockquote(m):
+        return f'<div style="border-left: 4px solid {quote_color}; padding-left: 12px; margin: 8px 0; color: {quote_color}; font-style: italic; background-color: rgba(128,128,128,0.1);">{m.group(1)}</div>'
+
+    text = re.sub(r'^&gt;\s+(.+)$', replace_blockquote, text, flags=re.MULTILINE)
+
+    # 4. Code blocks (triple backticks)
+    def replace_code_block(m):
+        return f'<div style="background-color: {code_bg_color}; color: {code_text_color}; padding: 8px; margin: 4px 0; border-radius: 4px; font-family: monospace; white-space: pre-wrap; font-size: 11px;">{m.group(1)}</div>'
+
+    text = re.sub(r'```(.*?)```', replace_code_block, text, flags=re.DOTALL)
+
+    # 5. Inline code (single backticks)
+    def replace_inline_code(m):
+        return f'<code style="background-color: {code_bg_color}; color: {code_text_color}; padding: 2px 4px; border-radius: 3px; font-family: monospace; font-size: 11px;">{m.group(1)}</code>'
+
+    text = re.sub(r'`([^`]+?)`', replace_inline_code, text)
+
+    # 6. REORDERED: Process bold and italic BEFORE quotes for better nesting
+    # Bold (allows nested content)
+    text = re.sub(r'\*\*((?:(?!\*\*).)+?)\*\*', lambda m: (
+        f'<b style="color: {emphasis_color};">{m.group(1)}</b>'
+    ), text)
+
+    # Italic (allows nested content, avoids bold conflicts)
+    text = re.sub(r'(?<!\*)\*((?:(?!\*).)+?)\*(?!\*)', lambda m: (
+        f'<i style="color: {emphasis_color};">{m.group(1)}</i>'
+    ), text)
+
+    # 7. Quote handling - work with HTML escaped quotes (AFTER bold/italic)
+    def replace_quotes(m):
+        return f'<span style="color: {quote_color};">&quot;{m.group(1)}&quot;</span>'
+
+    text = re.sub(r'&quot;((?:(?!&quot;).)*?)&quot;', replace_quotes, text)
+
+    # 8. Strikethrough
+    text = re.sub(r'~~([^~]+?)~~', lambda m: (
+        f'<s style="color: {strikethrough_color};">{m.group(1)}</s>'
+    ), text)
+
+    def process_link(match):
+        url = match.group(1)
+        # Add protocol if missing
+        if not url.startswith(('http://', 'https://')):
+            href = f'http://{url}'
+        else:
+            href = url
+        return f'<a href="{href}" style="color: {link_color}; text-decoration: underline;">{url}</a>'
+
+    # Single comprehensive regex for all link types
+    text = re.sub(r'\b((?:https?://|www\.)[^\s"\'<>\[\]]+|[a-zA-Z0-9-]+\.(?:com|org|net|edu|gov|io|co|ai|me|info)(?:/[^\s"\'<>\[\]]*)?)\b', 
+                process_link, text)
+
+    # 9. Line breaks
+    text = text.replace('\n', '<br>')
+
+    # 10. Wrap in center div
+    return f'<div style="text-align: center;">{text}</div>'
+
+
 class ChatBubble(QWidget):
     """Chat bubble widget - Fixed width and text alignment"""
     
@@ -24,6 +102,7 @@ class ChatBubble(QWidget):
         self.message_obj = message_obj
         self.config = config
         self.bubble_label = None
+        self._last_formatted = None  # HTML currently shown in bubble_label
         # 🆕 STORE THE PASSED COLORS
         self.primary_color = primary_color or app_colors.PRIMARY
         self.secondary_color = secondary_color or app_colors.SECONDARY
@@ -43,8 +122,16 @@ class ChatBubble(QWidget):
         self.setMaximumWidth(340)
         self.setMinimumWidth(340)
         
+        # Kept so pooled bubbles are only reused with the same icons
+        self._user_icon = user_icon
+        self._character_icon = character_icon
+        self._nav_prev_btn = self._nav_next_btn = self._nav_pos_label = None
+        
         # Create main container
         self._create_bubble_layout(user_icon, character_icon)
+        
+        # Structure the layout was built with (action buttons, navigation arrows)
+        self._built_shape = (self.is_user, self.has_siblings, message_obj.is_active)
 
     def _apply_chat_icon(self, icon_label: QLabel, icon_source, letter_fallback: str, fallback_color: str, size: int = 42):
         """Set a crisp circular icon and refresh after show to fix first-time DPR issues."""
@@ -79,88 +166,29 @@ class ChatBubble(QWidget):
 
     def _format_text(self, text: str) -> str:
         """Convert markdown-like syntax to rich text formatting with name replacement"""
-        
         # Use the names passed to the constructor, with fallbacks
         character_name = self.character_name or "Assistant"
         user_name = self.user_name or "User"
-        
-        # Replace name placeholders FIRST
-        text = replace_name_placeholders(text, character_name, user_name)
 
         # Colors from config
-        emphasis_color = getattr(self.config, "emphasis_color", "#0D47A1")
-        quote_color = getattr(self.config, "quote_color", "#666666")
-        strikethrough_color = getattr(self.config, "strikethrough_color", "#757575")
-        code_bg_color = getattr(self.config, "code_bg_color", "rgba(0,0,0,0.1)")
-        code_text_color = getattr(self.config, "code_text_color", "#D32F2F")
-        link_color = getattr(self.config, "link_color", "#1976D2")
-
-        # 1. Escape HTML characters first to prevent conflicts
-        text = html.escape(text)
-
-        # 2. Headers (convert to bold with color and larger size)
-        text = re.sub(r'^#\s+(.+)$', lambda m: (
-            f'<div style="font-size: 14px; font-weight: bold; color: {emphasis_color}; margin: 8px 0 4px 0;">{m.group(1)}</div>'
-        ), text, flags=re.MULTILINE)
-
-        # 3. Block quotes (enhanced styling with left border)
-        def replace_blockquote(m):
-            return f'<div style="border-left: 4px solid {quote_color}; padding-left: 12px; margin: 8px 0; color: {quote_color}; font-style: italic; background-color: rgba(128,128,128,0.1);">{m.group(1)}</div>'
-
-        text = re.sub(r'^&gt;\s+(.+)$', replace_blockquote, text, flags=re.MULTILINE)
-
-        # 4. Code blocks (triple backticks)
-        def replace_code_block(m):
-            return f'<div style="background-color: {code_bg_color}; color: {code_text_color}; padding: 8px; margin: 4px 0; border-radius: 4px; font-family: monospace; white-space: pre-wrap; font-size: 11px;">{m.group(1)}</div>'
-
-        text = re.sub(r'```(.*?)```', replace_code_block, text, flags=re.DOTALL)
-
-        # 5. Inline code (single backticks)
-        def replace_inline_code(m):
-            return f'<code style="background-color: {code_bg_color}; color: {code_text_color}; padding: 2px 4px; border-radius: 3px; font-family: monospace; font-size: 11px;">{m.group(1)}</code>'
-
-        text = re.sub(r'`([^`]+?)`', replace_inline_code, text)
-
-        # 6. REORDERED: Process bold and italic BEFORE quotes for better nesting
-        # Bold (allows nested content)
-        text = re.sub(r'\*\*((?:(?!\*\*).)+?)\*\*', lambda m: (
-            f'<b style="color: {emphasis_color};">{m.group(1)}</b>'
-        ), text)
-
-        # Italic (allows nested content, avoids bold conflicts)
-        text = re.sub(r'(?<!\*)\*((?:(?!\*).)+?)\*(?!\*)', lambda m: (
-            f'<i style="color: {emphasis_color};">{m.group(1)}</i>'
-        ), text)
-
-        # 7. Quote handling - work with HTML escaped quotes (AFTER bold/italic)
-        def replace_quotes(m):
-            return f'<span style="color: {quote_color};">&quot;{m.group(1)}&quot;</span>'
-
-        text = re.sub(r'&quot;((?:(?!&quot;).)*?)&quot;', replace_quotes, text)
-
-        # 8. Strikethrough
-        text = re.sub(r'~~([^~]+?)~~', lambda m: (
-            f'<s style="color: {strikethrough_color};">{m.group(1)}</s>'
-        ), text)
-
-        def process_link(match):
-            url = match.group(1)
-            # Add protocol if missing
-            if not url.startswith(('http://', 'https://')):
-                href = f'http://{url}'
-            else:
-                href = url
-            return f'<a href="{href}" style="color: {link_color}; text-decoration: underline;">{url}</a>'
-
-        # Single comprehensive regex for all link types
-        text = re.sub(r'\b((?:https?://|www\.)[^\s"\'<>\[\]]+|[a-zA-Z0-9-]+\.(?:com|org|net|edu|gov|io|co|ai|me|info)(?:/[^\s"\'<>\[\]]*)?)\b', 
-                    process_link, text)
-
-        # 9. Line breaks
-        text = text.replace('\n', '<br>')
-
-        # 10. Wrap in center div
-        return f'<div style="text-align: center;">{text}</div>'
+        colors = (
+            getattr(self.config, "emphasis_color", "#0D47A1"),
+            getattr(self.config, "quote_color", "#666666"),
+            getattr(self.config, "strikethrough_color", "#757575"),
+            getattr(self.config, "code_bg_color", "rgba(0,0,0,0.1)"),
+            getattr(self.config, "code_text_color", "#D32F2F"),
+            getattr(self.config, "link_color", "#1976D2"),
+        )
+        return _format_text_cached(text, character_name, user_name, colors)
+
+    def set_message_text(self, text: str) -> bool:
+        """Format text into the bubble label, skipping setText when the rendered HTML is unchanged"""
+        formatted_content = self._format_text(text)
+        if formatted_content == self._last_formatted:
+            return False
+        self._last_formatted = formatted_content
+        self.bubble_label.setText(formatted_content)
+        return True
 
 
     def _create_bubble_layout(self, user_icon, character_icon):
@@ -319,10 +347,69 @@ class ChatBubble(QWidget):
         return min(width, available_width)
 
 
+    def _bubble_label_style(self) -> str:
+        """Label stylesheet for this bubble's role, config colors and active state"""
+        opacity_value = 1.0 if self.message_obj.is_active else 0.6
+        
+        # Use getattr for safe attribute access
+        if self.is_user:
+            transparency = getattr(self.config, 'user_bubble_transparency', 0)
+            base_color, text_color = self.config.user_bubble_color, self.config.user_text_color
+        else:
+            transparency = getattr(self.config, 'bubble_transparency', 0)
+            base_color, text_color = self.config.bubble_color, self.config.text_color
+        bubble_bg_color = hex_to_rgba(base_color, transparency) if transparency > 0 else base_color
+        
+        return f"""
+            QLabel {{
+                background-color: {bubble_bg_color};
+                color: {text_color};
+                padding: 10px;
+                border-radius: 12px;
+                font-family: {self.config.text_font};
+                font-size: {self.config.text_size}px;
+                opacity: {opacity_value};
+            }}
+        """
+
+    @property
+    def pool_key(self) -> Optional[Tuple]:
+        """Widget-structure key - bubbles with equal keys can be rebound to each other's messages"""
+        if self._built_shape is None:
+            return None
+        return self.make_pool_key(*self._built_shape, self.primary_color, self.secondary_color,
+                                  self._user_icon, self._character_icon)
+
+    @staticmethod
+    def make_pool_key(is_user: bool, has_siblings: bool, is_active: bool, primary_color, secondary_color,
+                      user_icon, character_icon) -> Tuple:
+        """pool_key a bubble built with these arguments would have"""
+        return (is_user, has_siblings, is_active, primary_color, secondary_color, id(user_icon), id(character_icon))
+
+    def rebind(self, message_obj: ChatMessage, sibling_position=None, indent_level=0,
+               character_name=None, user_name=None):
+        """Reuse this bubble for another message with the same pool_key"""
+        self.message_obj = message_obj
+        self.sibling_position = sibling_position
+        self.indent_level = min(indent_level, 3)
+        self.character_name = character_name
+        self.user_name = user_name
+        
+        self.bubble_label.setFixedWidth(self._calculate_bubble_width(message_obj.content, self._available_width))
+        self.set_message_text(message_obj.content)
+        self.bubble_label.setStyleSheet(self._bubble_label_style())
+        
+        if self.has_siblings and self.sibling_position:
+            index, count = self.sibling_position
+            self._nav_prev_btn.setEnabled(index > 0)
+            self._nav_next_btn.setEnabled(index < count - 1)
+            if self._nav_pos_label is not None:
+                self._nav_pos_label.setText(f"{index + 1}/{count}")
+
     def _create_user_bubble(self, layout, user_icon, indent_pixels):
         """Create user message bubble with circular icon - FIXED positioning"""
         # Available width for bubble (no indent deduction here)
-        available_width = 280 - (28 if self.has_siblings else 0)
+        available_width = self._available_width = 280 - (28 if self.has_siblings else 0)
         
         # Left stretch to push content right (ALWAYS add this first)
         layout.addStretch()
@@ -338,8 +425,7 @@ class ChatBubble(QWidget):
         # Create the text label
         self.bubble_label = QLabel()
         self.bubble_label.setTextFormat(Qt.TextFormat.RichText)
-        formatted_content = self._format_text(self.message_obj.content)
-        self.bubble_label.setText(formatted_content)
+        self.set_message_text(self.message_obj.content)
         self.bubble_label.setWordWrap(True)
         
         # Enable link clicking AND text selection
@@ -355,26 +441,7 @@ class ChatBubble(QWidget):
         self.bubble_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
         
         # Styling with transparency support
-        opacity_value = 1.0 if self.message_obj.is_active else 0.6
-        
-        # Use getattr for safe attribute access
-        user_bubble_transparency = getattr(self.config, 'user_bubble_transparency', 0)
-        if user_bubble_transparency > 0:
-            bubble_bg_color = hex_to_rgba(self.config.user_bubble_color, user_bubble_transparency)
-        else:
-            bubble_bg_color = self.config.user_bubble_color
-        
-        self.bubble_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bubble_bg_color};
-                color: {self.config.user_text_color};
-                padding: 10px;
-                border-radius: 12px;
-                font-family: {self.config.text_font};
-                font-size: {self.config.text_size}px;
-                opacity: {opacity_value};
-            }}
-        """)
+        self.bubble_label.setStyleSheet(self._bubble_label_style())
         
         layout.addWidget(self.bubble_label)
         
@@ -410,7 +477,7 @@ class ChatBubble(QWidget):
         layout.addWidget(icon_widget)
 
         # Available width for bubble (no indent deduction here)
-        available_width = 280 - (20 if self.has_siblings else 0)
+        available_width = self._available_width = 280 - (20 if self.has_siblings else 0)
         
         # Calculate bubble width
         bubble_width = self._calculate_bubble_width(self.message_obj.content, available_width)
@@ -418,8 +485,7 @@ class ChatBubble(QWidget):
         # Create the text label with rich text support
         self.bubble_label = QLabel()
         self.bubble_label.setTextFormat(Qt.TextFormat.RichText)
-        formatted_content = self._format_text(self.message_obj.content)
-        self.bubble_label.setText(formatted_content)
+        self.set_message_text(self.message_obj.content)
         self.bubble_label.setWordWrap(True)
         
         # Enable link clicking AND text selection
@@ -435,26 +501,7 @@ class ChatBubble(QWidget):
         self.bubble_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
         
         # Styling with transparency support
-        opacity_value = 1.0 if self.message_obj.is_active else 0.6
-        
-        # Use getattr for safe attribute access
-        bubble_transparency = getattr(self.config, 'bubble_transparency', 0)
-        if bubble_transparency > 0:
-            bubble_bg_color = hex_to_rgba(self.config.bubble_color, bubble_transparency)
-        else:
-            bubble_bg_color = self.config.bubble_color
-        
-        self.bubble_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bubble_bg_color};
-                color: {self.config.text_color};
-                padding: 10px;
-                border-radius: 12px;
-                font-family: {self.config.text_font};
-                font-size: {self.config.text_size}px;
-                opacity: {opacity_value};
-            }}
-        """)
+        self.bubble_label.setStyleSheet(self._bubble_label_style())
         
         layout.addWidget(self.bubble_label)
         
@@ -469,6 +516,7 @@ class ChatBubble(QWidget):
 
     def _update_navigation_controls_silent(self):
         """Update navigation controls when sibling information changes"""
+        self._built_shape = None  # Layout no longer matches a freshly built bubble - never pool it
         try:
             # Find existing navigation widget
             nav_widget = None
@@ -554,6 +602,7 @@ class ChatBubble(QWidget):
         """)
         prev_btn.clicked.connect(lambda: self.navigate_sibling.emit(self.message_obj, -1))
         nav_layout.addWidget(prev_btn)
+        self._nav_prev_btn = prev_btn
         
         # Position indicator
         if self.sibling_position:
@@ -568,6 +617,7 @@ class ChatBubble(QWidget):
                 }
             """)
             nav_layout.addWidget(pos_label)
+            self._nav_pos_label = pos_label
         
         # Next button
         next_btn = QPushButton("→")
@@ -593,6 +643,7 @@ class ChatBubble(QWidget):
         """)
         next_btn.clicked.connect(lambda: self.navigate_sibling.emit(self.message_obj, 1))
         nav_layout.addWidget(next_btn)
+        self._nav_next_btn = next_btn
         
         nav_layout.addStretch()
         
@@ -15,6 +15,7 @@ from .helpers import (
 from .file_manager import (
     get_app_data_dir, 
     cleanup_temp_files,
+    remove_temp_backgrounds,
     CharacterManager, 
     UserProfileManager
 )
@@ -30,6 +31,7 @@ __all__ = [
     # File Management Functions
     'get_app_data_dir',
     'cleanup_temp_files',
+    'remove_temp_backgrounds',
     
     # Manager Classes
     'CharacterManager',
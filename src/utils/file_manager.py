@@ -1,5 +1,7 @@
 """File management utilities"""
 """File management utilities"""
+import copy
+import functools
 from ..common_imports import *
 from ..models.character import CharacterConfig, Interaction
 from ..models.user_profile import UserProfile, UserSettings
@@ -8,8 +10,9 @@ from ..utils.helpers import safe_copy_file
 
 
 
+@functools.lru_cache(maxsize=1)
 def get_app_data_dir():
-    """Get application data directory - LOCAL PROJECT STORAGE VERSION"""
+    """Get application data directory - LOCAL PROJECT STORAGE VERSION (cached)"""
     # Get the project root directory (where src/ is located)
     current_file = Path(__file__)  # This file: src/utils/file_manager.py
     project_root = current_file.parent.parent.parent  # Go up 3 levels to project root
@@ -20,27 +23,46 @@ def get_app_data_dir():
     return app_dir
 
 
+def _is_temp_background(name: str) -> bool:
+    """True for generated chat backgrounds (temp_bg_*.png) - plain string checks, no Path objects"""
+    return name.startswith("temp_bg_") and name.endswith(".png")
+
+
+def remove_temp_backgrounds(char_dir, keep: Optional[str] = None) -> int:
+    """Delete temp_bg_*.png files in a character folder (except `keep`), returning how many were removed"""
+    removed = 0
+    try:
+        with os.scandir(char_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name != keep and _is_temp_background(name):
+                    try:
+                        os.unlink(entry.path)
+                        removed += 1
+                    except OSError as e:
+                        print(f"⚠️ Could not clean temp file {entry.path}: {e}")
+    except FileNotFoundError:
+        pass
+    return removed
+
+
 def cleanup_temp_files(character_name: str):
     """Clean up temporary files for a character"""
     try:
         app_data_dir = get_app_data_dir()
         char_dir = app_data_dir / "characters" / character_name
         
-        # Clean up temp background files
-        for temp_file in char_dir.glob("temp_bg_*.png"):
-            try:
-                temp_file.unlink()
-                print(f"🧹 Cleaned up temp file: {temp_file}")
-            except Exception as e:
-                print(f"⚠️ Could not clean temp file {temp_file}: {e}")
-                
-        # Clean up any orphaned files
-        for orphan in char_dir.glob("*.tmp"):
-            try:
-                orphan.unlink()
-                print(f"🧹 Cleaned up orphaned file: {orphan}")
-            except Exception as e:
-                print(f"⚠️ Could not clean orphaned file {orphan}: {e}")
+        # One directory pass for both temp backgrounds and orphaned .tmp files
+        with os.scandir(char_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (_is_temp_background(name) or name.endswith(".tmp")):
+                    continue
+                try:
+                    os.unlink(entry.path)
+                    print(f"🧹 Cleaned up temp file: {entry.path}")
+                except OSError as e:
+                    print(f"⚠️ Could not clean temp file {entry.path}: {e}")
                 
     except Exception as e:
         print(f"⚠️ Error during cleanup: {e}")
@@ -52,10 +74,20 @@ class CharacterManager:
         app_data_dir = get_app_data_dir()
         self.characters_dir = app_data_dir / "characters"
         self.characters_dir.mkdir(exist_ok=True)
+        # folder name -> (config.json mtime_ns, loaded CharacterConfig)
+        self._cache: Dict[str, Tuple[int, CharacterConfig]] = {}
+        
+    def invalidate(self, name: Optional[str] = None):
+        """Drop the cached config for one character (or all of them)"""
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
         
     def get_characters(self) -> List[str]:
         """Get list of all characters"""
-        return [d.name for d in self.characters_dir.iterdir() if d.is_dir()]
+        with os.scandir(self.characters_dir) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
     
     def create_character(self, folder_name: str, display_name: str, image_path: str, personality: str) -> bool:
         """Create a new character with separate folder and display names"""
@@ -94,8 +126,7 @@ class CharacterManager:
                 text_font="Arial"
             )
             
-            with open(char_dir / "config.json", 'w', encoding='utf-8') as f:
-                json.dump(asdict(config), f, indent=2)
+            dump_json_file(config, char_dir / "config.json", indent=True)
             
             # Create interactions directory
             (char_dir / "interactions").mkdir(exist_ok=True)
@@ -126,6 +157,8 @@ class CharacterManager:
             print(f"❌ New folder name already exists: {new_folder_name}")
             return False
         
+        self.invalidate(old_folder_name)
+        self.invalidate(new_folder_name)
         try:
             print(f"🔄 Starting safe character rename: {old_folder_name} → {new_folder_name}")
             
@@ -190,6 +223,7 @@ class CharacterManager:
 
     def _update_display_name_only(self, char_dir: Path, new_display_name: str) -> bool:
         """Update only the display name without moving files"""
+        self.invalidate(char_dir.name)
         try:
             config_file = char_dir / "config.json"
             with open(config_file, 'r', encoding='utf-8') as f:
@@ -234,7 +268,33 @@ class CharacterManager:
     # and before creating the CharacterConfig object:
 
     def load_character(self, name: str) -> Optional[CharacterConfig]:
-        """Load character configuration with robust backward compatibility"""
+        """Load character configuration, reusing the parsed config while config.json is unchanged"""
+        config_file = self.characters_dir / name / "config.json"
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except OSError:
+            self._cache.pop(name, None)
+            return None
+        
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == mtime_ns:
+            # Hand out a copy so callers can't mutate the cached config
+            return copy.deepcopy(cached[1])
+        
+        config = self._read_character_config(name)
+        if config is None:
+            self._cache.pop(name, None)
+            return None
+        
+        # Re-stat: reading may have rewritten config.json with missing defaults
+        try:
+            self._cache[name] = (config_file.stat().st_mtime_ns, copy.deepcopy(config))
+        except OSError:
+            pass
+        return config
+
+    def _read_character_config(self, name: str) -> Optional[CharacterConfig]:
+        """Read character configuration from disk with robust backward compatibility"""
         char_dir = self.characters_dir / name
         config_file = char_dir / "config.json"
         
@@ -324,6 +384,7 @@ class CharacterManager:
 
     def delete_character(self, name: str) -> bool:
         """Delete a character"""
+        self.invalidate(name)
         char_dir = self.characters_dir / name
         if char_dir.exists():
             try:
@@ -336,6 +397,7 @@ class CharacterManager:
 
     def update_character_image(self, name: str, new_image_path: str) -> bool:
         """Update character's base image SAFELY without affecting global state"""
+        self.invalidate(name)
         char_dir = self.characters_dir / name
         if not char_dir.exists():
             print(f"❌ Character directory not found: {char_dir}")
@@ -626,6 +688,7 @@ class UserProfileManager:
                     # Validate active profile
                     active_profile_name = data.get('active_profile_name')
                     show_about_on_startup = data.get('show_about_on_startup', True)
+                    show_success_dialogs = data.get('show_success_dialogs', True)
                     if active_profile_name and not any(p.name == active_profile_name for p in profiles):
                         print(f"⚠️ Active profile '{active_profile_name}' not found, clearing")
                         active_profile_name = None
@@ -639,6 +702,7 @@ class UserProfileManager:
                         profiles=profiles,
                         active_profile_name=active_profile_name,
                         show_about_on_startup=show_about_on_startup,
+                        show_success_dialogs=show_success_dialogs,
                     )
                     
             except Exception as e:
@@ -665,6 +729,7 @@ class UserProfileManager:
                 'profiles': [asdict(p) for p in self.settings.profiles],
                 'active_profile_name': self.settings.active_profile_name,
                 "show_about_on_startup": getattr(self.settings, "show_about_on_startup", True),
+                "show_success_dialogs": getattr(self.settings, "show_success_dialogs", True),
             }
             with open(self.settings_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)